@@ -0,0 +1,113 @@
+"""Run the benchmark suite and compare its results.
+
+Run the suite with `uv run -- python -m benchmarks run --output results.json` and compare two
+result files with `uv run -- python -m benchmarks compare baseline.json candidate.json`.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from benchmarks import (
+    provider_build,
+    resolution,
+    scopes,
+    service_collection_creation,
+    settings_binding,
+)
+from benchmarks._benchmark_runner import (
+    BenchmarkRunner,
+    compare_results,
+    load_results,
+    save_results,
+)
+from wirio._utils._extra_dependencies import ExtraDependencies
+
+
+async def _run(runner: BenchmarkRunner) -> None:
+    await resolution.run_benchmarks(runner)
+    await scopes.run_benchmarks(runner)
+    await provider_build.run_benchmarks(runner)
+    await service_collection_creation.run_benchmarks(runner)
+    await settings_binding.run_benchmarks(runner)
+
+    if ExtraDependencies.is_fastapi_installed():
+        from benchmarks import fastapi_requests  # noqa: PLC0415
+
+        await fastapi_requests.run_benchmarks(runner)
+
+
+def _compare(baseline_path: Path, candidate_path: Path, threshold: float) -> int:
+    comparisons = compare_results(
+        load_results(baseline_path), load_results(candidate_path)
+    )
+    regressions_count = 0
+
+    for comparison in comparisons:
+        change_percentage = comparison.change_percentage
+
+        if change_percentage is None:
+            status = "missing in baseline" if comparison.baseline is None else "removed"
+            print(f"{comparison.name:<60} {status:>30}")  # noqa: T201
+            continue
+
+        if change_percentage > threshold:
+            status = "regression"
+            regressions_count += 1
+        elif change_percentage < -threshold:
+            status = "improvement"
+        else:
+            status = ""
+
+        print(f"{comparison.name:<60} {change_percentage:>+15.1f} % {status:>12}")  # noqa: T201
+
+    return 1 if regressions_count > 0 else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmark suite")
+    run_parser.add_argument(
+        "--output", type=Path, help="write the results to this JSON file"
+    )
+    run_parser.add_argument(
+        "--filter", help="only run the benchmarks whose name contains this text"
+    )
+    run_parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="multiply the iterations of each benchmark by this factor",
+    )
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="compare the median times of two result files"
+    )
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("candidate", type=Path)
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="percentage above which a slower benchmark is reported as a regression",
+    )
+
+    arguments = parser.parse_args()
+
+    if arguments.command == "compare":
+        return _compare(arguments.baseline, arguments.candidate, arguments.threshold)
+
+    runner = BenchmarkRunner(scale=arguments.scale, name_filter=arguments.filter)
+    asyncio.run(_run(runner))
+
+    if arguments.output is not None:
+        save_results(runner.results, arguments.output)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
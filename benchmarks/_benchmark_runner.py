@@ -0,0 +1,142 @@
+import gc
+import json
+import platform
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Final, final
+
+
+@final
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Time per operation, in microseconds, over several rounds of a benchmark."""
+
+    name: str
+    iterations: int
+    rounds: int
+    mean_microseconds: float
+    median_microseconds: float
+    min_microseconds: float
+    max_microseconds: float
+
+
+@final
+@dataclass(frozen=True)
+class BenchmarkComparison:
+    name: str
+    baseline: BenchmarkResult | None
+    candidate: BenchmarkResult | None
+
+    @property
+    def change_percentage(self) -> float | None:
+        """Get the change of the median time of the candidate relative to the baseline."""
+        if self.baseline is None or self.candidate is None:
+            return None
+
+        return (
+            (self.candidate.median_microseconds - self.baseline.median_microseconds)
+            / self.baseline.median_microseconds
+            * 100
+        )
+
+
+@final
+class BenchmarkRunner:
+    """Run benchmarks and collect their results."""
+
+    _scale: Final[float]
+    _name_filter: Final[str | None]
+    _results: Final[list[BenchmarkResult]]
+
+    def __init__(self, scale: float = 1.0, name_filter: str | None = None) -> None:
+        self._scale = scale
+        self._name_filter = name_filter
+        self._results = []
+
+    @property
+    def results(self) -> list[BenchmarkResult]:
+        return self._results
+
+    def should_run(self, name: str) -> bool:
+        """Indicate whether the benchmark is selected, so that its setup can be skipped otherwise."""
+        return self._name_filter is None or self._name_filter in name
+
+    async def measure(
+        self,
+        name: str,
+        operation: Callable[[], Awaitable[object]],
+        iterations: int,
+        rounds: int = 5,
+    ) -> None:
+        if not self.should_run(name):
+            return
+
+        scaled_iterations = max(1, int(iterations * self._scale))
+
+        # Warm up the caches, so that only the steady state is measured
+        await operation()
+
+        microseconds_per_operation: list[float] = []
+
+        for _ in range(rounds):
+            gc.collect()
+            started_at = time.perf_counter()
+
+            for _ in range(scaled_iterations):
+                await operation()
+
+            elapsed_seconds = time.perf_counter() - started_at
+            microseconds_per_operation.append(
+                elapsed_seconds / scaled_iterations * 1_000_000
+            )
+
+        result = BenchmarkResult(
+            name=name,
+            iterations=scaled_iterations,
+            rounds=rounds,
+            mean_microseconds=statistics.mean(microseconds_per_operation),
+            median_microseconds=statistics.median(microseconds_per_operation),
+            min_microseconds=min(microseconds_per_operation),
+            max_microseconds=max(microseconds_per_operation),
+        )
+        self._results.append(result)
+        print(f"{name:<60} {result.median_microseconds:>12.2f} µs")  # noqa: T201
+
+
+def save_results(results: list[BenchmarkResult], path: Path) -> None:
+    content = {
+        "created_at": datetime.now(UTC).isoformat(),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [asdict(result) for result in results],
+    }
+    path.write_text(json.dumps(content, indent=2) + "\n", encoding="utf-8")
+
+
+def load_results(path: Path) -> list[BenchmarkResult]:
+    content = json.loads(path.read_text(encoding="utf-8"))
+    return [BenchmarkResult(**result) for result in content["results"]]
+
+
+def compare_results(
+    baseline_results: list[BenchmarkResult], candidate_results: list[BenchmarkResult]
+) -> list[BenchmarkComparison]:
+    baseline_results_by_name = {result.name: result for result in baseline_results}
+    candidate_results_by_name = {result.name: result for result in candidate_results}
+    names = list(baseline_results_by_name) + [
+        name
+        for name in candidate_results_by_name
+        if name not in baseline_results_by_name
+    ]
+    return [
+        BenchmarkComparison(
+            name=name,
+            baseline=baseline_results_by_name.get(name),
+            candidate=candidate_results_by_name.get(name),
+        )
+        for name in names
+    ]
@@ -0,0 +1,46 @@
+from collections.abc import Sequence
+from inspect import Parameter, Signature
+
+
+def create_service_type(name: str, dependencies: Sequence[type] = ()) -> type:
+    """Create a class whose constructor depends on the given service types."""
+    parameters = [
+        Parameter(
+            f"dependency_{index}",
+            Parameter.POSITIONAL_OR_KEYWORD,
+            annotation=dependency,
+        )
+        for index, dependency in enumerate(dependencies)
+    ]
+
+    def init(self: object, *dependency_values: object) -> None:
+        del self, dependency_values
+
+    init.__dict__["__signature__"] = Signature(
+        [Parameter("self", Parameter.POSITIONAL_OR_KEYWORD), *parameters]
+    )
+    init.__annotations__ = {
+        parameter.name: parameter.annotation for parameter in parameters
+    }
+    return type(name, (), {"__init__": init})
+
+
+def create_service_chain(name: str, depth: int) -> list[type]:
+    """Create service types where each one depends on the previous one."""
+    service_types: list[type] = []
+
+    for index in range(depth):
+        service_types.append(create_service_type(f"{name}{index}", service_types[-1:]))
+
+    return service_types
+
+
+def create_service_tree(name: str, size: int) -> list[type]:
+    """Create service types where each one depends on its parent in a binary tree."""
+    service_types: list[type] = []
+
+    for index in range(size):
+        dependencies = [service_types[(index - 1) // 2]] if index > 0 else []
+        service_types.append(create_service_type(f"{name}{index}", dependencies))
+
+    return service_types
@@ -0,0 +1,87 @@
+"""Measure the per-request overhead of the FastAPI integration with an in-process ASGI client.
+
+Run it as part of the suite with `uv run -- python -m benchmarks run --filter fastapi/`.
+"""
+
+from typing import Annotated
+
+import httpx
+from fastapi import FastAPI
+
+from benchmarks._benchmark_runner import BenchmarkRunner
+from wirio.annotations import FromServices
+from wirio.service_collection import ServiceCollection
+
+ITERATIONS = 500
+
+
+class Clock:
+    pass
+
+
+class Repository:
+    def __init__(self, clock: Clock) -> None:
+        self.clock = clock
+
+
+class Handler:
+    def __init__(self, repository: Repository) -> None:
+        self.repository = repository
+
+
+def _create_app(is_wirio_configured: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/without-services")
+    async def without_services() -> None:  # pyright: ignore[reportUnusedFunction]
+        pass
+
+    if not is_wirio_configured:
+        return app
+
+    @app.get("/with-services")
+    async def with_services(  # pyright: ignore[reportUnusedFunction]
+        handler: Annotated[Handler, FromServices()],
+        repository: Annotated[Repository, FromServices()],
+    ) -> None:
+        del handler, repository
+
+    services = ServiceCollection()
+    services.add_singleton(Clock)
+    services.add_scoped(Repository)
+    services.add_transient(Handler)
+    services.configure_fastapi(app)
+    return app
+
+
+async def _measure_app(
+    runner: BenchmarkRunner, app: FastAPI, name_prefix: str, paths: list[str]
+) -> None:
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://benchmarks"
+        ) as client,
+    ):
+        for path in paths:
+            await runner.measure(
+                f"{name_prefix}{path}",
+                lambda path=path: client.get(path),
+                ITERATIONS,
+            )
+
+
+async def run_benchmarks(runner: BenchmarkRunner) -> None:
+    # Requests to an application without wirio are the baseline of the overhead
+    await _measure_app(
+        runner,
+        _create_app(is_wirio_configured=False),
+        "fastapi/baseline",
+        ["/without-services"],
+    )
+    await _measure_app(
+        runner,
+        _create_app(is_wirio_configured=True),
+        "fastapi/wirio",
+        ["/without-services", "/with-services"],
+    )
@@ -0,0 +1,68 @@
+"""Measure how long a service provider takes to build and validate its services.
+
+Run it as part of the suite with `uv run -- python -m benchmarks run --filter build/`.
+"""
+
+from benchmarks._benchmark_runner import BenchmarkRunner
+from benchmarks._service_types import create_service_tree
+from wirio.service_collection import ServiceCollection
+
+DESCRIPTORS_COUNTS = (100, 1_000, 5_000)
+SINGLETON_DEPTH = 4
+SCOPED_DEPTH = 8
+
+
+async def _build_service_provider(
+    services: ServiceCollection, validate_scopes: bool
+) -> None:
+    async with services.build_service_provider(validate_scopes=validate_scopes):
+        pass
+
+
+def _create_services(descriptors_count: int, reverse: bool) -> ServiceCollection:
+    services = ServiceCollection()
+    service_types = list(enumerate(create_service_tree("Service", descriptors_count)))
+
+    # Registering the dependents before their dependencies is the worst case for building call sites
+    if reverse:
+        service_types.reverse()
+
+    # Mix lifetimes so that validating scopes has work to do, without making singletons
+    # depend on scoped services
+    for index, service_type in service_types:
+        depth = (index + 1).bit_length() - 1
+
+        if depth < SINGLETON_DEPTH:
+            services.add_singleton(service_type)
+        elif depth < SCOPED_DEPTH:
+            services.add_scoped(service_type)
+        else:
+            services.add_transient(service_type)
+
+    return services
+
+
+async def run_benchmarks(runner: BenchmarkRunner) -> None:
+    for descriptors_count in DESCRIPTORS_COUNTS:
+        services = _create_services(descriptors_count, reverse=False)
+
+        for validate_scopes in (False, True):
+            validation_name = "validate-scopes" if validate_scopes else "default"
+            await runner.measure(
+                f"build/descriptors-{descriptors_count}/{validation_name}",
+                lambda services=services, validate_scopes=validate_scopes: (
+                    _build_service_provider(services, validate_scopes)
+                ),
+                iterations=1,
+                rounds=3,
+            )
+
+        reversed_services = _create_services(descriptors_count, reverse=True)
+        await runner.measure(
+            f"build/descriptors-{descriptors_count}/reversed-registration",
+            lambda services=reversed_services: _build_service_provider(
+                services, validate_scopes=True
+            ),
+            iterations=1,
+            rounds=3,
+        )
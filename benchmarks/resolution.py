@@ -0,0 +1,225 @@
+"""Measure the resolution of services from a scope.
+
+Run it as part of the suite with `uv run -- python -m benchmarks run --filter resolution/`.
+"""
+
+from collections.abc import AsyncGenerator, Generator, Sequence
+
+from benchmarks._benchmark_runner import BenchmarkRunner
+from benchmarks._service_types import create_service_chain, create_service_type
+from wirio.abstractions.keyed_service import KeyedService
+from wirio.factory import Factory
+from wirio.service_collection import ServiceCollection
+from wirio.service_lifetime import ServiceLifetime
+
+DEPTHS = (1, 5, 20)
+WIDTHS = (5, 20, 50)
+SEQUENCE_LENGTH = 10
+BATCH_SIZE = 8
+ITERATIONS = 2_000
+
+
+class Leaf:
+    pass
+
+
+class FactoryService:
+    def __init__(self, leaf: Leaf) -> None:
+        self.leaf = leaf
+
+
+def _add_service(
+    services: ServiceCollection, service_type: type, lifetime: ServiceLifetime
+) -> None:
+    match lifetime:
+        case ServiceLifetime.SINGLETON:
+            services.add_singleton(service_type)
+        case ServiceLifetime.SCOPED:
+            services.add_scoped(service_type)
+        case ServiceLifetime.TRANSIENT:
+            services.add_transient(service_type)
+
+
+async def _measure_service(
+    runner: BenchmarkRunner,
+    name: str,
+    services: ServiceCollection,
+    service_type: type[object],
+) -> None:
+    async with (
+        services.build_service_provider() as service_provider,
+        service_provider.create_scope() as service_scope,
+    ):
+        await runner.measure(
+            name,
+            lambda: service_scope.get_required_service(service_type),
+            ITERATIONS,
+        )
+
+
+async def _measure_graphs(runner: BenchmarkRunner) -> None:
+    for lifetime in ServiceLifetime:
+        lifetime_name = lifetime.name.lower()
+
+        for depth in DEPTHS:
+            name = f"resolution/{lifetime_name}/depth-{depth}"
+
+            if not runner.should_run(name):
+                continue
+
+            services = ServiceCollection()
+            service_types = create_service_chain("Chain", depth)
+
+            for service_type in service_types:
+                _add_service(services, service_type, lifetime)
+
+            await _measure_service(runner, name, services, service_types[-1])
+
+        for width in WIDTHS:
+            name = f"resolution/{lifetime_name}/width-{width}"
+
+            if not runner.should_run(name):
+                continue
+
+            services = ServiceCollection()
+            dependencies = [
+                create_service_type(f"Leaf{index}") for index in range(width)
+            ]
+            root_type = create_service_type("Root", dependencies)
+
+            for service_type in [*dependencies, root_type]:
+                _add_service(services, service_type, lifetime)
+
+            await _measure_service(runner, name, services, root_type)
+
+
+async def _measure_factories(runner: BenchmarkRunner) -> None:
+    def create_with_sync_factory(leaf: Leaf) -> FactoryService:
+        return FactoryService(leaf)
+
+    async def create_with_async_factory(leaf: Leaf) -> FactoryService:
+        return FactoryService(leaf)
+
+    def create_with_sync_generator_factory(leaf: Leaf) -> Generator[FactoryService]:
+        yield FactoryService(leaf)
+
+    async def create_with_async_generator_factory(
+        leaf: Leaf,
+    ) -> AsyncGenerator[FactoryService]:
+        yield FactoryService(leaf)
+
+    factories = {
+        "sync-factory": create_with_sync_factory,
+        "async-factory": create_with_async_factory,
+        "sync-generator-factory": create_with_sync_generator_factory,
+        "async-generator-factory": create_with_async_generator_factory,
+    }
+
+    for factory_name, factory in factories.items():
+        name = f"resolution/transient/{factory_name}"
+
+        if not runner.should_run(name):
+            continue
+
+        services = ServiceCollection()
+        services.add_singleton(Leaf)
+        services.add_transient(FactoryService, factory)
+        await _measure_service(runner, name, services, FactoryService)
+
+
+async def _measure_sequences(runner: BenchmarkRunner) -> None:
+    services = ServiceCollection()
+
+    for _ in range(SEQUENCE_LENGTH):
+        services.add_transient(Leaf)
+
+    await _measure_service(
+        runner,
+        f"resolution/sequence/length-{SEQUENCE_LENGTH}",
+        services,
+        Sequence[Leaf],
+    )
+
+
+async def _measure_keyed_services(runner: BenchmarkRunner) -> None:
+    services = ServiceCollection()
+    services.add_keyed_transient("key", Leaf)
+    services.add_keyed_transient(KeyedService.ANY_KEY, FactoryService)
+    services.add_singleton(Leaf)
+
+    async with (
+        services.build_service_provider() as service_provider,
+        service_provider.create_scope() as service_scope,
+    ):
+        await runner.measure(
+            "resolution/keyed/key",
+            lambda: service_scope.get_required_keyed_service("key", Leaf),
+            ITERATIONS,
+        )
+        await runner.measure(
+            "resolution/keyed/any-key",
+            lambda: service_scope.get_required_keyed_service(
+                "any-other-key", FactoryService
+            ),
+            ITERATIONS,
+        )
+        await runner.measure(
+            "resolution/keyed/sequence",
+            lambda: service_scope.get_keyed_services("key", Leaf),
+            ITERATIONS,
+        )
+
+
+async def _measure_factory_delegates(runner: BenchmarkRunner) -> None:
+    services = ServiceCollection()
+    services.add_singleton(Leaf)
+    services.add_transient(FactoryService)
+
+    async with (
+        services.build_service_provider() as service_provider,
+        service_provider.create_scope() as service_scope,
+    ):
+        factory = await service_scope.get_required_service(Factory[FactoryService])
+        # Both create the same transient, so the difference is the cost of looking it up on each resolution
+        await runner.measure(
+            "resolution/factory-delegate/get-required-service",
+            lambda: service_scope.get_required_service(FactoryService),
+            ITERATIONS,
+        )
+        await runner.measure("resolution/factory-delegate/call", factory, ITERATIONS)
+
+
+async def _measure_batches(runner: BenchmarkRunner) -> None:
+    services = ServiceCollection()
+    service_types = [create_service_type(f"Leaf{index}") for index in range(BATCH_SIZE)]
+
+    for service_type in service_types:
+        services.add_scoped(service_type)
+
+    async def get_services_one_by_one() -> None:
+        for service_type in service_types:
+            await service_scope.get_service(service_type)
+
+    async with (
+        services.build_service_provider() as service_provider,
+        service_provider.create_scope() as service_scope,
+    ):
+        await runner.measure(
+            f"resolution/batch/one-by-one-{BATCH_SIZE}",
+            get_services_one_by_one,
+            ITERATIONS,
+        )
+        await runner.measure(
+            f"resolution/batch/batch-{BATCH_SIZE}",
+            lambda: service_scope.get_services_batch(service_types),
+            ITERATIONS,
+        )
+
+
+async def run_benchmarks(runner: BenchmarkRunner) -> None:
+    await _measure_graphs(runner)
+    await _measure_factories(runner)
+    await _measure_sequences(runner)
+    await _measure_keyed_services(runner)
+    await _measure_factory_delegates(runner)
+    await _measure_batches(runner)
@@ -0,0 +1,90 @@
+"""Measure the time and the identity objects allocated to resolve already created services.
+
+Run it with `uv run -- python -m benchmarks.resolution_allocations`.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from unittest.mock import patch
+
+from wirio._service_lookup._service_identifier import ServiceIdentifier
+from wirio._service_lookup._typed_type import TypedType
+from wirio._service_lookup.service_cache_key import ServiceCacheKey
+from wirio.service_collection import ServiceCollection
+
+ITERATIONS = 20_000
+
+
+class Clock:
+    pass
+
+
+class Repository:
+    pass
+
+
+async def _measure(
+    name: str, get_service: Callable[[], Awaitable[object | None]]
+) -> None:
+    # Warm up the caches so that only the resolution path is measured
+    await get_service()
+
+    started_at = time.perf_counter()
+
+    for _ in range(ITERATIONS):
+        await get_service()
+
+    elapsed_seconds = time.perf_counter() - started_at
+
+    with (
+        patch.object(
+            TypedType, "__init__", autospec=True, side_effect=TypedType.__init__
+        ) as typed_type_init,
+        patch.object(
+            ServiceIdentifier,
+            "__init__",
+            autospec=True,
+            side_effect=ServiceIdentifier.__init__,
+        ) as service_identifier_init,
+        patch.object(
+            ServiceCacheKey,
+            "__init__",
+            autospec=True,
+            side_effect=ServiceCacheKey.__init__,
+        ) as service_cache_key_init,
+    ):
+        for _ in range(ITERATIONS):
+            await get_service()
+
+    allocations = (
+        typed_type_init.call_count
+        + service_identifier_init.call_count
+        + service_cache_key_init.call_count
+    )
+    microseconds_per_call = elapsed_seconds / ITERATIONS * 1_000_000
+    allocations_per_call = allocations / ITERATIONS
+    print(  # noqa: T201
+        f"{name:<20} {microseconds_per_call:>8.2f} µs/call {allocations_per_call:>6.2f} allocations/call"
+    )
+
+
+async def main() -> None:
+    services = ServiceCollection()
+    services.add_singleton(Clock)
+    services.add_scoped(Repository)
+
+    async with (
+        services.build_service_provider() as service_provider,
+        service_provider.create_scope() as service_scope,
+    ):
+        await _measure(
+            "singleton from root", lambda: service_provider.get_service(Clock)
+        )
+        await _measure(
+            "scoped from scope", lambda: service_scope.get_service(Repository)
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
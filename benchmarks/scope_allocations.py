@@ -0,0 +1,63 @@
+"""Measure the time and the peak memory allocated to create and dispose scopes, with and without scope pooling.
+
+Run it with `uv run -- python -m benchmarks.scope_allocations`.
+"""
+
+import asyncio
+import time
+import tracemalloc
+
+from wirio.service_collection import ServiceCollection
+from wirio.service_provider import ServiceProvider
+
+ITERATIONS = 20_000
+SCOPE_POOL_SIZE = 64
+
+
+class Repository:
+    pass
+
+
+async def _create_and_dispose_scope(service_provider: ServiceProvider) -> None:
+    async with service_provider.create_scope() as service_scope:
+        await service_scope.get_required_service(Repository)
+
+
+async def _measure(name: str, scope_pool_size: int) -> None:
+    services = ServiceCollection()
+    services.add_scoped(Repository)
+
+    async with services.build_service_provider(
+        scope_pool_size=scope_pool_size
+    ) as service_provider:
+        # Warm up the caches and the pool so that only the scopes are measured
+        await _create_and_dispose_scope(service_provider)
+
+        started_at = time.perf_counter()
+
+        for _ in range(ITERATIONS):
+            await _create_and_dispose_scope(service_provider)
+
+        elapsed_seconds = time.perf_counter() - started_at
+
+        tracemalloc.start()
+
+        for _ in range(ITERATIONS):
+            await _create_and_dispose_scope(service_provider)
+
+        _, peak_size = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    microseconds_per_scope = elapsed_seconds / ITERATIONS * 1_000_000
+    print(  # noqa: T201
+        f"{name:<10} {microseconds_per_scope:>8.2f} µs/scope {peak_size / 1024:>8.1f} KiB peak"
+    )
+
+
+async def main() -> None:
+    await _measure("default", scope_pool_size=0)
+    await _measure("pooled", scope_pool_size=SCOPE_POOL_SIZE)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
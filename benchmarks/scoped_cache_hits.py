@@ -0,0 +1,94 @@
+"""Measure repeated resolutions of the same scoped services within a scope.
+
+Requests usually resolve their `AsyncSession` or unit of work many times, so every
+resolution after the first one is a cache hit. The lock acquisition that a hit no longer
+pays is measured too, as a reference of the time saved per hit.
+
+Run it with `uv run -- python -m benchmarks.scoped_cache_hits`.
+"""
+
+import asyncio
+import time
+from contextlib import AbstractAsyncContextManager
+from types import TracebackType
+from typing import Self, override
+
+from wirio._service_lookup._asyncio_reentrant_lock import AsyncioReentrantLock
+from wirio.service_collection import ServiceCollection
+from wirio.service_provider_mode import ServiceProviderMode
+
+SCOPES = 2_000
+RESOLUTIONS_PER_SCOPE = 50
+
+
+class AsyncSession(AbstractAsyncContextManager["AsyncSession"]):
+    @override
+    async def __aenter__(self) -> Self:
+        return self
+
+    @override
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool | None:
+        return None
+
+
+class UnitOfWork:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+
+async def _measure_cache_hits(mode: ServiceProviderMode) -> float:
+    services = ServiceCollection()
+    services.add_scoped(AsyncSession)
+    services.add_scoped(UnitOfWork)
+    elapsed_seconds = 0.0
+
+    async with services.build_service_provider(mode=mode) as service_provider:
+        for _ in range(SCOPES):
+            async with service_provider.create_scope() as service_scope:
+                # The first resolutions create the services, they aren't cache hits
+                await service_scope.get_required_service(UnitOfWork)
+                started_at = time.perf_counter()
+
+                for _ in range(RESOLUTIONS_PER_SCOPE):
+                    await service_scope.get_required_service(AsyncSession)
+                    await service_scope.get_required_service(UnitOfWork)
+
+                elapsed_seconds += time.perf_counter() - started_at
+
+            await asyncio.sleep(0)
+
+    return elapsed_seconds
+
+
+async def _measure_lock_acquisitions() -> float:
+    lock = AsyncioReentrantLock()
+    started_at = time.perf_counter()
+
+    for _ in range(SCOPES * RESOLUTIONS_PER_SCOPE * 2):
+        await lock.acquire()
+        lock.release()
+
+    return time.perf_counter() - started_at
+
+
+def _print_result(name: str, elapsed_seconds: float) -> None:
+    microseconds_per_hit = (
+        elapsed_seconds / (SCOPES * RESOLUTIONS_PER_SCOPE * 2) * 1_000_000
+    )
+    print(f"{name:<16} {microseconds_per_hit:>10.3f} µs/hit")  # noqa: T201
+
+
+async def main() -> None:
+    for mode in ServiceProviderMode:
+        _print_result(mode.name, await _measure_cache_hits(mode))
+
+    _print_result("saved lock", await _measure_lock_acquisitions())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+"""Measure the creation of scopes and the disposal of the services they created.
+
+Run it as part of the suite with `uv run -- python -m benchmarks run --filter scope/`.
+"""
+
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from types import TracebackType
+from typing import Self, override
+
+from benchmarks._benchmark_runner import BenchmarkRunner
+from wirio.service_collection import ServiceCollection
+from wirio.service_provider import ServiceProvider
+
+DISPOSABLES_COUNTS = (0, 10, 100)
+ITERATIONS = 500
+SCOPE_POOL_SIZE = 64
+
+
+class SyncDisposable(AbstractContextManager["SyncDisposable"]):
+    @override
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool | None:
+        return None
+
+
+class AsyncDisposable(AbstractAsyncContextManager["AsyncDisposable"]):
+    @override
+    async def __aenter__(self) -> Self:
+        return self
+
+    @override
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool | None:
+        return None
+
+
+async def _create_and_dispose_scope(
+    service_provider: ServiceProvider,
+    disposable_type: type[SyncDisposable | AsyncDisposable],
+    disposables_count: int,
+) -> None:
+    async with service_provider.create_scope() as service_scope:
+        for _ in range(disposables_count):
+            await service_scope.get_required_service(disposable_type)
+
+
+async def run_benchmarks(runner: BenchmarkRunner) -> None:
+    services = ServiceCollection()
+    services.add_transient(SyncDisposable)
+    services.add_transient(AsyncDisposable)
+
+    # Compare reusing the state of disposed scopes against allocating it for every scope
+    for scope_pool_size in (0, SCOPE_POOL_SIZE):
+        benchmark_name = "create-dispose" if scope_pool_size == 0 else "pooled"
+
+        async with services.build_service_provider(
+            scope_pool_size=scope_pool_size
+        ) as service_provider:
+            for disposable_type in (SyncDisposable, AsyncDisposable):
+                disposable_name = (
+                    "sync" if disposable_type is SyncDisposable else "async"
+                )
+
+                for disposables_count in DISPOSABLES_COUNTS:
+                    await runner.measure(
+                        f"scope/{benchmark_name}/{disposable_name}-disposables-{disposables_count}",
+                        lambda service_provider=service_provider, disposable_type=disposable_type, disposables_count=disposables_count: (
+                            _create_and_dispose_scope(
+                                service_provider, disposable_type, disposables_count
+                            )
+                        ),
+                        ITERATIONS,
+                    )
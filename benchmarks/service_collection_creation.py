@@ -0,0 +1,41 @@
+"""Measure how long creating a service collection takes, which test suites and multi-tenant applications do a lot.
+
+Run it as part of the suite with `uv run -- python -m benchmarks run --filter collection/`.
+"""
+
+from pathlib import Path
+
+from benchmarks._benchmark_runner import BenchmarkRunner
+from wirio._content_root_path_resolver import ContentRootPathResolver
+from wirio.service_collection import ServiceCollection
+
+ITERATIONS = 2_000
+
+
+async def _create_service_collection(content_root_path: str | None) -> None:
+    ServiceCollection(content_root_path)
+
+
+async def _create_service_collection_without_resolved_frames() -> None:
+    ContentRootPathResolver.clear_cache()
+    ServiceCollection()
+
+
+async def run_benchmarks(runner: BenchmarkRunner) -> None:
+    await runner.measure(
+        "collection/inferred-content-root",
+        lambda: _create_service_collection(None),
+        ITERATIONS,
+    )
+    # Resolving the files of the stack frames every time is what inferring the content root used to cost
+    await runner.measure(
+        "collection/inferred-content-root-uncached",
+        _create_service_collection_without_resolved_frames,
+        ITERATIONS,
+    )
+    content_root_path = str(Path.cwd())
+    await runner.measure(
+        "collection/explicit-content-root",
+        lambda: _create_service_collection(content_root_path),
+        ITERATIONS,
+    )
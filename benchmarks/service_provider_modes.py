@@ -0,0 +1,79 @@
+"""Compare the resolution time of the service provider modes.
+
+Run it with `uv run -- python -m benchmarks.service_provider_modes`.
+"""
+
+import asyncio
+import time
+
+from wirio.service_collection import ServiceCollection
+from wirio.service_provider_mode import ServiceProviderMode
+
+ITERATIONS = 20_000
+
+
+class Repository:
+    pass
+
+
+class Clock:
+    pass
+
+
+class UnitOfWork:
+    def __init__(self, repository: Repository, clock: Clock) -> None:
+        self.repository = repository
+        self.clock = clock
+
+
+class DomainService:
+    def __init__(self, unit_of_work: UnitOfWork, clock: Clock) -> None:
+        self.unit_of_work = unit_of_work
+        self.clock = clock
+
+
+class ApplicationService:
+    def __init__(self, domain_service: DomainService, repository: Repository) -> None:
+        self.domain_service = domain_service
+        self.repository = repository
+
+
+class Handler:
+    def __init__(
+        self, application_service: ApplicationService, unit_of_work: UnitOfWork
+    ) -> None:
+        self.application_service = application_service
+        self.unit_of_work = unit_of_work
+
+
+async def _measure(mode: ServiceProviderMode) -> float:
+    services = ServiceCollection()
+    services.add_singleton(Clock)
+    services.add_scoped(Repository)
+    services.add_scoped(UnitOfWork)
+    services.add_transient(DomainService)
+    services.add_transient(ApplicationService)
+    services.add_transient(Handler)
+
+    async with services.build_service_provider(mode=mode) as service_provider:
+        started_at = time.perf_counter()
+
+        for _ in range(ITERATIONS):
+            async with service_provider.create_scope() as service_scope:
+                await service_scope.get_required_service(Handler)
+
+            # Give control back to the event loop, as a server does between requests
+            await asyncio.sleep(0)
+
+        return time.perf_counter() - started_at
+
+
+async def main() -> None:
+    for mode in ServiceProviderMode:
+        elapsed_seconds = await _measure(mode)
+        microseconds_per_scope = elapsed_seconds / ITERATIONS * 1_000_000
+        print(f"{mode.name:<10} {microseconds_per_scope:>10.2f} µs/scope")  # noqa: T201
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,76 @@
+"""Measure loading settings and binding them to large models.
+
+Run it as part of the suite with `uv run -- python -m benchmarks run --filter settings/`.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, create_model
+
+from benchmarks._benchmark_runner import BenchmarkRunner
+from wirio.settings.settings_binder import SettingsBinder
+from wirio.settings.settings_manager import SettingsManager
+
+SECTIONS_COUNT = 20
+FIELDS_PER_SECTION_COUNT = 20
+ITERATIONS = 20
+
+
+def _create_settings_model() -> type[BaseModel]:
+    section_fields: dict[str, Any] = {
+        f"field_{field_index}": (int, ...)
+        for field_index in range(FIELDS_PER_SECTION_COUNT)
+    }
+    section_fields["hosts"] = (list[str], ...)
+    section_fields["labels"] = (dict[str, str], ...)
+    section_fields["description"] = (str | None, None)
+    section_model = create_model("SectionSettings", **section_fields)
+    root_fields: dict[str, Any] = {
+        f"section_{section_index}": (section_model, ...)
+        for section_index in range(SECTIONS_COUNT)
+    }
+    return create_model("ApplicationSettings", **root_fields)
+
+
+def _create_settings_content() -> dict[str, object]:
+    section: dict[str, object] = {
+        f"field_{field_index}": field_index
+        for field_index in range(FIELDS_PER_SECTION_COUNT)
+    }
+    section["hosts"] = ["first.example.com", "second.example.com"]
+    section["labels"] = {"team": "platform", "tier": "backend"}
+    return {
+        f"section_{section_index}": section for section_index in range(SECTIONS_COUNT)
+    }
+
+
+async def run_benchmarks(runner: BenchmarkRunner) -> None:
+    settings_model = _create_settings_model()
+
+    with tempfile.TemporaryDirectory() as content_root_path:
+        (Path(content_root_path) / "settings.json").write_text(
+            json.dumps(_create_settings_content()), encoding="utf-8"
+        )
+
+        def create_settings_manager() -> SettingsManager:
+            return SettingsManager(
+                content_root_path=content_root_path, add_default_providers=False
+            ).add_json_file("settings.json")
+
+        async def load_settings() -> None:
+            create_settings_manager()
+
+        settings_manager = create_settings_manager()
+
+        async def bind_settings() -> None:
+            SettingsBinder.bind_model(settings_manager, settings_model)
+
+        await runner.measure("settings/load-json", load_settings, ITERATIONS)
+        await runner.measure(
+            f"settings/bind/fields-{SECTIONS_COUNT * FIELDS_PER_SECTION_COUNT}",
+            bind_settings,
+            ITERATIONS,
+        )
@@ -1,22 +1,51 @@
-from .abstractions.base_service_provider import BaseServiceProvider
-from .abstractions.keyed_service import KeyedService
-from .abstractions.keyed_service_provider import KeyedServiceProvider
-from .abstractions.service_key_lookup_mode import ServiceKeyLookupMode
-from .abstractions.service_provider_is_keyed_service import (
-    ServiceProviderIsKeyedService,
-)
-from .abstractions.service_provider_is_service import ServiceProviderIsService
-from .abstractions.service_scope import ServiceScope
-from .abstractions.service_scope_factory import ServiceScopeFactory
-from .service_collection import ServiceCollection
-from .service_container import ServiceContainer
-from .service_descriptor import ServiceDescriptor
-from .service_provider import ServiceProvider
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .abstractions.base_service_provider import BaseServiceProvider
+    from .abstractions.keyed_service import KeyedService
+    from .abstractions.keyed_service_provider import KeyedServiceProvider
+    from .abstractions.service_key_lookup_mode import ServiceKeyLookupMode
+    from .abstractions.service_provider_is_keyed_service import (
+        ServiceProviderIsKeyedService,
+    )
+    from .abstractions.service_provider_is_service import ServiceProviderIsService
+    from .abstractions.service_scope import ServiceScope
+    from .abstractions.service_scope_factory import ServiceScopeFactory
+    from .factory import Factory
+    from .lazy import Lazy
+    from .service_collection import ServiceCollection
+    from .service_container import ServiceContainer
+    from .service_descriptor import ServiceDescriptor
+    from .service_provider import ServiceProvider
+    from .service_provider_mode import ServiceProviderMode
+
+# Modules are imported on first access (PEP 562), so that importing the package doesn't load the service lookup
+# and the settings before they're used
+_MODULES_BY_ATTRIBUTE = {
+    "BaseServiceProvider": ".abstractions.base_service_provider",
+    "Factory": ".factory",
+    "KeyedService": ".abstractions.keyed_service",
+    "KeyedServiceProvider": ".abstractions.keyed_service_provider",
+    "Lazy": ".lazy",
+    "ServiceCollection": ".service_collection",
+    "ServiceContainer": ".service_container",
+    "ServiceDescriptor": ".service_descriptor",
+    "ServiceKeyLookupMode": ".abstractions.service_key_lookup_mode",
+    "ServiceProvider": ".service_provider",
+    "ServiceProviderIsKeyedService": ".abstractions.service_provider_is_keyed_service",
+    "ServiceProviderIsService": ".abstractions.service_provider_is_service",
+    "ServiceProviderMode": ".service_provider_mode",
+    "ServiceScope": ".abstractions.service_scope",
+    "ServiceScopeFactory": ".abstractions.service_scope_factory",
+}
 
 __all__ = [
     "BaseServiceProvider",
+    "Factory",
     "KeyedService",
     "KeyedServiceProvider",
+    "Lazy",
     "ServiceCollection",
     "ServiceContainer",
     "ServiceDescriptor",
@@ -24,6 +53,24 @@ __all__ = [
     "ServiceProvider",
     "ServiceProviderIsKeyedService",
     "ServiceProviderIsService",
+    "ServiceProviderMode",
     "ServiceScope",
     "ServiceScopeFactory",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _MODULES_BY_ATTRIBUTE.get(name)
+
+    if module_name is None:
+        error_message = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(error_message)
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache it, so that the next accesses don't go through this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
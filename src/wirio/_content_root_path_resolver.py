@@ -1,10 +1,43 @@
 import inspect
+from dataclasses import dataclass
 from pathlib import Path
+from types import FrameType
 from typing import Final, final
 
 from wirio._utils._python_runtime_path import PythonRuntimePath
 
 
+@final
+@dataclass(frozen=True, slots=True)
+class _FrameFile:
+    resolved_path: Path
+    is_package_file: bool
+    is_python_runtime_file: bool
+
+
+# Entries kept by each cache. Code run with `exec` or in notebooks can get a new pseudo-file, like `<string>`, every
+# time, so the caches are emptied when they're full instead of growing for as long as the process runs.
+_MAX_CACHE_SIZE: Final = 1024
+
+# Classifying the file of a frame costs filesystem calls, and the same modules create collections over and over, so
+# each file is only classified once per process and package root. `None` means that the file doesn't exist, like
+# `<string>`.
+_frame_files: Final[dict[tuple[Path, str], _FrameFile | None]] = {}
+
+# Content roots resolved for the first module outside the package calling it, keyed by the package root, the file of
+# that module and the last package file it went through
+_content_root_paths: Final[dict[tuple[Path, str, str | None], str]] = {}
+
+
+def _add_to_cache[TKey, TValue](
+    cache: dict[TKey, TValue], key: TKey, value: TValue
+) -> None:
+    if len(cache) >= _MAX_CACHE_SIZE:
+        cache.clear()
+
+    cache[key] = value
+
+
 @final
 class ContentRootPathResolver:
     _package_root: Final[Path]
@@ -12,67 +45,141 @@ class ContentRootPathResolver:
     def __init__(self, package_root: Path) -> None:
         self._package_root = package_root
 
-    def resolve_path(self) -> str:  # noqa: C901, PLR0911
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget the files classified and the content roots resolved while walking the stack, for example after moving modules around."""
+        _frame_files.clear()
+        _content_root_paths.clear()
+
+    def resolve_path(self) -> str:
         current_frame = inspect.currentframe()
 
         if current_frame is None:
             return str(Path.cwd().expanduser().resolve())
 
         try:
-            current_working_directory = Path.cwd().expanduser().resolve()
-            resolved_package_frame_path: Path | None = None
-            found_only_runtime_external_frames = False
-            stack_frame = current_frame.f_back
+            content_root_path_key = self._get_content_root_path_key(
+                current_frame.f_back
+            )
 
-            while stack_frame is not None:
-                notebook_path = stack_frame.f_globals.get("__vsc_ipynb_file__")
+            if content_root_path_key is not None:
+                content_root_path = _content_root_paths.get(content_root_path_key)
 
-                if isinstance(notebook_path, str):
-                    resolved_notebook_path = Path(notebook_path).expanduser().resolve()
+                if content_root_path is not None:
+                    return content_root_path
 
-                    if resolved_notebook_path.exists():
-                        if (
-                            resolved_package_frame_path is not None
-                            and resolved_package_frame_path.parent != self._package_root
-                        ):
-                            return str(resolved_package_frame_path.parent)
+            content_root_path = self._resolve_path_from_stack(current_frame.f_back)
 
-                        return str(resolved_notebook_path.parent)
+            if content_root_path_key is not None:
+                _add_to_cache(
+                    _content_root_paths, content_root_path_key, content_root_path
+                )
 
-                current_frame_filename = stack_frame.f_code.co_filename
-                current_frame_path = Path(current_frame_filename)
+            return content_root_path
+        finally:
+            del current_frame
 
-                if not current_frame_path.exists():
-                    stack_frame = stack_frame.f_back
-                    continue
+    def _get_content_root_path_key(
+        self, stack_frame: FrameType | None
+    ) -> tuple[Path, str, str | None] | None:
+        package_frame_filename: str | None = None
 
-                resolved_current_frame_path = current_frame_path.resolve()
+        while stack_frame is not None:
+            frame_filename = stack_frame.f_code.co_filename
+            frame_file = self._get_frame_file(frame_filename)
 
-                if self._package_root not in resolved_current_frame_path.parents:
-                    if PythonRuntimePath.is_python_runtime_path(
-                        resolved_current_frame_path
-                    ):
-                        found_only_runtime_external_frames = True
-                        stack_frame = stack_frame.f_back
-                        continue
+            if frame_file is None or not frame_file.is_package_file:
+                break
+
+            package_frame_filename = frame_filename
+            stack_frame = stack_frame.f_back
+
+        if stack_frame is None:
+            return None
+
+        frame_filename = stack_frame.f_code.co_filename
+        frame_file = self._get_frame_file(frame_filename)
+
+        # Only callers whose own file decides the content root are memoized, the others depend on the frames
+        # further up the stack or on the current working directory
+        if (
+            frame_file is None
+            or frame_file.is_python_runtime_file
+            or not Path(frame_filename).is_absolute()
+            or "__vsc_ipynb_file__" in stack_frame.f_globals
+        ):
+            return None
 
+        return (self._package_root, frame_filename, package_frame_filename)
+
+    def _resolve_path_from_stack(self, stack_frame: FrameType | None) -> str:
+        resolved_package_frame_path: Path | None = None
+        found_only_runtime_external_frames = False
+
+        while stack_frame is not None:
+            notebook_path = stack_frame.f_globals.get("__vsc_ipynb_file__")
+
+            if isinstance(notebook_path, str):
+                resolved_notebook_path = Path(notebook_path).expanduser().resolve()
+
+                if resolved_notebook_path.exists():
                     if (
                         resolved_package_frame_path is not None
                         and resolved_package_frame_path.parent != self._package_root
                     ):
                         return str(resolved_package_frame_path.parent)
 
-                    return str(resolved_current_frame_path.parent)
+                    return str(resolved_notebook_path.parent)
+
+            frame_file = self._get_frame_file(stack_frame.f_code.co_filename)
 
-                resolved_package_frame_path = resolved_current_frame_path
+            if frame_file is None:
                 stack_frame = stack_frame.f_back
+                continue
 
-            if resolved_package_frame_path is None:
-                return str(current_working_directory)
+            if not frame_file.is_package_file:
+                if frame_file.is_python_runtime_file:
+                    found_only_runtime_external_frames = True
+                    stack_frame = stack_frame.f_back
+                    continue
 
-            if found_only_runtime_external_frames:
-                return str(current_working_directory)
+                if (
+                    resolved_package_frame_path is not None
+                    and resolved_package_frame_path.parent != self._package_root
+                ):
+                    return str(resolved_package_frame_path.parent)
 
-            return str(resolved_package_frame_path.parent)
-        finally:
-            del current_frame
+                return str(frame_file.resolved_path.parent)
+
+            resolved_package_frame_path = frame_file.resolved_path
+            stack_frame = stack_frame.f_back
+
+        if resolved_package_frame_path is None or found_only_runtime_external_frames:
+            return str(Path.cwd().expanduser().resolve())
+
+        return str(resolved_package_frame_path.parent)
+
+    def _get_frame_file(self, frame_filename: str) -> _FrameFile | None:
+        key = (self._package_root, frame_filename)
+
+        if key in _frame_files:
+            return _frame_files[key]
+
+        frame_path = Path(frame_filename)
+        frame_file: _FrameFile | None = None
+
+        if frame_path.exists():
+            resolved_frame_path = frame_path.resolve()
+            is_package_file = self._package_root in resolved_frame_path.parents
+            frame_file = _FrameFile(
+                resolved_path=resolved_frame_path,
+                is_package_file=is_package_file,
+                is_python_runtime_file=not is_package_file
+                and PythonRuntimePath.is_python_runtime_path(resolved_frame_path),
+            )
+
+        # Relative files depend on the current working directory, which can change, unlike pseudo-files like `<string>`
+        if frame_path.is_absolute() or frame_filename.startswith("<"):
+            _add_to_cache(_frame_files, key, frame_file)
+
+        return frame_file
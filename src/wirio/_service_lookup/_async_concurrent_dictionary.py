@@ -29,6 +29,19 @@ class AsyncConcurrentDictionary[TKey, TValue]:
     def get(self, key: TKey) -> TValue | None:
         return self._dict.get(key)
 
+    def try_update(
+        self, key: TKey, new_value: TValue, comparison_value: TValue
+    ) -> bool:
+        """Replace the value of the key only if it's still the comparison value.
+
+        It doesn't await, so no other coroutine can modify the value in between.
+        """
+        if self._dict.get(key) is not comparison_value:
+            return False
+
+        self._dict[key] = new_value
+        return True
+
     async def upsert(self, key: TKey, value: TValue) -> None:
         async with self._lock:
             self._dict[key] = value
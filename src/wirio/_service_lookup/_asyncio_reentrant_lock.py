@@ -23,24 +23,64 @@
 # https://github.com/Joshuaalbert/FairAsyncRLock
 
 import asyncio
-from asyncio import CancelledError, Event, Task
+import time
+from asyncio import CancelledError, Future, Task
 from collections import deque
-from contextlib import AbstractAsyncContextManager
+from contextlib import AbstractAsyncContextManager, suppress
+from dataclasses import dataclass
 from types import TracebackType
-from typing import Any, Self, override
+from typing import Any, ClassVar, Final, Self, override
+
+
+def _get_current_task() -> Task[Any] | None:
+    # Code running without an event loop, like sync resolutions from sync code, acquires locks outside a task
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return None
+
+
+@dataclass(slots=True)
+class AsyncioReentrantLockStatistics:
+    """Counters about how the locks sharing this instance have been acquired.
+
+    `total_wait_time` is the time, in seconds, that contended acquisitions waited for the lock.
+    """
+
+    acquisitions: int = 0
+    contended_acquisitions: int = 0
+    max_queue_depth: int = 0
+    total_wait_time: float = 0.0
 
 
 class AsyncioReentrantLock(AbstractAsyncContextManager["AsyncioReentrantLock"]):
+    _default_statistics: ClassVar[AsyncioReentrantLockStatistics | None] = None
+
     _owner: Task[Any] | None
     _count: int
     _owner_transfer: bool
-    _queue: deque[Event]
+    _queue: Final[deque[Future[None]]]
+    _statistics: Final[AsyncioReentrantLockStatistics | None]
 
-    def __init__(self) -> None:
+    def __init__(
+        self, statistics: AsyncioReentrantLockStatistics | None = None
+    ) -> None:
         self._owner = None
         self._count = 0
         self._owner_transfer = False
         self._queue = deque()
+        self._statistics = (
+            statistics
+            if statistics is not None
+            else AsyncioReentrantLock._default_statistics
+        )
+
+    @classmethod
+    def set_default_statistics(
+        cls, statistics: AsyncioReentrantLockStatistics | None
+    ) -> None:
+        """Set the statistics collected by the locks created from now on without explicit statistics."""
+        cls._default_statistics = statistics
 
     @property
     def owner(self) -> Task[Any] | None:
@@ -51,80 +91,113 @@ class AsyncioReentrantLock(AbstractAsyncContextManager["AsyncioReentrantLock"]):
         return self._count
 
     @property
-    def queue(self) -> deque[Event]:
+    def queue(self) -> deque[Future[None]]:
         return self._queue
 
+    @property
+    def statistics(self) -> AsyncioReentrantLockStatistics | None:
+        return self._statistics
+
     @property
     def is_locked(self) -> bool:
-        return self._owner is not None
+        return self._count > 0
+
+    @property
+    def is_idle(self) -> bool:
+        """Indicate whether no task holds the lock, is being handed it or is waiting for it."""
+        return self._count == 0 and not self._owner_transfer and len(self._queue) == 0
 
     def is_owner(self, task: Task[Any] | None = None) -> bool:
         if task is None:
-            task = asyncio.current_task()
+            task = _get_current_task()
 
-        return self._owner == task
+        return self._owner is task
 
     async def acquire(self) -> None:
-        current_task = asyncio.current_task()
+        current_task = _get_current_task()
 
         # If the lock is reentrant, acquire it immediately
-        if self.is_owner(task=current_task):
+        if self._owner is current_task and self._count > 0:
             self._count += 1
-            return
-
         # If the lock is free (and ownership not in midst of transfer), acquire it immediately
-        if self._count == 0 and not self._owner_transfer:
+        elif self._count == 0 and not self._owner_transfer:
             self._owner = current_task
             self._count = 1
+        else:
+            await self._wait_for_ownership(current_task)
             return
 
-        # Create an event for this task, to notify when it's ready for acquire
-        event = Event()
-        self._queue.append(event)
+        if self._statistics is not None:
+            self._statistics.acquisitions += 1
+
+    async def _wait_for_ownership(self, current_task: Task[Any] | None) -> None:
+        # A future owned by the loop is cheaper than an event for this task
+        future: Future[None] = asyncio.get_running_loop().create_future()
+        self._queue.append(future)
+        statistics = self._statistics
+        started_at = 0.0
+
+        if statistics is not None:
+            statistics.max_queue_depth = max(
+                statistics.max_queue_depth, len(self._queue)
+            )
+            started_at = time.perf_counter()
 
         # Wait for the lock to be free, then acquire
         try:
-            await event.wait()
-            self._owner_transfer = False
-            self._owner = current_task
-            self._count = 1
+            await future
         except CancelledError:
-            try:
-                # If in queue, then cancelled before release
-                self._queue.remove(event)
-            except ValueError:
+            if future.cancelled():
+                # Cancelled before release, so it's still in the queue
+                with suppress(ValueError):
+                    self._queue.remove(future)
+            else:
                 # Otherwise, release happened, this was next, and we simulate passing on
                 self._owner_transfer = False
                 self._owner = current_task
                 self._count = 1
                 self._current_task_release()
+
             raise
 
+        self._owner_transfer = False
+        self._owner = current_task
+        self._count = 1
+
+        if statistics is not None:
+            statistics.acquisitions += 1
+            statistics.contended_acquisitions += 1
+            statistics.total_wait_time += time.perf_counter() - started_at
+
     def _current_task_release(self) -> None:
         self._count -= 1
+
         if self._count == 0:
             self._owner = None
 
-            if self._queue:
-                # Wake up the next task in the queue
-                event = self._queue.popleft()
-                event.set()
+            # Wake up the next task in the queue that is still waiting
+            while self._queue:
+                future = self._queue.popleft()
 
-                # Setting this here prevents another task getting lock until owner transfer
-                self._owner_transfer = True
+                if not future.done():
+                    future.set_result(None)
+
+                    # Setting this here prevents another task getting lock until owner transfer
+                    self._owner_transfer = True
+                    return
 
     def release(self) -> None:
         """Release the lock."""
-        current_task = asyncio.current_task()
+        current_task = _get_current_task()
 
-        if self._owner is None:
-            error_message = (
-                f"Cannot release un-acquired lock. {current_task} tried to release."
-            )
-            raise RuntimeError(error_message)
+        if self._owner is not current_task:
+            if self._owner is None:
+                error_message = (
+                    f"Cannot release un-acquired lock. {current_task} tried to release."
+                )
+            else:
+                error_message = f"Cannot release foreign lock. {current_task} tried to unlock {self._owner}."
 
-        if not self.is_owner(task=current_task):
-            error_message = f"Cannot release foreign lock. {current_task} tried to unlock {self._owner}."
             raise RuntimeError(error_message)
 
         self._current_task_release()
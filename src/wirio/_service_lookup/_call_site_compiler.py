@@ -0,0 +1,472 @@
+from collections.abc import Awaitable, Callable
+from typing import Final, cast, final
+
+from wirio._service_lookup._async_factory_call_site import AsyncFactoryCallSite
+from wirio._service_lookup._async_generator_factory_call_site import (
+    AsyncGeneratorFactoryCallSite,
+)
+from wirio._service_lookup._call_site_kind import CallSiteKind
+from wirio._service_lookup._call_site_runtime_resolver import CallSiteRuntimeResolver
+from wirio._service_lookup._constant_call_site import ConstantCallSite
+from wirio._service_lookup._constructor_call_site import ConstructorCallSite
+from wirio._service_lookup._factory_delegate_call_site import FactoryDelegateCallSite
+from wirio._service_lookup._generator_factory_disposable import (
+    AsyncGeneratorFactoryDisposable,
+    GeneratorFactoryDisposable,
+)
+from wirio._service_lookup._lazy_call_site import LazyCallSite
+from wirio._service_lookup._parameter_information import ParameterInformation
+from wirio._service_lookup._sequence_call_site import SequenceCallSite
+from wirio._service_lookup._service_call_site import ServiceCallSite
+from wirio._service_lookup._supports_async_context_manager import (
+    SupportsAsyncContextManager,
+)
+from wirio._service_lookup._supports_sync_context_manager import (
+    SupportsSyncContextManager,
+)
+from wirio._service_lookup._sync_factory_call_site import SyncFactoryCallSite
+from wirio._service_lookup._sync_generator_factory_call_site import (
+    SyncGeneratorFactoryCallSite,
+)
+from wirio._service_lookup.call_site_result_cache_location import (
+    CallSiteResultCacheLocation,
+)
+from wirio.service_provider_engine_scope import ServiceProviderEngineScope
+from wirio.wirio_undefined import WirioUndefined
+
+type CompiledCallSite = Callable[[ServiceProviderEngineScope], Awaitable[object | None]]
+
+
+async def _enter_context(service: object | None) -> object | None:
+    if isinstance(service, SupportsAsyncContextManager):
+        await service.__aenter__()
+    elif isinstance(service, SupportsSyncContextManager):
+        service.__enter__()
+
+    return service
+
+
+@final
+class CallSiteCompiler:
+    """Turn a call site tree into nested closures specialized for that tree.
+
+    The decisions that :class:`CallSiteRuntimeResolver` takes on every resolution (cache location,
+    call site kind, whether the scope lock is already taken, which parameters fall back to default values)
+    are taken once here, so resolving the compiled call site only runs the code that creates the service.
+    """
+
+    # Compiled nodes are shared inside a single compilation, so diamond-shaped graphs are compiled once
+    _compiled_call_sites: Final[dict[tuple[int, bool], CompiledCallSite]]
+
+    def __init__(self) -> None:
+        self._compiled_call_sites = {}
+
+    def compile(self, call_site: ServiceCallSite) -> CompiledCallSite:
+        return self._compile_call_site(call_site, is_scope_lock_taken=False)
+
+    def _compile_call_site(
+        self, call_site: ServiceCallSite, is_scope_lock_taken: bool
+    ) -> CompiledCallSite:
+        compiled_call_site_key = (id(call_site), is_scope_lock_taken)
+        compiled_call_site = self._compiled_call_sites.get(compiled_call_site_key)
+
+        if compiled_call_site is not None:
+            return compiled_call_site
+
+        match call_site.cache.location:
+            case CallSiteResultCacheLocation.ROOT:
+                compiled_call_site = self._compile_root_cache(call_site)
+            case CallSiteResultCacheLocation.SCOPE:
+                compiled_call_site = self._compile_scope_cache(
+                    call_site, is_scope_lock_taken
+                )
+            case CallSiteResultCacheLocation.DISPOSE:
+                compiled_call_site = self._compile_dispose_cache(
+                    call_site, is_scope_lock_taken
+                )
+            case CallSiteResultCacheLocation.NONE:
+                compiled_call_site = self._compile_call_site_main(
+                    call_site, is_scope_lock_taken
+                )
+
+        self._compiled_call_sites[compiled_call_site_key] = compiled_call_site
+        return compiled_call_site
+
+    def _compile_root_cache(self, call_site: ServiceCallSite) -> CompiledCallSite:
+        create_service = self._compile_call_site_main(
+            call_site, is_scope_lock_taken=False
+        )
+
+        async def resolve_root_cache(
+            scope: ServiceProviderEngineScope,
+        ) -> object | None:
+            # If the value is already calculated, return it directly
+            if call_site.value is not None:
+                return call_site.value
+
+            root_scope = scope.root_provider.root
+
+            async with call_site.lock:
+                # Another coroutine could have cached the value while we were waiting for the lock
+                if call_site.value is not None:
+                    return call_site.value
+
+                service = await create_service(root_scope)
+                await root_scope.capture_disposable(service, call_site=call_site)
+                call_site.value = service
+                return service
+
+        return resolve_root_cache
+
+    def _compile_scope_cache(
+        self, call_site: ServiceCallSite, is_scope_lock_taken: bool
+    ) -> CompiledCallSite:
+        # A scoped service resolved from the root scope is promoted to singleton
+        resolve_root_cache = self._compile_root_cache(call_site)
+        create_service = self._compile_call_site_main(
+            call_site, is_scope_lock_taken=True
+        )
+
+        async def resolve_scope_cache_under_lock(
+            scope: ServiceProviderEngineScope,
+        ) -> object | None:
+            service = scope.get_resolved_service(call_site)
+
+            if service is not WirioUndefined.INSTANCE:
+                return service
+
+            service = await create_service(scope)
+            await scope.capture_disposable(service, call_site=call_site)
+            scope.set_resolved_service(call_site, service)
+            return service
+
+        if is_scope_lock_taken:
+
+            async def resolve_scope_cache_with_lock_taken(
+                scope: ServiceProviderEngineScope,
+            ) -> object | None:
+                if scope.is_root_scope:
+                    return await resolve_root_cache(scope)
+
+                return await resolve_scope_cache_under_lock(scope)
+
+            return resolve_scope_cache_with_lock_taken
+
+        async def resolve_scope_cache(
+            scope: ServiceProviderEngineScope,
+        ) -> object | None:
+            if scope.is_root_scope:
+                return await resolve_root_cache(scope)
+
+            # Fast path to avoid taking the lock when the service is already created
+            service = scope.get_resolved_service(call_site)
+
+            if service is not WirioUndefined.INSTANCE:
+                return service
+
+            async with scope.resolved_services_lock:
+                return await resolve_scope_cache_under_lock(scope)
+
+        return resolve_scope_cache
+
+    def _compile_dispose_cache(
+        self, call_site: ServiceCallSite, is_scope_lock_taken: bool
+    ) -> CompiledCallSite:
+        create_service = self._compile_call_site_main(call_site, is_scope_lock_taken)
+
+        async def resolve_dispose_cache(
+            scope: ServiceProviderEngineScope,
+        ) -> object | None:
+            service = await create_service(scope)
+            return await scope.capture_disposable(service, call_site=call_site)
+
+        return resolve_dispose_cache
+
+    def _compile_call_site_main(  # noqa: C901, PLR0911
+        self, call_site: ServiceCallSite, is_scope_lock_taken: bool
+    ) -> CompiledCallSite:
+        match call_site.kind:
+            case CallSiteKind.SYNC_FACTORY:
+                return self._compile_sync_factory(
+                    cast("SyncFactoryCallSite", call_site), is_scope_lock_taken
+                )
+            case CallSiteKind.ASYNC_FACTORY:
+                return self._compile_async_factory(
+                    cast("AsyncFactoryCallSite", call_site), is_scope_lock_taken
+                )
+            case CallSiteKind.SYNC_GENERATOR_FACTORY:
+                return self._compile_sync_generator_factory(
+                    cast("SyncGeneratorFactoryCallSite", call_site), is_scope_lock_taken
+                )
+            case CallSiteKind.ASYNC_GENERATOR_FACTORY:
+                return self._compile_async_generator_factory(
+                    cast("AsyncGeneratorFactoryCallSite", call_site),
+                    is_scope_lock_taken,
+                )
+            case CallSiteKind.CONSTRUCTOR:
+                return self._compile_constructor(
+                    cast("ConstructorCallSite", call_site), is_scope_lock_taken
+                )
+            case CallSiteKind.CONSTANT:
+                return self._compile_constant(cast("ConstantCallSite", call_site))
+            case CallSiteKind.SEQUENCE:
+                return self._compile_sequence(
+                    cast("SequenceCallSite", call_site), is_scope_lock_taken
+                )
+            case CallSiteKind.SERVICE_PROVIDER:
+                return self._compile_service_provider()
+            case CallSiteKind.LAZY:
+                return self._compile_lazy(cast("LazyCallSite", call_site))
+            case CallSiteKind.FACTORY_DELEGATE:
+                return self._compile_factory_delegate(
+                    cast("FactoryDelegateCallSite", call_site)
+                )
+
+    def _compile_constructor(
+        self, constructor_call_site: ConstructorCallSite, is_scope_lock_taken: bool
+    ) -> CompiledCallSite:
+        constructor_information = constructor_call_site.constructor_information
+        parameter_resolvers: list[
+            tuple[ParameterInformation, CompiledCallSite | None, object | None]
+        ] = []
+
+        for parameter, parameter_call_site in zip(
+            constructor_call_site.parameters,
+            constructor_call_site.parameter_call_sites,
+            strict=True,
+        ):
+            if parameter_call_site is not None:
+                parameter_resolvers.append(
+                    (
+                        parameter,
+                        self._compile_call_site(
+                            parameter_call_site, is_scope_lock_taken
+                        ),
+                        None,
+                    )
+                )
+            elif parameter.has_default_value:
+                parameter_resolvers.append((parameter, None, parameter.default_value))
+            elif parameter.is_optional:
+                parameter_resolvers.append((parameter, None, None))
+            else:
+                parameter_resolvers.append(
+                    (
+                        parameter,
+                        self._compile_parameter_resolution_error(
+                            parameter, constructor_call_site
+                        ),
+                        None,
+                    )
+                )
+
+        async def create_service(scope: ServiceProviderEngineScope) -> object | None:
+            parameter_values: list[object | None] = []
+
+            for parameter, resolve_parameter, default_value in parameter_resolvers:
+                if resolve_parameter is None:
+                    parameter_values.append(default_value)
+                    continue
+
+                parameter_service = await resolve_parameter(scope)
+
+                if parameter_service is None and not parameter.is_optional:
+                    raise CallSiteRuntimeResolver.INSTANCE.build_constructor_parameter_resolution_error(
+                        parameter, constructor_call_site.service_type
+                    )
+
+                parameter_values.append(parameter_service)
+
+            service = constructor_information.invoke(parameter_values)
+            return await _enter_context(service)
+
+        return create_service
+
+    def _compile_parameter_resolution_error(
+        self,
+        parameter: ParameterInformation,
+        constructor_call_site: ConstructorCallSite,
+    ) -> CompiledCallSite:
+        async def raise_parameter_resolution_error(
+            _: ServiceProviderEngineScope,
+        ) -> object | None:
+            raise CallSiteRuntimeResolver.INSTANCE.build_constructor_parameter_resolution_error(
+                parameter, constructor_call_site.service_type
+            )
+
+        return raise_parameter_resolution_error
+
+    def _compile_constant(
+        self, constant_call_site: ConstantCallSite
+    ) -> CompiledCallSite:
+        default_value = constant_call_site.default_value
+
+        async def resolve_constant(_: ServiceProviderEngineScope) -> object | None:
+            return default_value
+
+        return resolve_constant
+
+    def _compile_implementation_factory_parameters(
+        self,
+        implementation_factory_call_site: SyncFactoryCallSite
+        | AsyncFactoryCallSite
+        | SyncGeneratorFactoryCallSite
+        | AsyncGeneratorFactoryCallSite,
+        is_scope_lock_taken: bool,
+    ) -> Callable[[ServiceProviderEngineScope], Awaitable[list[object | None]]]:
+        runtime_resolver = CallSiteRuntimeResolver.INSTANCE
+        parameter_resolvers = [
+            (
+                parameter,
+                self._compile_call_site(parameter_call_site, is_scope_lock_taken)
+                if parameter_call_site is not None
+                else None,
+            )
+            for parameter, parameter_call_site in zip(
+                implementation_factory_call_site.parameters,
+                implementation_factory_call_site.parameter_call_sites,
+                strict=True,
+            )
+        ]
+
+        async def resolve_parameter_services(
+            scope: ServiceProviderEngineScope,
+        ) -> list[object | None]:
+            parameter_services: list[object | None] = []
+
+            for parameter, resolve_parameter in parameter_resolvers:
+                if resolve_parameter is None:
+                    parameter_service = await runtime_resolver.get_implementation_factory_parameter_service(
+                        parameter, scope
+                    )
+                else:
+                    parameter_service = await resolve_parameter(scope)
+
+                parameter_services.append(
+                    runtime_resolver.get_implementation_factory_parameter_value(
+                        parameter, parameter_service
+                    )
+                )
+
+            return parameter_services
+
+        return resolve_parameter_services
+
+    def _compile_sync_factory(
+        self, sync_factory_call_site: SyncFactoryCallSite, is_scope_lock_taken: bool
+    ) -> CompiledCallSite:
+        implementation_factory = sync_factory_call_site.implementation_factory
+
+        resolve_parameter_services = self._compile_implementation_factory_parameters(
+            sync_factory_call_site, is_scope_lock_taken
+        )
+
+        async def create_service(scope: ServiceProviderEngineScope) -> object | None:
+            parameter_services = await resolve_parameter_services(scope)
+            service = implementation_factory(*parameter_services)
+            return await _enter_context(service)
+
+        return create_service
+
+    def _compile_async_factory(
+        self, async_factory_call_site: AsyncFactoryCallSite, is_scope_lock_taken: bool
+    ) -> CompiledCallSite:
+        implementation_factory = async_factory_call_site.implementation_factory
+
+        resolve_parameter_services = self._compile_implementation_factory_parameters(
+            async_factory_call_site, is_scope_lock_taken
+        )
+
+        async def create_service(scope: ServiceProviderEngineScope) -> object | None:
+            parameter_services = await resolve_parameter_services(scope)
+            service = await implementation_factory(*parameter_services)
+            return await _enter_context(service)
+
+        return create_service
+
+    def _compile_sync_generator_factory(
+        self,
+        sync_generator_factory_call_site: SyncGeneratorFactoryCallSite,
+        is_scope_lock_taken: bool,
+    ) -> CompiledCallSite:
+        implementation_factory = sync_generator_factory_call_site.implementation_factory
+
+        resolve_parameter_services = self._compile_implementation_factory_parameters(
+            sync_generator_factory_call_site, is_scope_lock_taken
+        )
+
+        async def create_service(scope: ServiceProviderEngineScope) -> object | None:
+            parameter_services = await resolve_parameter_services(scope)
+            disposable = GeneratorFactoryDisposable(
+                implementation_factory(*parameter_services)
+            )
+            disposable.__enter__()
+            await scope.capture_disposable(
+                disposable, call_site=sync_generator_factory_call_site
+            )
+            return disposable.service
+
+        return create_service
+
+    def _compile_async_generator_factory(
+        self,
+        async_generator_factory_call_site: AsyncGeneratorFactoryCallSite,
+        is_scope_lock_taken: bool,
+    ) -> CompiledCallSite:
+        implementation_factory = (
+            async_generator_factory_call_site.implementation_factory
+        )
+
+        resolve_parameter_services = self._compile_implementation_factory_parameters(
+            async_generator_factory_call_site, is_scope_lock_taken
+        )
+
+        async def create_service(scope: ServiceProviderEngineScope) -> object | None:
+            parameter_services = await resolve_parameter_services(scope)
+            disposable = AsyncGeneratorFactoryDisposable(
+                implementation_factory(*parameter_services)
+            )
+            await disposable.__aenter__()
+            await scope.capture_disposable(
+                disposable, call_site=async_generator_factory_call_site
+            )
+            return disposable.service
+
+        return create_service
+
+    def _compile_sequence(
+        self, sequence_call_site: SequenceCallSite, is_scope_lock_taken: bool
+    ) -> CompiledCallSite:
+        resolve_services = [
+            self._compile_call_site(service_call_site, is_scope_lock_taken)
+            for service_call_site in sequence_call_site.service_call_sites
+        ]
+
+        async def resolve_sequence(scope: ServiceProviderEngineScope) -> object | None:
+            return tuple([await resolve(scope) for resolve in resolve_services])
+
+        return resolve_sequence
+
+    def _compile_service_provider(self) -> CompiledCallSite:
+        async def resolve_service_provider(
+            scope: ServiceProviderEngineScope,
+        ) -> object | None:
+            return scope
+
+        return resolve_service_provider
+
+    def _compile_lazy(self, lazy_call_site: LazyCallSite) -> CompiledCallSite:
+        async def resolve_lazy(scope: ServiceProviderEngineScope) -> object | None:
+            return lazy_call_site.create_lazy(scope)
+
+        return resolve_lazy
+
+    def _compile_factory_delegate(
+        self, factory_delegate_call_site: FactoryDelegateCallSite
+    ) -> CompiledCallSite:
+        async def resolve_factory_delegate(
+            scope: ServiceProviderEngineScope,
+        ) -> object | None:
+            return factory_delegate_call_site.create_factory(scope)
+
+        return resolve_factory_delegate
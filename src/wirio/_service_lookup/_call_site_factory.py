@@ -1,7 +1,10 @@
-from collections.abc import Generator, Iterator, Sequence
+import inspect
+import time
+from collections.abc import Callable, Generator, Iterator, Sequence
 from contextlib import contextmanager, suppress
 from dataclasses import dataclass
-from typing import ClassVar, Final, final, override
+from inspect import Parameter
+from typing import TYPE_CHECKING, ClassVar, Final, final, override
 
 from wirio._service_lookup._async_concurrent_dictionary import (
     AsyncConcurrentDictionary,
@@ -23,6 +26,8 @@ from wirio._service_lookup._constructor_call_site import (
 from wirio._service_lookup._constructor_information import (
     ConstructorInformation,
 )
+from wirio._service_lookup._factory_delegate_call_site import FactoryDelegateCallSite
+from wirio._service_lookup._lazy_call_site import LazyCallSite
 from wirio._service_lookup._parameter_information import (
     ParameterInformation,
 )
@@ -63,14 +68,22 @@ from wirio.annotations import (
     FromKeyedServicesInjectable,
     ServiceKeyInjectable,
 )
+from wirio.diagnostics.diagnostic_events import CallSiteBuiltEvent
+from wirio.diagnostics.diagnostic_listener import DiagnosticListener
+from wirio.diagnostics.startup_profiler import profile_startup
 from wirio.exceptions import (
     CannotResolveServiceError,
     InvalidServiceDescriptorError,
     InvalidServiceKeyTypeError,
     ServiceDescriptorDoesNotExistError,
 )
+from wirio.factory import Factory
+from wirio.lazy import Lazy
 from wirio.service_descriptor import ServiceDescriptor
 
+if TYPE_CHECKING:
+    from wirio._service_lookup._dependency_graph_cache import DependencyGraphCache
+
 
 @final
 class ServiceDescriptorCacheItem:
@@ -157,8 +170,23 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
     _service_type_to_cache_keys: Final[dict[TypedType, set[ServiceCacheKey]]]
     _dirty_service_types: Final[set[TypedType]]
     _service_type_invalidation_lock: Final[AsyncioReentrantLock]
+    _is_frozen: bool
+    _diagnostic_listener: Final[DiagnosticListener | None]
+    _dependency_graph_cache: Final["DependencyGraphCache | None"]
+    _constructor_parameters: Final[dict[TypedType, list[ParameterInformation]]]
+    _scope_slots: Final[dict[ServiceCacheKey, int]]
+    _implementation_factory_parameters: Final[
+        dict[tuple[Callable[..., object], bool], list[ParameterInformation]]
+    ]
 
-    def __init__(self, descriptors: list["ServiceDescriptor"]) -> None:
+    def __init__(
+        self,
+        descriptors: list["ServiceDescriptor"],
+        *,
+        diagnostic_listener: DiagnosticListener | None = None,
+        frozen: bool = False,
+        dependency_graph_cache: "DependencyGraphCache | None" = None,
+    ) -> None:
         self._descriptors = descriptors.copy()
         self._descriptor_lookup = {}
         self._call_site_cache = AsyncConcurrentDictionary[
@@ -171,6 +199,12 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
         self._service_type_to_cache_keys = {}
         self._dirty_service_types = set()
         self._service_type_invalidation_lock = AsyncioReentrantLock()
+        self._is_frozen = frozen
+        self._diagnostic_listener = diagnostic_listener
+        self._dependency_graph_cache = dependency_graph_cache
+        self._constructor_parameters = {}
+        self._scope_slots = {}
+        self._implementation_factory_parameters = {}
         self._populate(self._descriptors)
 
     @override
@@ -189,10 +223,37 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
             )
         )
 
+    def is_resolvable(self, service_identifier: ServiceIdentifier) -> bool:
+        """Indicate whether the service is registered, overridden or a sequence of services, without building its call site."""
+        service_type = service_identifier.service_type
+
+        return (
+            self._is_service(service_identifier)
+            or self._get_service_override(service_identifier).exists
+            or (
+                service_type.is_generic_type
+                and service_type.get_generic_type_definition()
+                == TypedType.from_type(Sequence)
+            )
+        )
+
+    @property
+    def scope_slots_count(self) -> int:
+        """Get the number of slots assigned to call sites cached in the scope."""
+        return len(self._scope_slots)
+
+    @property
+    def has_service_overrides(self) -> bool:
+        return len(self._service_overrides) > 0
+
     async def get_call_site_from_service_identifier(
         self, service_identifier: ServiceIdentifier, call_site_chain: CallSiteChain
     ) -> ServiceCallSite | None:
-        await self._invalidate_service_type_if_needed(service_identifier.service_type)
+        if not self._is_frozen:
+            await self._invalidate_service_type_if_needed(
+                service_identifier.service_type
+            )
+
         overridden_call_site = self.get_overridden_call_site(service_identifier)
 
         if overridden_call_site is not None:
@@ -213,7 +274,11 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
     async def get_call_site_from_service_descriptor(
         self, service_descriptor: ServiceDescriptor, call_site_chain: CallSiteChain
     ) -> ServiceCallSite | None:
-        await self._invalidate_service_type_if_needed(service_descriptor.service_type)
+        if not self._is_frozen:
+            await self._invalidate_service_type_if_needed(
+                service_descriptor.service_type
+            )
+
         service_identifier = ServiceIdentifier.from_descriptor(service_descriptor)
         service_descriptor_cache_item = self._descriptor_lookup.get(service_identifier)
 
@@ -233,6 +298,7 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
         cache_key = self._create_service_cache_key(
             service_identifier, self._DEFAULT_SLOT
         )
+        self._assign_scope_slot(service_call_site)
         await self._call_site_cache.upsert(key=cache_key, value=service_call_site)
         self._track_cache_key(service_identifier.service_type, cache_key)
 
@@ -263,14 +329,107 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
             service_key=service_identifier.service_key,
         )
 
+    def sort_by_dependencies(
+        self, descriptors: list[ServiceDescriptor]
+    ) -> list[ServiceDescriptor]:
+        """Sort the descriptors so that the ones providing the dependencies of a service come before it.
+
+        Building the call sites in this order finds the call sites of the dependencies already built,
+        instead of building them recursively. The parameters are parsed once and reused when building.
+        """
+        descriptors_by_service_type: dict[TypedType, list[ServiceDescriptor]] = {}
+
+        for descriptor in descriptors:
+            descriptors_by_service_type.setdefault(descriptor.service_type, []).append(
+                descriptor
+            )
+
+        def get_dependency_descriptors(
+            descriptor: ServiceDescriptor,
+        ) -> Iterator[ServiceDescriptor]:
+            for service_type in self._get_dependency_service_types(descriptor):
+                yield from descriptors_by_service_type.get(service_type, [])
+
+        sorted_descriptors: list[ServiceDescriptor] = []
+        visited_descriptor_ids: set[int] = set()
+
+        # Depth-first search with an explicit stack, so that long chains don't reach the recursion limit
+        for descriptor in descriptors:
+            if id(descriptor) in visited_descriptor_ids:
+                continue
+
+            visited_descriptor_ids.add(id(descriptor))
+            stack = [(descriptor, get_dependency_descriptors(descriptor))]
+
+            while len(stack) > 0:
+                current_descriptor, dependency_descriptors = stack[-1]
+                dependency_descriptor = next(
+                    (
+                        dependency_descriptor
+                        for dependency_descriptor in dependency_descriptors
+                        if id(dependency_descriptor) not in visited_descriptor_ids
+                    ),
+                    None,
+                )
+
+                if dependency_descriptor is None:
+                    stack.pop()
+                    sorted_descriptors.append(current_descriptor)
+                    continue
+
+                visited_descriptor_ids.add(id(dependency_descriptor))
+                stack.append(
+                    (
+                        dependency_descriptor,
+                        get_dependency_descriptors(dependency_descriptor),
+                    )
+                )
+
+        return sorted_descriptors
+
     def add_descriptor(self, descriptor: ServiceDescriptor) -> None:
         self._descriptors.append(descriptor)
         self._populate([descriptor])
         self.mark_service_type_dirty(descriptor.service_type)
 
+        for dependent_service_type in self.get_dependent_service_types(
+            descriptor.service_type
+        ):
+            self.mark_service_type_dirty(dependent_service_type)
+
+    def get_dependent_service_types(self, service_type: TypedType) -> set[TypedType]:
+        """Get the service types whose call sites were built from the call site of the given type, directly or not."""
+        dependent_service_types: set[TypedType] = set()
+        pending_service_types = [service_type]
+
+        while pending_service_types:
+            cache_keys = self._service_type_to_cache_keys.get(
+                pending_service_types.pop(), set()
+            )
+
+            for cache_key in cache_keys:
+                dependent_service_type = cache_key.service_identifier.service_type
+
+                if (
+                    dependent_service_type != service_type
+                    and dependent_service_type not in dependent_service_types
+                ):
+                    dependent_service_types.add(dependent_service_type)
+                    pending_service_types.append(dependent_service_type)
+
+        return dependent_service_types
+
     def mark_service_type_dirty(self, service_type: TypedType) -> None:
         self._dirty_service_types.add(service_type)
 
+    async def freeze(self) -> None:
+        """Stop tracking the call sites to invalidate, as no descriptor can be added anymore."""
+        for service_type in list(self._dirty_service_types):
+            await self._invalidate_service_type_if_needed(service_type)
+
+        self._is_frozen = True
+        self._service_type_to_cache_keys.clear()
+
     async def try_create_sequence(  # noqa: C901, PLR0915
         self, service_identifier: ServiceIdentifier, call_site_chain: CallSiteChain
     ) -> ServiceCallSite | None:
@@ -434,12 +593,79 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
                 service_call_sites=service_call_sites,
                 service_key=service_identifier.service_key,
             )
+            self._assign_scope_slot(sequence_call_site)
             await self._call_site_cache.upsert(call_site_key, sequence_call_site)
             return sequence_call_site
 
         finally:
             call_site_chain.remove(service_identifier)
 
+    async def try_create_lazy(
+        self, service_identifier: ServiceIdentifier, call_site_chain: CallSiteChain
+    ) -> ServiceCallSite | None:
+        return await self._try_create_handle(
+            service_identifier, call_site_chain, Lazy, LazyCallSite
+        )
+
+    async def try_create_factory_delegate(
+        self, service_identifier: ServiceIdentifier, call_site_chain: CallSiteChain
+    ) -> ServiceCallSite | None:
+        return await self._try_create_handle(
+            service_identifier, call_site_chain, Factory, FactoryDelegateCallSite
+        )
+
+    async def _try_create_handle(
+        self,
+        service_identifier: ServiceIdentifier,
+        call_site_chain: CallSiteChain,
+        handle_type: type,
+        create_handle_call_site: Callable[
+            [ResultCache, TypedType, ServiceCallSite, object | None], ServiceCallSite
+        ],
+    ) -> ServiceCallSite | None:
+        """Create the call site of a handle, like `Lazy[T]`, that resolves the service of type `T` later."""
+        service_type = service_identifier.service_type
+
+        if (
+            not service_type.is_generic_type
+            or service_type.get_generic_type_definition()
+            != TypedType.from_type(handle_type)
+        ):
+            return None
+
+        call_site_key = ServiceCacheKey(service_identifier, slot=self._DEFAULT_SLOT)
+
+        if (service_call_site := self._call_site_cache.get(call_site_key)) is not None:
+            return service_call_site
+
+        try:
+            call_site_chain.add(service_identifier)
+            item_type = service_type.generic_type_arguments()[0]
+            item_identifier = ServiceIdentifier.from_service_type(
+                service_type=item_type, service_key=service_identifier.service_key
+            )
+            # The call site of the service is built right away, so that missing services and captive
+            # dependencies are still found when the service provider is built
+            item_call_site = await self.get_call_site_from_service_identifier(
+                item_identifier, call_site_chain
+            )
+
+            if item_call_site is None:
+                return None
+
+            # Each dependent service gets its own handle, bound to the scope it's resolved from
+            handle_call_site = create_handle_call_site(
+                ResultCache(CallSiteResultCacheLocation.NONE, call_site_key),
+                item_type,
+                item_call_site,
+                service_identifier.service_key,
+            )
+            await self._call_site_cache.upsert(call_site_key, handle_call_site)
+            self._track_cache_key(item_type, call_site_key)
+            return handle_call_site
+        finally:
+            call_site_chain.remove(service_identifier)
+
     async def _invalidate_service_type_if_needed(self, service_type: TypedType) -> None:
         if service_type not in self._dirty_service_types:
             return
@@ -460,9 +686,21 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
     ) -> ServiceCacheKey:
         return ServiceCacheKey(service_identifier, slot)
 
+    def _assign_scope_slot(self, service_call_site: ServiceCallSite) -> None:
+        if service_call_site.cache.location is not CallSiteResultCacheLocation.SCOPE:
+            return
+
+        # Call sites rebuilt for the same cache key share the slot, like they shared the cached service
+        service_call_site.scope_slot = self._scope_slots.setdefault(
+            service_call_site.cache.key, len(self._scope_slots)
+        )
+
     def _track_cache_key(
         self, service_type: TypedType, cache_key: ServiceCacheKey
     ) -> None:
+        if self._is_frozen:
+            return
+
         cache_keys = self._service_type_to_cache_keys.setdefault(service_type, set())
         cache_keys.add(cache_key)
 
@@ -488,16 +726,43 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
         call_site_chain.check_circular_dependency(service_identifier)
 
         async with call_site_lock:
-            service_call_site = await self._try_create_exact_from_service_identifier(
-                service_identifier, call_site_chain
+            started_at = (
+                time.perf_counter() if self._diagnostic_listener is not None else 0.0
             )
 
-            if service_call_site is None:
-                service_call_site = await self.try_create_sequence(
-                    service_identifier, call_site_chain
+            with profile_startup("call-site", service_identifier):
+                service_call_site = (
+                    await self._try_create_exact_from_service_identifier(
+                        service_identifier, call_site_chain
+                    )
                 )
 
-            return service_call_site
+                if service_call_site is None:
+                    service_call_site = await self.try_create_sequence(
+                        service_identifier, call_site_chain
+                    )
+
+                if service_call_site is None:
+                    service_call_site = await self.try_create_lazy(
+                        service_identifier, call_site_chain
+                    )
+
+                if service_call_site is None:
+                    service_call_site = await self.try_create_factory_delegate(
+                        service_identifier, call_site_chain
+                    )
+
+        if self._diagnostic_listener is not None and service_call_site is not None:
+            self._diagnostic_listener.on_call_site_built(
+                CallSiteBuiltEvent(
+                    service_type=service_identifier.service_type,
+                    service_key=service_identifier.service_key,
+                    lifetime=service_call_site.cache.lifetime,
+                    duration=time.perf_counter() - started_at,
+                )
+            )
+
+        return service_call_site
 
     def _populate(self, descriptors: list[ServiceDescriptor]) -> None:
         for descriptor in descriptors:
@@ -591,79 +856,175 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
             not service_descriptor.is_keyed_service
             and service_descriptor.sync_implementation_factory is not None
         ):
+            (
+                parameters,
+                parameter_call_sites,
+            ) = await self._create_implementation_factory_argument_call_sites(
+                service_identifier=service_identifier,
+                call_site_key=call_site_key,
+                implementation_factory=service_descriptor.sync_implementation_factory,
+                is_keyed_implementation_factory=False,
+                call_site_chain=call_site_chain,
+            )
             service_call_site = SyncFactoryCallSite.from_implementation_factory(
                 cache=cache,
                 service_type=service_descriptor.service_type,
                 implementation_factory=service_descriptor.sync_implementation_factory,
+                parameters=parameters,
+                parameter_call_sites=parameter_call_sites,
             )
         elif (
             service_descriptor.is_keyed_service
             and service_descriptor.keyed_sync_implementation_factory is not None
         ):
+            (
+                parameters,
+                parameter_call_sites,
+            ) = await self._create_implementation_factory_argument_call_sites(
+                service_identifier=service_identifier,
+                call_site_key=call_site_key,
+                implementation_factory=service_descriptor.keyed_sync_implementation_factory,
+                is_keyed_implementation_factory=True,
+                call_site_chain=call_site_chain,
+            )
             service_call_site = SyncFactoryCallSite.from_keyed_implementation_factory(
                 cache=cache,
                 service_type=service_descriptor.service_type,
                 implementation_factory=service_descriptor.keyed_sync_implementation_factory,
                 service_key=service_identifier.service_key,
+                parameters=parameters,
+                parameter_call_sites=parameter_call_sites,
             )
         elif (
             not service_descriptor.is_keyed_service
             and service_descriptor.async_implementation_factory is not None
         ):
+            (
+                parameters,
+                parameter_call_sites,
+            ) = await self._create_implementation_factory_argument_call_sites(
+                service_identifier=service_identifier,
+                call_site_key=call_site_key,
+                implementation_factory=service_descriptor.async_implementation_factory,
+                is_keyed_implementation_factory=False,
+                call_site_chain=call_site_chain,
+            )
             service_call_site = AsyncFactoryCallSite.from_implementation_factory(
                 cache=cache,
                 service_type=service_descriptor.service_type,
                 implementation_factory=service_descriptor.async_implementation_factory,
+                parameters=parameters,
+                parameter_call_sites=parameter_call_sites,
             )
         elif (
             service_descriptor.is_keyed_service
             and service_descriptor.keyed_async_implementation_factory is not None
         ):
+            (
+                parameters,
+                parameter_call_sites,
+            ) = await self._create_implementation_factory_argument_call_sites(
+                service_identifier=service_identifier,
+                call_site_key=call_site_key,
+                implementation_factory=service_descriptor.keyed_async_implementation_factory,
+                is_keyed_implementation_factory=True,
+                call_site_chain=call_site_chain,
+            )
             service_call_site = AsyncFactoryCallSite.from_keyed_implementation_factory(
                 cache=cache,
                 service_type=service_descriptor.service_type,
                 implementation_factory=service_descriptor.keyed_async_implementation_factory,
                 service_key=service_identifier.service_key,
+                parameters=parameters,
+                parameter_call_sites=parameter_call_sites,
             )
         elif (
             not service_descriptor.is_keyed_service
             and service_descriptor.generator_implementation_factory is not None
         ):
+            (
+                parameters,
+                parameter_call_sites,
+            ) = await self._create_implementation_factory_argument_call_sites(
+                service_identifier=service_identifier,
+                call_site_key=call_site_key,
+                implementation_factory=service_descriptor.generator_implementation_factory,
+                is_keyed_implementation_factory=False,
+                call_site_chain=call_site_chain,
+            )
             service_call_site = SyncGeneratorFactoryCallSite.from_implementation_factory(
                 cache=cache,
                 service_type=service_descriptor.service_type,
                 implementation_factory=service_descriptor.generator_implementation_factory,
+                parameters=parameters,
+                parameter_call_sites=parameter_call_sites,
             )
         elif (
             service_descriptor.is_keyed_service
             and service_descriptor.keyed_sync_generator_implementation_factory
             is not None
         ):
+            (
+                parameters,
+                parameter_call_sites,
+            ) = await self._create_implementation_factory_argument_call_sites(
+                service_identifier=service_identifier,
+                call_site_key=call_site_key,
+                implementation_factory=service_descriptor.keyed_sync_generator_implementation_factory,
+                is_keyed_implementation_factory=True,
+                call_site_chain=call_site_chain,
+            )
             service_call_site = SyncGeneratorFactoryCallSite.from_keyed_implementation_factory(
                 cache=cache,
                 service_type=service_descriptor.service_type,
                 implementation_factory=service_descriptor.keyed_sync_generator_implementation_factory,
                 service_key=service_identifier.service_key,
+                parameters=parameters,
+                parameter_call_sites=parameter_call_sites,
             )
         elif (
             not service_descriptor.is_keyed_service
             and service_descriptor.async_generator_implementation_factory is not None
         ):
+            (
+                parameters,
+                parameter_call_sites,
+            ) = await self._create_implementation_factory_argument_call_sites(
+                service_identifier=service_identifier,
+                call_site_key=call_site_key,
+                implementation_factory=service_descriptor.async_generator_implementation_factory,
+                is_keyed_implementation_factory=False,
+                call_site_chain=call_site_chain,
+            )
             service_call_site = AsyncGeneratorFactoryCallSite.from_implementation_factory(
                 cache=cache,
                 service_type=service_descriptor.service_type,
                 implementation_factory=service_descriptor.async_generator_implementation_factory,
+                parameters=parameters,
+                parameter_call_sites=parameter_call_sites,
             )
         elif (
             service_descriptor.is_keyed_service
             and service_descriptor.keyed_async_generator_implementation_factory
             is not None
         ):
+            (
+                parameters,
+                parameter_call_sites,
+            ) = await self._create_implementation_factory_argument_call_sites(
+                service_identifier=service_identifier,
+                call_site_key=call_site_key,
+                implementation_factory=service_descriptor.keyed_async_generator_implementation_factory,
+                is_keyed_implementation_factory=True,
+                call_site_chain=call_site_chain,
+            )
             service_call_site = AsyncGeneratorFactoryCallSite.from_keyed_implementation_factory(
                 cache=cache,
                 service_type=service_descriptor.service_type,
                 implementation_factory=service_descriptor.keyed_async_generator_implementation_factory,
                 service_key=service_identifier.service_key,
+                parameters=parameters,
+                parameter_call_sites=parameter_call_sites,
             )
         elif service_descriptor.has_implementation_type():
             implementation_type = service_descriptor.get_implementation_type()
@@ -677,6 +1038,7 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
         else:
             raise InvalidServiceDescriptorError
 
+        self._assign_scope_slot(service_call_site)
         await self._call_site_cache.upsert(key=call_site_key, value=service_call_site)
         self._track_cache_key(service_identifier.service_type, call_site_key)
         return service_call_site
@@ -733,6 +1095,115 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
         if len(overrides) == 0:
             self._service_overrides.pop(service_identifier)
 
+    def _get_dependency_service_types(
+        self, descriptor: ServiceDescriptor
+    ) -> list[TypedType]:
+        try:
+            implementation_type = descriptor.get_implementation_type()
+
+            if implementation_type is not None:
+                parameters = self._get_constructor_parameters(implementation_type)
+            else:
+                implementation_factory = descriptor.get_implementation_factory()
+
+                if implementation_factory is None:
+                    return []
+
+                parameters = self._get_implementation_factory_parameters(
+                    implementation_factory, descriptor.is_keyed_service
+                )
+        except Exception:  # noqa: BLE001
+            # The error is raised again when building the call site of the descriptor
+            return []
+
+        dependency_service_types: list[TypedType] = []
+
+        for parameter in parameters:
+            parameter_type = parameter.parameter_type
+            dependency_service_types.append(parameter_type)
+
+            if parameter_type.is_sequence or parameter_type.to_type() in {
+                Lazy,
+                Factory,
+            }:
+                dependency_service_types.extend(parameter_type.generic_type_arguments())
+
+        return dependency_service_types
+
+    def _get_constructor_parameters(
+        self, implementation_type: TypedType
+    ) -> list[ParameterInformation]:
+        parameters = self._constructor_parameters.get(implementation_type)
+
+        if parameters is None:
+            constructor_information = ConstructorInformation(implementation_type)
+
+            if self._dependency_graph_cache is None:
+                parameters = constructor_information.get_parameters()
+            else:
+                parameters = [
+                    ParameterInformation(signature_parameter)
+                    for signature_parameter in self._dependency_graph_cache.get_or_introspect_parameters(
+                        self._dependency_graph_cache.CONSTRUCTOR_PARAMETERS,
+                        implementation_type.to_type(),
+                        constructor_information.get_signature_parameters,
+                    )
+                ]
+
+            self._constructor_parameters[implementation_type] = parameters
+
+        return parameters
+
+    def _get_implementation_factory_parameters(
+        self,
+        implementation_factory: Callable[..., object],
+        is_keyed_implementation_factory: bool,
+    ) -> list[ParameterInformation]:
+        cache_key = (implementation_factory, is_keyed_implementation_factory)
+
+        try:
+            parameters = self._implementation_factory_parameters.get(cache_key)
+        except TypeError:
+            # Unhashable callables aren't cached
+            return self._parse_implementation_factory_parameters(
+                implementation_factory, is_keyed_implementation_factory
+            )
+
+        if parameters is None:
+            parameters = self._parse_implementation_factory_parameters(
+                implementation_factory, is_keyed_implementation_factory
+            )
+            self._implementation_factory_parameters[cache_key] = parameters
+
+        return parameters
+
+    def _parse_implementation_factory_parameters(
+        self,
+        implementation_factory: Callable[..., object],
+        is_keyed_implementation_factory: bool,
+    ) -> list[ParameterInformation]:
+        def get_signature_parameters() -> list[Parameter]:
+            return list(inspect.signature(implementation_factory).parameters.values())
+
+        signature_parameters = (
+            get_signature_parameters()
+            if self._dependency_graph_cache is None
+            else self._dependency_graph_cache.get_or_introspect_parameters(
+                self._dependency_graph_cache.IMPLEMENTATION_FACTORY_PARAMETERS,
+                implementation_factory,
+                get_signature_parameters,
+            )
+        )
+
+        # The service key is passed as the first argument of keyed implementation factories
+        if is_keyed_implementation_factory:
+            signature_parameters = signature_parameters[1:]
+
+        return [
+            ParameterInformation(signature_parameter)
+            for signature_parameter in signature_parameters
+        ]
+
     async def _create_constructor_call_site(
         self,
         cache: ResultCache,
@@ -744,7 +1215,7 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
             call_site_chain.add(service_identifier, implementation_type)
             parameter_call_sites: list[ServiceCallSite | None] | None = None
             constructor_information = ConstructorInformation(implementation_type)
-            parameters = constructor_information.get_parameters()
+            parameters = self._get_constructor_parameters(implementation_type)
             parameter_call_sites = await self._create_argument_call_sites(
                 service_identifier=service_identifier,
                 implementation_type=implementation_type,
@@ -847,6 +1318,45 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
 
         return parameter_call_sites
 
+    async def _create_implementation_factory_argument_call_sites(
+        self,
+        service_identifier: ServiceIdentifier,
+        call_site_key: ServiceCacheKey,
+        implementation_factory: Callable[..., object],
+        is_keyed_implementation_factory: bool,
+        call_site_chain: CallSiteChain,
+    ) -> tuple[list[ParameterInformation], list[ServiceCallSite | None]]:
+        try:
+            call_site_chain.add(service_identifier)
+            parameters = self._get_implementation_factory_parameters(
+                implementation_factory, is_keyed_implementation_factory
+            )
+            parameter_call_sites: list[ServiceCallSite | None] = []
+
+            for parameter in parameters:
+                service_key = (
+                    parameter.injectable_dependency.key
+                    if isinstance(
+                        parameter.injectable_dependency, FromKeyedServicesInjectable
+                    )
+                    else None
+                )
+                # Parameters that can't be resolved yet are looked up again when the service is resolved,
+                # because they might be registered later
+                parameter_call_site = await self.get_call_site_from_service_identifier(
+                    ServiceIdentifier.from_service_type(
+                        service_type=parameter.parameter_type, service_key=service_key
+                    ),
+                    call_site_chain,
+                )
+                parameter_call_sites.append(parameter_call_site)
+                # The factory call site holds the parameter call sites, so it's rebuilt when a parameter is registered again
+                self._track_cache_key(parameter.parameter_type, call_site_key)
+
+            return parameters, parameter_call_sites
+        finally:
+            call_site_chain.remove(service_identifier)
+
     def _is_service(self, service_identifier: ServiceIdentifier) -> bool:
         service_type = service_identifier.service_type
 
@@ -862,6 +1372,15 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
         ):
             return True
 
+        # Handles are services when the service they resolve is
+        if service_type.is_generic_type and service_type.to_type() in {Lazy, Factory}:
+            return self._is_service(
+                ServiceIdentifier.from_service_type(
+                    service_type=service_type.generic_type_arguments()[0],
+                    service_key=service_identifier.service_key,
+                )
+            )
+
         return (
             service_type == TypedType.from_type(BaseServiceProvider)
             or service_type == TypedType.from_type(ServiceScopeFactory)
@@ -10,3 +10,5 @@ class CallSiteKind(Enum):
     CONSTANT = auto()
     SEQUENCE = auto()
     SERVICE_PROVIDER = auto()
+    LAZY = auto()
+    FACTORY_DELEGATE = auto()
@@ -1,14 +1,12 @@
-import inspect
-import typing
-from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
-from contextlib import AbstractAsyncContextManager, AbstractContextManager
+import asyncio
+import time
+from collections.abc import Sequence
+from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import Flag
-from types import TracebackType
 from typing import (
     ClassVar,
-    Final,
-    Self,
+    cast,
     final,
     override,
 )
@@ -26,6 +24,12 @@ from wirio._service_lookup._constant_call_site import (
 from wirio._service_lookup._constructor_call_site import (
     ConstructorCallSite,
 )
+from wirio._service_lookup._factory_delegate_call_site import FactoryDelegateCallSite
+from wirio._service_lookup._generator_factory_disposable import (
+    AsyncGeneratorFactoryDisposable,
+    GeneratorFactoryDisposable,
+)
+from wirio._service_lookup._lazy_call_site import LazyCallSite
 from wirio._service_lookup._parameter_information import (
     ParameterInformation,
 )
@@ -49,10 +53,14 @@ from wirio._service_lookup._sync_generator_factory_call_site import (
     SyncGeneratorFactoryCallSite,
 )
 from wirio._service_lookup._typed_type import TypedType
+from wirio._service_lookup.call_site_result_cache_location import (
+    CallSiteResultCacheLocation,
+)
+from wirio._service_lookup.service_cache_key import ServiceCacheKey
 from wirio.annotations import FromKeyedServicesInjectable
+from wirio.diagnostics.diagnostic_events import ServiceRealizedEvent
 from wirio.exceptions import (
     CannotResolveParameterServiceFromImplementationFactoryError,
-    GeneratorFactoryYieldedSeveralTimesError,
 )
 from wirio.service_provider_engine_scope import (
     ServiceProviderEngineScope,
@@ -71,76 +79,42 @@ class _RuntimeResolverLock(Flag):
 class RuntimeResolverContext:
     scope: ServiceProviderEngineScope
     acquired_locks: _RuntimeResolverLock
+    resolves_concurrently: bool = False
 
-
-@final
-class _GeneratorFactoryDisposable(
-    AbstractContextManager["_GeneratorFactoryDisposable"]
-):
-    _generator: Final[Generator[object]]
-    _service: object | None
-
-    def __init__(self, generator: Generator[object]) -> None:
-        self._generator = generator
-        self._service = None
+    # Services being created by sibling tasks, which share the scope lock taken by their parent task
+    pending_services: dict[ServiceCacheKey, asyncio.Future[object | None]] | None = None
 
     @property
-    def service(self) -> object | None:
-        return self._service
-
-    @override
-    def __enter__(self) -> Self:
-        self._service = next(self._generator)
-        return self
-
-    @override
-    def __exit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_val: BaseException | None,
-        exc_tb: TracebackType | None,
-    ) -> bool | None:
-        try:
-            next(self._generator)
-        except StopIteration:
-            return None
+    def is_scope_lock_taken(self) -> bool:
+        return (
+            not self.scope.is_root_scope
+            and (self.acquired_locks & _RuntimeResolverLock.SCOPE)
+            != _RuntimeResolverLock.NONE
+        )
 
-        raise GeneratorFactoryYieldedSeveralTimesError
+    def with_scope(
+        self, scope: ServiceProviderEngineScope, lock_type: _RuntimeResolverLock
+    ) -> "RuntimeResolverContext":
+        return RuntimeResolverContext(
+            scope=scope,
+            acquired_locks=self.acquired_locks | lock_type,
+            resolves_concurrently=self.resolves_concurrently,
+            pending_services=self.pending_services,
+        )
 
 
 @final
-class _AsyncGeneratorFactoryDisposable(
-    AbstractAsyncContextManager["_AsyncGeneratorFactoryDisposable"]
-):
-    _generator: Final[AsyncGenerator[object]]
-    _service: object | None
-
-    def __init__(self, generator: AsyncGenerator[object]) -> None:
-        self._generator = generator
-        self._service = None
-
-    @property
-    def service(self) -> object | None:
-        return self._service
-
-    @override
-    async def __aenter__(self) -> Self:
-        self._service = await anext(self._generator)
-        return self
+@dataclass(frozen=True)
+class _ConcurrentResolution:
+    scope: ServiceProviderEngineScope
+    pending_services: dict[ServiceCacheKey, asyncio.Future[object | None]]
 
-    @override
-    async def __aexit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_val: BaseException | None,
-        exc_tb: TracebackType | None,
-    ) -> bool | None:
-        try:
-            await anext(self._generator)
-        except StopAsyncIteration:
-            return None
 
-        raise GeneratorFactoryYieldedSeveralTimesError
+# Set in the tasks resolving services concurrently while their parent task holds the scope lock, so that the
+# services they resolve again through the provider, like from a factory, share the lock instead of waiting for it
+_concurrent_resolution: ContextVar[_ConcurrentResolution | None] = ContextVar(
+    "wirio_concurrent_resolution", default=None
+)
 
 
 @final
@@ -156,9 +130,51 @@ class CallSiteRuntimeResolver(CallSiteVisitor[RuntimeResolverContext, object | N
 
         return await self._visit_call_site(
             call_site,
-            RuntimeResolverContext(
-                scope=scope, acquired_locks=_RuntimeResolverLock.NONE
-            ),
+            self._create_context(scope, scope.root_provider.resolves_concurrently),
+        )
+
+    async def resolve_many(
+        self,
+        call_sites: Sequence[ServiceCallSite | None],
+        scope: ServiceProviderEngineScope,
+    ) -> list[object | None]:
+        """Resolve the call sites concurrently, taking the lock of the scope once for all of them.
+
+        The services are created like the parameters of a constructor resolved concurrently, so the ones they have in
+        common are only created once.
+        """
+        argument = self._create_context(scope, resolves_concurrently=True)
+
+        if scope.is_root_scope or argument.is_scope_lock_taken:
+            return await self._visit_parameter_call_sites(call_sites, argument)
+
+        async with scope.resolved_services_lock:
+            return await self._visit_parameter_call_sites(
+                call_sites,
+                RuntimeResolverContext(
+                    scope=scope,
+                    acquired_locks=_RuntimeResolverLock.SCOPE,
+                    resolves_concurrently=True,
+                ),
+            )
+
+    def _create_context(
+        self, scope: ServiceProviderEngineScope, resolves_concurrently: bool
+    ) -> RuntimeResolverContext:
+        concurrent_resolution = _concurrent_resolution.get()
+
+        if concurrent_resolution is not None and concurrent_resolution.scope is scope:
+            return RuntimeResolverContext(
+                scope=scope,
+                acquired_locks=_RuntimeResolverLock.SCOPE,
+                resolves_concurrently=resolves_concurrently,
+                pending_services=concurrent_resolution.pending_services,
+            )
+
+        return RuntimeResolverContext(
+            scope=scope,
+            acquired_locks=_RuntimeResolverLock.NONE,
+            resolves_concurrently=resolves_concurrently,
         )
 
     @override
@@ -203,12 +219,11 @@ class CallSiteRuntimeResolver(CallSiteVisitor[RuntimeResolverContext, object | N
 
             resolved_service = await self._visit_call_site_main(
                 call_site=call_site,
-                argument=RuntimeResolverContext(
-                    scope=service_provider_engine_scope,
-                    acquired_locks=argument.acquired_locks | lock_type,
-                ),
+                argument=argument.with_scope(service_provider_engine_scope, lock_type),
+            )
+            await service_provider_engine_scope.capture_disposable(
+                resolved_service, call_site=call_site
             )
-            await service_provider_engine_scope.capture_disposable(resolved_service)
             call_site.value = resolved_service
             return resolved_service
 
@@ -232,9 +247,15 @@ class CallSiteRuntimeResolver(CallSiteVisitor[RuntimeResolverContext, object | N
         service_provider_engine_scope: ServiceProviderEngineScope,
         lock_type: _RuntimeResolverLock,
     ) -> object | None:
+        # Services are stored only once fully created and never replaced, so a hit can be
+        # returned without taking the lock, which is only needed to create the service once
+        resolved_service = service_provider_engine_scope.get_resolved_service(call_site)
+
+        if resolved_service is not WirioUndefined.INSTANCE:
+            return resolved_service
+
         is_lock_taken = False
         resolved_services_lock = service_provider_engine_scope.resolved_services_lock
-        resolved_services = service_provider_engine_scope.resolved_services
 
         # Taking locks only once allows us to fork resolution process
         # on another coroutine without causing the deadlock because we
@@ -245,35 +266,96 @@ class CallSiteRuntimeResolver(CallSiteVisitor[RuntimeResolverContext, object | N
             is_lock_taken = True
 
         try:
-            # Note: This method has already taken lock by the caller for resolution and access synchronization.
-            # For scoped: takes a dictionary as both a resolution lock and a dictionary access lock.
-            resolved_service = resolved_services.get(
-                call_site.cache.key, WirioUndefined.INSTANCE
+            # Check again under the lock in case another coroutine created the service meanwhile
+            resolved_service = service_provider_engine_scope.get_resolved_service(
+                call_site
             )
 
             if resolved_service is not WirioUndefined.INSTANCE:
                 return resolved_service
 
-            resolved_service = await self._visit_call_site_main(
-                call_site=call_site,
-                argument=RuntimeResolverContext(
-                    scope=service_provider_engine_scope,
-                    acquired_locks=argument.acquired_locks | lock_type,
-                ),
+            resolved_argument = argument.with_scope(
+                service_provider_engine_scope, lock_type
             )
-            await service_provider_engine_scope.capture_disposable(resolved_service)
-            resolved_services[call_site.cache.key] = resolved_service
-            return resolved_service
+
+            # Sibling tasks don't take the scope lock held by their parent task,
+            # so they share the creation of the services they have in common
+            if not is_lock_taken and argument.pending_services is not None:
+                return await self._create_pending_scoped_service(
+                    call_site, resolved_argument, argument.pending_services
+                )
+
+            return await self._create_scoped_service(call_site, resolved_argument)
         finally:
             if is_lock_taken:
                 resolved_services_lock.release()
 
+    async def _create_scoped_service(
+        self, call_site: ServiceCallSite, argument: RuntimeResolverContext
+    ) -> object | None:
+        resolved_service = await self._visit_call_site_main(call_site, argument)
+        await argument.scope.capture_disposable(
+            resolved_service, is_lock_taken=True, call_site=call_site
+        )
+        argument.scope.set_resolved_service(call_site, resolved_service)
+        return resolved_service
+
+    async def _create_pending_scoped_service(
+        self,
+        call_site: ServiceCallSite,
+        argument: RuntimeResolverContext,
+        pending_services: dict[ServiceCacheKey, asyncio.Future[object | None]],
+    ) -> object | None:
+        pending_service = pending_services.get(call_site.cache.key)
+
+        if pending_service is not None:
+            return await asyncio.shield(pending_service)
+
+        pending_service = asyncio.get_running_loop().create_future()
+        pending_services[call_site.cache.key] = pending_service
+
+        try:
+            resolved_service = await self._create_scoped_service(call_site, argument)
+        except BaseException as exception:
+            pending_service.set_exception(exception)
+            # Mark the exception as retrieved, since no sibling might be waiting for it
+            pending_service.exception()
+            raise
+        finally:
+            del pending_services[call_site.cache.key]
+
+        pending_service.set_result(resolved_service)
+        return resolved_service
+
     @override
     async def _visit_dispose_cache(
         self, call_site: ServiceCallSite, argument: RuntimeResolverContext
     ) -> object | None:
         service = await self._visit_call_site_main(call_site, argument)
-        return await argument.scope.capture_disposable(service)
+        return await argument.scope.capture_disposable(
+            service, argument.is_scope_lock_taken, call_site
+        )
+
+    @override
+    async def _visit_call_site_main(
+        self, call_site: ServiceCallSite, argument: RuntimeResolverContext
+    ) -> object | None:
+        diagnostic_listener = argument.scope.root_provider.diagnostic_listener
+
+        if diagnostic_listener is None:
+            return await super()._visit_call_site_main(call_site, argument)
+
+        started_at = time.perf_counter()
+        service = await super()._visit_call_site_main(call_site, argument)
+        diagnostic_listener.on_service_realized(
+            ServiceRealizedEvent(
+                service_type=call_site.service_type,
+                service_key=call_site.key,
+                lifetime=call_site.cache.lifetime,
+                duration=time.perf_counter() - started_at,
+            )
+        )
+        return service
 
     @override
     async def _visit_constructor(
@@ -282,10 +364,14 @@ class CallSiteRuntimeResolver(CallSiteVisitor[RuntimeResolverContext, object | N
         argument: RuntimeResolverContext,
     ) -> object:
         parameter_values: list[object | None] = []
+        parameter_call_site_services = await self._visit_parameter_call_sites(
+            constructor_call_site.parameter_call_sites, argument
+        )
 
-        for parameter, parameter_call_site in zip(
+        for parameter, parameter_call_site, parameter_service in zip(
             constructor_call_site.parameters,
             constructor_call_site.parameter_call_sites,
+            parameter_call_site_services,
             strict=True,
         ):
             if parameter_call_site is None:
@@ -297,16 +383,12 @@ class CallSiteRuntimeResolver(CallSiteVisitor[RuntimeResolverContext, object | N
                     parameter_values.append(None)
                     continue
 
-                raise self._build_constructor_parameter_resolution_error(
+                raise self.build_constructor_parameter_resolution_error(
                     parameter, constructor_call_site.service_type
                 )
 
-            parameter_service = await self._visit_call_site(
-                parameter_call_site, argument
-            )
-
             if parameter_service is None and not parameter.is_optional:
-                raise self._build_constructor_parameter_resolution_error(
+                raise self.build_constructor_parameter_resolution_error(
                     parameter, constructor_call_site.service_type
                 )
 
@@ -335,8 +417,10 @@ class CallSiteRuntimeResolver(CallSiteVisitor[RuntimeResolverContext, object | N
         sync_factory_call_site: SyncFactoryCallSite,
         argument: RuntimeResolverContext,
     ) -> object | None:
-        parameter_services = await self.get_parameter_services(
-            sync_factory_call_site.implementation_factory, argument.scope
+        parameter_services = await self._get_implementation_factory_parameter_services(
+            sync_factory_call_site.parameters,
+            sync_factory_call_site.parameter_call_sites,
+            argument,
         )
         service = sync_factory_call_site.implementation_factory(*parameter_services)
 
@@ -353,8 +437,10 @@ class CallSiteRuntimeResolver(CallSiteVisitor[RuntimeResolverContext, object | N
         async_factory_call_site: AsyncFactoryCallSite,
         argument: RuntimeResolverContext,
     ) -> object | None:
-        parameter_services = await self.get_parameter_services(
-            async_factory_call_site.implementation_factory, argument.scope
+        parameter_services = await self._get_implementation_factory_parameter_services(
+            async_factory_call_site.parameters,
+            async_factory_call_site.parameter_call_sites,
+            argument,
         )
         service = await async_factory_call_site.implementation_factory(
             *parameter_services
@@ -373,16 +459,20 @@ class CallSiteRuntimeResolver(CallSiteVisitor[RuntimeResolverContext, object | N
         sync_generator_factory_call_site: SyncGeneratorFactoryCallSite,
         argument: RuntimeResolverContext,
     ) -> object | None:
-        parameter_services = await self.get_parameter_services(
-            sync_generator_factory_call_site.implementation_factory, argument.scope
+        parameter_services = await self._get_implementation_factory_parameter_services(
+            sync_generator_factory_call_site.parameters,
+            sync_generator_factory_call_site.parameter_call_sites,
+            argument,
         )
         service_generator = sync_generator_factory_call_site.implementation_factory(
             *parameter_services
         )
-        disposable = _GeneratorFactoryDisposable(service_generator)
+        disposable = GeneratorFactoryDisposable(service_generator)
         disposable.__enter__()
         service = disposable.service
-        await argument.scope.capture_disposable(disposable)
+        await argument.scope.capture_disposable(
+            disposable, argument.is_scope_lock_taken, sync_generator_factory_call_site
+        )
         return service
 
     @override
@@ -391,16 +481,20 @@ class CallSiteRuntimeResolver(CallSiteVisitor[RuntimeResolverContext, object | N
         async_generator_factory_call_site: AsyncGeneratorFactoryCallSite,
         argument: RuntimeResolverContext,
     ) -> object | None:
-        parameter_services = await self.get_parameter_services(
-            async_generator_factory_call_site.implementation_factory, argument.scope
+        parameter_services = await self._get_implementation_factory_parameter_services(
+            async_generator_factory_call_site.parameters,
+            async_generator_factory_call_site.parameter_call_sites,
+            argument,
         )
         service_generator = async_generator_factory_call_site.implementation_factory(
             *parameter_services
         )
-        disposable = _AsyncGeneratorFactoryDisposable(service_generator)
+        disposable = AsyncGeneratorFactoryDisposable(service_generator)
         await disposable.__aenter__()
         service = disposable.service
-        await argument.scope.capture_disposable(disposable)
+        await argument.scope.capture_disposable(
+            disposable, argument.is_scope_lock_taken, async_generator_factory_call_site
+        )
         return service
 
     @override
@@ -423,58 +517,166 @@ class CallSiteRuntimeResolver(CallSiteVisitor[RuntimeResolverContext, object | N
     ) -> object | None:
         return argument.scope
 
-    async def get_parameter_services(
+    @override
+    async def _visit_lazy(
+        self, lazy_call_site: LazyCallSite, argument: RuntimeResolverContext
+    ) -> object | None:
+        return lazy_call_site.create_lazy(argument.scope)
+
+    @override
+    async def _visit_factory_delegate(
+        self,
+        factory_delegate_call_site: FactoryDelegateCallSite,
+        argument: RuntimeResolverContext,
+    ) -> object | None:
+        return factory_delegate_call_site.create_factory(argument.scope)
+
+    async def _get_implementation_factory_parameter_services(
         self,
-        implementation_factory: Callable[..., Awaitable[object]]
-        | Callable[..., object],
-        scope: ServiceProviderEngineScope,
+        parameters: list[ParameterInformation],
+        parameter_call_sites: list[ServiceCallSite | None],
+        argument: RuntimeResolverContext,
     ) -> list[object | None]:
         parameter_services: list[object | None] = []
-        signature = inspect.signature(implementation_factory)
-
-        for parameter in signature.parameters.values():
-            parameter_information = ParameterInformation(parameter)
-            parameter_service: object | None = None
-
-            if isinstance(
-                parameter_information.injectable_dependency, FromKeyedServicesInjectable
-            ):
-                parameter_service = await scope.get_keyed_service_object(
-                    parameter_information.injectable_dependency.key,
-                    parameter_information.parameter_type,
-                )
-            else:
-                parameter_service = await scope.get_service_object(
-                    parameter_information.parameter_type
-                )
+        parameter_call_site_services = await self._visit_parameter_call_sites(
+            parameter_call_sites, argument
+        )
 
-            if parameter_service is None:
-                if parameter_information.has_default_value:
-                    parameter_services.append(parameter_information.default_value)
-                elif parameter_information.is_optional:
-                    parameter_services.append(None)
-                else:
-                    raise CannotResolveParameterServiceFromImplementationFactoryError(
-                        parameter_information.parameter_type
+        for parameter, parameter_call_site, parameter_service in zip(
+            parameters, parameter_call_sites, parameter_call_site_services, strict=True
+        ):
+            if parameter_call_site is None:
+                parameter_service = (  # noqa: PLW2901
+                    await self.get_implementation_factory_parameter_service(
+                        parameter, argument.scope
                     )
-            else:
-                parameter_services.append(parameter_service)
+                )
+
+            parameter_services.append(
+                self.get_implementation_factory_parameter_value(
+                    parameter, parameter_service
+                )
+            )
 
         return parameter_services
 
-    def _get_parameter_types(
+    async def _visit_parameter_call_sites(
+        self,
+        parameter_call_sites: Sequence[ServiceCallSite | None],
+        argument: RuntimeResolverContext,
+    ) -> list[object | None]:
+        """Resolve the parameter call sites, concurrently if enabled and more than one needs to create a service."""
+        if argument.resolves_concurrently:
+            creating_indexes = [
+                index
+                for index, parameter_call_site in enumerate(parameter_call_sites)
+                if parameter_call_site is not None
+                and self._may_create_service(parameter_call_site)
+            ]
+
+            if len(creating_indexes) > 1:
+                return await self._visit_parameter_call_sites_concurrently(
+                    parameter_call_sites, creating_indexes, argument
+                )
+
+        return [
+            await self._visit_call_site(parameter_call_site, argument)
+            if parameter_call_site is not None
+            else None
+            for parameter_call_site in parameter_call_sites
+        ]
+
+    async def _visit_parameter_call_sites_concurrently(
         self,
-        implementation_factory: Callable[..., Awaitable[object]]
-        | Callable[..., object],
-    ) -> list[type]:
-        type_hints: dict[str, type] = typing.get_type_hints(implementation_factory)
+        parameter_call_sites: Sequence[ServiceCallSite | None],
+        creating_indexes: list[int],
+        argument: RuntimeResolverContext,
+    ) -> list[object | None]:
+        # Child tasks inherit the acquired locks, since the parent task keeps them until all of them finish
+        child_argument = RuntimeResolverContext(
+            scope=argument.scope,
+            acquired_locks=argument.acquired_locks,
+            resolves_concurrently=True,
+            pending_services=(
+                argument.pending_services
+                if argument.pending_services is not None
+                else {}
+            ),
+        )
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = {
+                    index: task_group.create_task(
+                        self._visit_call_site_in_child_task(
+                            cast("ServiceCallSite", parameter_call_sites[index]),
+                            child_argument,
+                        )
+                    )
+                    for index in creating_indexes
+                }
+        except BaseExceptionGroup as exception_group:
+            # Raise the same error as when parameters are resolved one after another
+            raise exception_group.exceptions[0] from None
+
         return [
-            parameter_type
-            for parameter_name, parameter_type in type_hints.items()
-            if parameter_name != "return"
+            tasks[index].result()
+            if index in tasks
+            else await self._visit_call_site(parameter_call_site, argument)
+            if parameter_call_site is not None
+            else None
+            for index, parameter_call_site in enumerate(parameter_call_sites)
         ]
 
-    def _build_constructor_parameter_resolution_error(
+    async def _visit_call_site_in_child_task(
+        self, call_site: ServiceCallSite, argument: RuntimeResolverContext
+    ) -> object | None:
+        # Each task runs in a copy of the context, so this doesn't leak to the parent task
+        if argument.is_scope_lock_taken:
+            assert argument.pending_services is not None
+            _concurrent_resolution.set(
+                _ConcurrentResolution(argument.scope, argument.pending_services)
+            )
+
+        return await self._visit_call_site(call_site, argument)
+
+    def _may_create_service(self, call_site: ServiceCallSite) -> bool:
+        match call_site.cache.location:
+            case CallSiteResultCacheLocation.ROOT:
+                return call_site.value is None
+            case CallSiteResultCacheLocation.NONE:
+                return False
+            case _:
+                return True
+
+    async def get_implementation_factory_parameter_service(
+        self, parameter: ParameterInformation, scope: ServiceProviderEngineScope
+    ) -> object | None:
+        """Resolve a parameter of an implementation factory that wasn't registered when its call site was built."""
+        if isinstance(parameter.injectable_dependency, FromKeyedServicesInjectable):
+            return await scope.get_keyed_service_object(
+                parameter.injectable_dependency.key, parameter.parameter_type
+            )
+
+        return await scope.get_service_object(parameter.parameter_type)
+
+    def get_implementation_factory_parameter_value(
+        self, parameter: ParameterInformation, parameter_service: object | None
+    ) -> object | None:
+        if parameter_service is not None:
+            return parameter_service
+
+        if parameter.has_default_value:
+            return parameter.default_value
+
+        if parameter.is_optional:
+            return None
+
+        raise CannotResolveParameterServiceFromImplementationFactoryError(
+            parameter.parameter_type
+        )
+
+    def build_constructor_parameter_resolution_error(
         self, parameter_information: ParameterInformation, service_type: TypedType
     ) -> RuntimeError:
         return RuntimeError(
@@ -0,0 +1,320 @@
+import time
+from typing import TYPE_CHECKING, ClassVar, cast, final
+
+from wirio._service_lookup._asyncio_reentrant_lock import AsyncioReentrantLock
+from wirio._service_lookup._call_site_kind import CallSiteKind
+from wirio._service_lookup._call_site_runtime_resolver import CallSiteRuntimeResolver
+from wirio._service_lookup._constructor_call_site import ConstructorCallSite
+from wirio._service_lookup._generator_factory_disposable import (
+    GeneratorFactoryDisposable,
+)
+from wirio._service_lookup._sequence_call_site import SequenceCallSite
+from wirio._service_lookup._service_call_site import ServiceCallSite
+from wirio._service_lookup._supports_async_context_manager import (
+    SupportsAsyncContextManager,
+)
+from wirio._service_lookup._supports_sync_context_manager import (
+    SupportsSyncContextManager,
+)
+from wirio._service_lookup._sync_factory_call_site import SyncFactoryCallSite
+from wirio._service_lookup._sync_generator_factory_call_site import (
+    SyncGeneratorFactoryCallSite,
+)
+from wirio._service_lookup.call_site_result_cache_location import (
+    CallSiteResultCacheLocation,
+)
+from wirio.diagnostics.diagnostic_events import ServiceRealizedEvent
+from wirio.exceptions import ServiceNotSyncResolvableError
+from wirio.service_provider_engine_scope import ServiceProviderEngineScope
+from wirio.wirio_undefined import WirioUndefined
+
+if TYPE_CHECKING:
+    from wirio._service_lookup._factory_delegate_call_site import (
+        FactoryDelegateCallSite,
+    )
+    from wirio._service_lookup._lazy_call_site import LazyCallSite
+
+
+@final
+class CallSiteSyncResolver:
+    """Resolve call sites whose services can be created without awaiting.
+
+    Whether awaiting is needed is decided before creating any service, from what the call site factory found
+    out about each call site, so no user code runs when the services can't be resolved. Services depending on
+    async ones that are already cached can be resolved too. It never gives control back to the event loop, so
+    it doesn't need the locks taken by :class:`CallSiteRuntimeResolver`. When another task holds one of them,
+    the service might be being created by that task, so an error is raised instead of creating it twice.
+    """
+
+    INSTANCE: ClassVar["CallSiteSyncResolver"]
+
+    def resolve(
+        self, call_site: ServiceCallSite, scope: ServiceProviderEngineScope
+    ) -> object | None:
+        # Fast path to avoid virtual calls if we already have the cached value in the root scope
+        if scope.is_root_scope and call_site.value is not None:
+            return call_site.value
+
+        if not call_site.is_sync_resolvable:
+            self._check_is_sync_resolvable(call_site, scope)
+
+        return self._resolve_call_site(call_site, scope)
+
+    def _check_is_sync_resolvable(
+        self, call_site: ServiceCallSite, scope: ServiceProviderEngineScope
+    ) -> None:
+        if call_site.is_sync_resolvable or self._is_cached(call_site, scope):
+            return
+
+        if not call_site.is_sync_creatable:
+            raise ServiceNotSyncResolvableError(call_site.service_type)
+
+        for dependency_call_site in call_site.dependency_call_sites:
+            self._check_is_sync_resolvable(dependency_call_site, scope)
+
+    def _is_cached(
+        self, call_site: ServiceCallSite, scope: ServiceProviderEngineScope
+    ) -> bool:
+        if (
+            scope.root_provider.get_overridden_call_site(
+                call_site.cache.key.service_identifier
+            )
+            is not None
+        ):
+            return True
+
+        match call_site.cache.location:
+            case CallSiteResultCacheLocation.ROOT:
+                return call_site.value is not None
+            case CallSiteResultCacheLocation.SCOPE:
+                if scope.is_root_scope:
+                    return call_site.value is not None
+
+                return (
+                    scope.get_resolved_service(call_site) is not WirioUndefined.INSTANCE
+                )
+            case CallSiteResultCacheLocation.DISPOSE | CallSiteResultCacheLocation.NONE:
+                return False
+
+    def _resolve_call_site(
+        self, call_site: ServiceCallSite, scope: ServiceProviderEngineScope
+    ) -> object | None:
+        override_call_site = scope.root_provider.get_overridden_call_site(
+            call_site.cache.key.service_identifier
+        )
+
+        if override_call_site is not None:
+            return override_call_site.value
+
+        match call_site.cache.location:
+            case CallSiteResultCacheLocation.ROOT:
+                return self._resolve_root_cache(call_site, scope)
+            case CallSiteResultCacheLocation.SCOPE:
+                return self._resolve_scope_cache(call_site, scope)
+            case CallSiteResultCacheLocation.DISPOSE:
+                service = self._resolve_call_site_main(call_site, scope)
+                return scope.capture_disposable_sync(service, call_site)
+            case CallSiteResultCacheLocation.NONE:
+                return self._resolve_call_site_main(call_site, scope)
+
+    def _resolve_root_cache(
+        self, call_site: ServiceCallSite, scope: ServiceProviderEngineScope
+    ) -> object | None:
+        if call_site.value is not None:
+            return call_site.value
+
+        self._check_lock_is_not_held_by_another_task(call_site.lock, call_site)
+        root_scope = scope.root_provider.root
+        service = self._resolve_call_site_main(call_site, root_scope)
+        root_scope.capture_disposable_sync(service, call_site)
+        call_site.value = service
+        return service
+
+    def _resolve_scope_cache(
+        self, call_site: ServiceCallSite, scope: ServiceProviderEngineScope
+    ) -> object | None:
+        # Check if we are in the situation where scoped service was promoted to singleton
+        if scope.is_root_scope:
+            return self._resolve_root_cache(call_site, scope)
+
+        resolved_service = scope.get_resolved_service(call_site)
+
+        if resolved_service is not WirioUndefined.INSTANCE:
+            return resolved_service
+
+        self._check_lock_is_not_held_by_another_task(
+            scope.resolved_services_lock, call_site
+        )
+        service = self._resolve_call_site_main(call_site, scope)
+        scope.capture_disposable_sync(service, call_site)
+        scope.set_resolved_service(call_site, service)
+        return service
+
+    def _resolve_call_site_main(
+        self, call_site: ServiceCallSite, scope: ServiceProviderEngineScope
+    ) -> object | None:
+        diagnostic_listener = scope.root_provider.diagnostic_listener
+
+        if diagnostic_listener is None:
+            return self._create_service(call_site, scope)
+
+        started_at = time.perf_counter()
+        service = self._create_service(call_site, scope)
+        diagnostic_listener.on_service_realized(
+            ServiceRealizedEvent(
+                service_type=call_site.service_type,
+                service_key=call_site.key,
+                lifetime=call_site.cache.lifetime,
+                duration=time.perf_counter() - started_at,
+            )
+        )
+        return service
+
+    def _create_service(  # noqa: PLR0911
+        self, call_site: ServiceCallSite, scope: ServiceProviderEngineScope
+    ) -> object | None:
+        match call_site.kind:
+            case CallSiteKind.SYNC_FACTORY:
+                return self._resolve_sync_factory(
+                    cast("SyncFactoryCallSite", call_site), scope
+                )
+            case CallSiteKind.SYNC_GENERATOR_FACTORY:
+                return self._resolve_sync_generator_factory(
+                    cast("SyncGeneratorFactoryCallSite", call_site), scope
+                )
+            case CallSiteKind.CONSTRUCTOR:
+                return self._resolve_constructor(
+                    cast("ConstructorCallSite", call_site), scope
+                )
+            case CallSiteKind.CONSTANT:
+                return call_site.value
+            case CallSiteKind.SEQUENCE:
+                return self._resolve_sequence(
+                    cast("SequenceCallSite", call_site), scope
+                )
+            case CallSiteKind.SERVICE_PROVIDER:
+                return scope
+            case CallSiteKind.LAZY:
+                return cast("LazyCallSite", call_site).create_lazy(scope)
+            case CallSiteKind.FACTORY_DELEGATE:
+                return cast("FactoryDelegateCallSite", call_site).create_factory(scope)
+            case CallSiteKind.ASYNC_FACTORY | CallSiteKind.ASYNC_GENERATOR_FACTORY:
+                raise ServiceNotSyncResolvableError(call_site.service_type)
+
+    def _resolve_constructor(
+        self,
+        constructor_call_site: ConstructorCallSite,
+        scope: ServiceProviderEngineScope,
+    ) -> object | None:
+        parameter_values: list[object | None] = []
+
+        for parameter, parameter_call_site in zip(
+            constructor_call_site.parameters,
+            constructor_call_site.parameter_call_sites,
+            strict=True,
+        ):
+            if parameter_call_site is None:
+                if parameter.has_default_value:
+                    parameter_values.append(parameter.default_value)
+                    continue
+
+                if parameter.is_optional:
+                    parameter_values.append(None)
+                    continue
+
+                raise CallSiteRuntimeResolver.INSTANCE.build_constructor_parameter_resolution_error(
+                    parameter, constructor_call_site.service_type
+                )
+
+            parameter_service = self._resolve_call_site(parameter_call_site, scope)
+
+            if parameter_service is None and not parameter.is_optional:
+                raise CallSiteRuntimeResolver.INSTANCE.build_constructor_parameter_resolution_error(
+                    parameter, constructor_call_site.service_type
+                )
+
+            parameter_values.append(parameter_service)
+
+        service = constructor_call_site.constructor_information.invoke(parameter_values)
+        return self._enter_context(service, constructor_call_site)
+
+    def _resolve_sync_factory(
+        self,
+        sync_factory_call_site: SyncFactoryCallSite,
+        scope: ServiceProviderEngineScope,
+    ) -> object | None:
+        parameter_services = self._resolve_implementation_factory_parameters(
+            sync_factory_call_site, scope
+        )
+        service = sync_factory_call_site.implementation_factory(*parameter_services)
+        return self._enter_context(service, sync_factory_call_site)
+
+    def _resolve_sync_generator_factory(
+        self,
+        sync_generator_factory_call_site: SyncGeneratorFactoryCallSite,
+        scope: ServiceProviderEngineScope,
+    ) -> object | None:
+        parameter_services = self._resolve_implementation_factory_parameters(
+            sync_generator_factory_call_site, scope
+        )
+        disposable = GeneratorFactoryDisposable(
+            sync_generator_factory_call_site.implementation_factory(*parameter_services)
+        )
+        disposable.__enter__()
+        scope.capture_disposable_sync(disposable, sync_generator_factory_call_site)
+        return disposable.service
+
+    def _resolve_implementation_factory_parameters(
+        self,
+        implementation_factory_call_site: SyncFactoryCallSite
+        | SyncGeneratorFactoryCallSite,
+        scope: ServiceProviderEngineScope,
+    ) -> list[object | None]:
+        parameter_services: list[object | None] = []
+
+        for parameter, parameter_call_site in zip(
+            implementation_factory_call_site.parameters,
+            implementation_factory_call_site.parameter_call_sites,
+            strict=True,
+        ):
+            # Implementation factories with parameters without call site aren't sync creatable
+            assert parameter_call_site is not None
+            parameter_service = self._resolve_call_site(parameter_call_site, scope)
+            parameter_services.append(
+                CallSiteRuntimeResolver.INSTANCE.get_implementation_factory_parameter_value(
+                    parameter, parameter_service
+                )
+            )
+
+        return parameter_services
+
+    def _resolve_sequence(
+        self, sequence_call_site: SequenceCallSite, scope: ServiceProviderEngineScope
+    ) -> object | None:
+        return tuple(
+            [
+                self._resolve_call_site(service_call_site, scope)
+                for service_call_site in sequence_call_site.service_call_sites
+            ]
+        )
+
+    def _enter_context(
+        self, service: object | None, call_site: ServiceCallSite
+    ) -> object | None:
+        # Call sites of async context managers aren't sync creatable, unless a factory returns one without saying so
+        if isinstance(service, SupportsAsyncContextManager):
+            raise ServiceNotSyncResolvableError(call_site.service_type)
+
+        if isinstance(service, SupportsSyncContextManager):
+            service.__enter__()
+
+        return service
+
+    def _check_lock_is_not_held_by_another_task(
+        self, lock: AsyncioReentrantLock, call_site: ServiceCallSite
+    ) -> None:
+        if lock.is_locked and not lock.is_owner():
+            raise ServiceNotSyncResolvableError(call_site.service_type)
+
+
+CallSiteSyncResolver.INSTANCE = CallSiteSyncResolver()
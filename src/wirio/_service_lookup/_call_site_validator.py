@@ -9,6 +9,8 @@ from wirio._service_lookup._async_generator_factory_call_site import (
 from wirio._service_lookup._call_site_visitor import CallSiteVisitor
 from wirio._service_lookup._constant_call_site import ConstantCallSite
 from wirio._service_lookup._constructor_call_site import ConstructorCallSite
+from wirio._service_lookup._factory_delegate_call_site import FactoryDelegateCallSite
+from wirio._service_lookup._lazy_call_site import LazyCallSite
 from wirio._service_lookup._sequence_call_site import SequenceCallSite
 from wirio._service_lookup._service_call_site import ServiceCallSite
 from wirio._service_lookup._service_provider_call_site import ServiceProviderCallSite
@@ -39,9 +41,11 @@ class CallSiteValidator(CallSiteVisitor[_CallSiteValidatorState, TypedType | Non
     _scoped_services: Final[
         AsyncConcurrentDictionary[ServiceCacheKey, TypedType | None]
     ]
+    _visited_call_sites: Final[dict[ServiceCacheKey, TypedType | None]]
 
     def __init__(self) -> None:
         self._scoped_services = AsyncConcurrentDictionary()
+        self._visited_call_sites = {}
 
     @override
     async def _visit_call_site(
@@ -51,17 +55,20 @@ class CallSiteValidator(CallSiteVisitor[_CallSiteValidatorState, TypedType | Non
         # If first_scoped_service_in_call_site_tree is null there are no scoped dependencies in this service's call site tree
         # If first_scoped_service_in_call_site_tree has a value, it contains the first scoped service in this service's call site tree
 
-        first_scoped_service_in_call_site_tree = self._scoped_services.get(
-            call_site.cache.key
-        )
-
-        if first_scoped_service_in_call_site_tree is None:
-            # This call site wasn't cached yet, walk the tree
+        if call_site.cache.key in self._visited_call_sites:
+            first_scoped_service_in_call_site_tree = self._visited_call_sites[
+                call_site.cache.key
+            ]
+        else:
+            # This call site wasn't visited yet, walk the tree
             first_scoped_service_in_call_site_tree = await super()._visit_call_site(
                 call_site, argument
             )
 
-            # Cache the result
+            # Cache the result, even when there isn't any scoped service, so that each tree is walked once
+            self._visited_call_sites[call_site.cache.key] = (
+                first_scoped_service_in_call_site_tree
+            )
             await self._scoped_services.upsert(
                 call_site.cache.key, first_scoped_service_in_call_site_tree
             )
@@ -77,11 +84,14 @@ class CallSiteValidator(CallSiteVisitor[_CallSiteValidatorState, TypedType | Non
 
         return first_scoped_service_in_call_site_tree
 
+    @override
     async def _visit_root_cache(
         self, call_site: ServiceCallSite, argument: _CallSiteValidatorState
     ) -> TypedType | None:
-        argument.singleton = call_site
-        return await self._visit_call_site_main(call_site, argument)
+        # The state is copied so that the singleton doesn't leak to the siblings of the call site
+        return await self._visit_call_site_main(
+            call_site, _CallSiteValidatorState(singleton=call_site)
+        )
 
     async def _visit_scope_cache(
         self, call_site: ServiceCallSite, argument: _CallSiteValidatorState
@@ -98,10 +108,19 @@ class CallSiteValidator(CallSiteVisitor[_CallSiteValidatorState, TypedType | Non
         self,
         constructor_call_site: ConstructorCallSite,
         argument: _CallSiteValidatorState,
+    ) -> TypedType | None:
+        return await self._visit_parameter_call_sites(
+            constructor_call_site.parameter_call_sites, argument
+        )
+
+    async def _visit_parameter_call_sites(
+        self,
+        parameter_call_sites: list[ServiceCallSite | None],
+        argument: _CallSiteValidatorState,
     ) -> TypedType | None:
         result: TypedType | None = None
 
-        for parameter_call_site in constructor_call_site.parameter_call_sites:
+        for parameter_call_site in parameter_call_sites:
             if parameter_call_site is not None:
                 scoped = await self._visit_call_site(parameter_call_site, argument)
 
@@ -122,7 +141,9 @@ class CallSiteValidator(CallSiteVisitor[_CallSiteValidatorState, TypedType | Non
         sync_factory_call_site: SyncFactoryCallSite,
         argument: _CallSiteValidatorState,
     ) -> TypedType | None:
-        return None
+        return await self._visit_parameter_call_sites(
+            sync_factory_call_site.parameter_call_sites, argument
+        )
 
     @override
     async def _visit_async_factory(
@@ -130,7 +151,9 @@ class CallSiteValidator(CallSiteVisitor[_CallSiteValidatorState, TypedType | Non
         async_factory_call_site: AsyncFactoryCallSite,
         argument: _CallSiteValidatorState,
     ) -> TypedType | None:
-        return None
+        return await self._visit_parameter_call_sites(
+            async_factory_call_site.parameter_call_sites, argument
+        )
 
     @override
     async def _visit_sync_generator_factory(
@@ -138,7 +161,9 @@ class CallSiteValidator(CallSiteVisitor[_CallSiteValidatorState, TypedType | Non
         sync_generator_factory_call_site: SyncGeneratorFactoryCallSite,
         argument: _CallSiteValidatorState,
     ) -> TypedType | None:
-        return None
+        return await self._visit_parameter_call_sites(
+            sync_generator_factory_call_site.parameter_call_sites, argument
+        )
 
     @override
     async def _visit_async_generator_factory(
@@ -146,7 +171,9 @@ class CallSiteValidator(CallSiteVisitor[_CallSiteValidatorState, TypedType | Non
         async_generator_factory_call_site: AsyncGeneratorFactoryCallSite,
         argument: _CallSiteValidatorState,
     ) -> TypedType | None:
-        return None
+        return await self._visit_parameter_call_sites(
+            async_generator_factory_call_site.parameter_call_sites, argument
+        )
 
     @override
     async def _visit_sequence(
@@ -170,6 +197,23 @@ class CallSiteValidator(CallSiteVisitor[_CallSiteValidatorState, TypedType | Non
     ) -> TypedType | None:
         return None
 
+    @override
+    async def _visit_lazy(
+        self, lazy_call_site: LazyCallSite, argument: _CallSiteValidatorState
+    ) -> TypedType | None:
+        # The service is resolved later, but from the same scope, so it can't outlive it either
+        return await self._visit_call_site(lazy_call_site.service_call_site, argument)
+
+    @override
+    async def _visit_factory_delegate(
+        self,
+        factory_delegate_call_site: FactoryDelegateCallSite,
+        argument: _CallSiteValidatorState,
+    ) -> TypedType | None:
+        return await self._visit_call_site(
+            factory_delegate_call_site.service_call_site, argument
+        )
+
     async def validate_call_site(self, call_site: "ServiceCallSite") -> None:
         default = _CallSiteValidatorState(singleton=None)
         await self._visit_call_site(call_site, default)
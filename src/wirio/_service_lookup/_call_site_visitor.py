@@ -14,6 +14,8 @@ from wirio._service_lookup._constant_call_site import (
 from wirio._service_lookup._constructor_call_site import (
     ConstructorCallSite,
 )
+from wirio._service_lookup._factory_delegate_call_site import FactoryDelegateCallSite
+from wirio._service_lookup._lazy_call_site import LazyCallSite
 from wirio._service_lookup._sequence_call_site import SequenceCallSite
 from wirio._service_lookup._service_call_site import (
     ServiceCallSite,
@@ -66,7 +68,7 @@ class CallSiteVisitor[TArgument, TResult](ABC):
     ) -> TResult:
         return await self._visit_call_site_main(call_site, argument)
 
-    async def _visit_call_site_main(  # noqa: PLR0911
+    async def _visit_call_site_main(  # noqa: C901, PLR0911
         self, call_site: ServiceCallSite, argument: TArgument
     ) -> TResult:
         match call_site.kind:
@@ -116,6 +118,18 @@ class CallSiteVisitor[TArgument, TResult](ABC):
                     ),
                     argument=argument,
                 )
+            case CallSiteKind.LAZY:
+                return await self._visit_lazy(
+                    lazy_call_site=cast("LazyCallSite", call_site),
+                    argument=argument,
+                )
+            case CallSiteKind.FACTORY_DELEGATE:
+                return await self._visit_factory_delegate(
+                    factory_delegate_call_site=cast(
+                        "FactoryDelegateCallSite", call_site
+                    ),
+                    argument=argument,
+                )
 
     @abstractmethod
     async def _visit_constructor(
@@ -160,3 +174,13 @@ class CallSiteVisitor[TArgument, TResult](ABC):
     def _visit_service_provider(
         self, service_provider_call_site: ServiceProviderCallSite, argument: TArgument
     ) -> TResult: ...
+
+    @abstractmethod
+    async def _visit_lazy(
+        self, lazy_call_site: LazyCallSite, argument: TArgument
+    ) -> TResult: ...
+
+    @abstractmethod
+    async def _visit_factory_delegate(
+        self, factory_delegate_call_site: FactoryDelegateCallSite, argument: TArgument
+    ) -> TResult: ...
@@ -0,0 +1,42 @@
+from collections.abc import Awaitable, Callable
+from typing import ClassVar, final, override
+
+from wirio._service_lookup._call_site_compiler import CallSiteCompiler
+from wirio._service_lookup._call_site_runtime_resolver import (
+    CallSiteRuntimeResolver,
+)
+from wirio._service_lookup._service_call_site import (
+    ServiceCallSite,
+)
+from wirio._service_lookup._service_provider_engine import (
+    ServiceProviderEngine,
+)
+from wirio.service_provider_engine_scope import (
+    ServiceProviderEngineScope,
+)
+
+
+@final
+class CompiledServiceProviderEngine(ServiceProviderEngine):
+    INSTANCE: ClassVar["CompiledServiceProviderEngine"]
+
+    @override
+    def realize_service(
+        self, call_site: ServiceCallSite
+    ) -> Callable[[ServiceProviderEngineScope], Awaitable[object | None]]:
+        compiled_call_site = CallSiteCompiler().compile(call_site)
+
+        def _create_realize_service(
+            scope: ServiceProviderEngineScope,
+        ) -> Awaitable[object | None]:
+            # Overrides can replace any node of the tree, so they're resolved by the runtime resolver,
+            # which checks them on every call site
+            if scope.root_provider.has_service_overrides:
+                return CallSiteRuntimeResolver.INSTANCE.resolve(call_site, scope)
+
+            return compiled_call_site(scope)
+
+        return _create_realize_service
+
+
+CompiledServiceProviderEngine.INSTANCE = CompiledServiceProviderEngine()
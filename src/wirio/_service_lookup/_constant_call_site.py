@@ -8,6 +8,8 @@ from wirio._service_lookup._typed_type import TypedType
 
 @final
 class ConstantCallSite(ServiceCallSite):
+    __slots__ = ("_service_type",)
+
     _service_type: Final[TypedType]
 
     def __init__(
@@ -40,3 +42,8 @@ class ConstantCallSite(ServiceCallSite):
     @property
     def default_value(self) -> object:
         return self._value
+
+    @property
+    @override
+    def is_sync_resolvable(self) -> bool:
+        return True
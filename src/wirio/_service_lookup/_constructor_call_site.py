@@ -9,15 +9,29 @@ from wirio._service_lookup._parameter_information import (
 )
 from wirio._service_lookup._result_cache import ResultCache
 from wirio._service_lookup._service_call_site import ServiceCallSite
+from wirio._service_lookup._supports_async_context_manager import (
+    SupportsAsyncContextManager,
+)
 from wirio._service_lookup._typed_type import TypedType
 
 
 @final
 class ConstructorCallSite(ServiceCallSite):
+    __slots__ = (
+        "_constructor_information",
+        "_is_sync_creatable",
+        "_is_sync_resolvable",
+        "_parameter_call_sites",
+        "_parameters",
+        "_service_type",
+    )
+
     _service_type: Final[TypedType]
     _constructor_information: Final[ConstructorInformation]
     _parameters: Final[list[ParameterInformation]]
     _parameter_call_sites: Final[list[ServiceCallSite | None]]
+    _is_sync_creatable: Final[bool]
+    _is_sync_resolvable: Final[bool]
 
     def __init__(  # noqa: PLR0913
         self,
@@ -33,6 +47,15 @@ class ConstructorCallSite(ServiceCallSite):
         self._constructor_information = constructor_information
         self._parameters = parameters
         self._parameter_call_sites = parameter_call_sites
+        # Async context managers are entered right after being constructed
+        self._is_sync_creatable = not issubclass(
+            constructor_information.type_.to_type(), SupportsAsyncContextManager
+        )
+        self._is_sync_resolvable = self._is_sync_creatable and all(
+            parameter_call_site.is_sync_resolvable
+            for parameter_call_site in parameter_call_sites
+            if parameter_call_site is not None
+        )
 
     @property
     @override
@@ -55,3 +78,22 @@ class ConstructorCallSite(ServiceCallSite):
     @property
     def parameter_call_sites(self) -> list[ServiceCallSite | None]:
         return self._parameter_call_sites
+
+    @property
+    @override
+    def dependency_call_sites(self) -> list[ServiceCallSite]:
+        return [
+            parameter_call_site
+            for parameter_call_site in self._parameter_call_sites
+            if parameter_call_site is not None
+        ]
+
+    @property
+    @override
+    def is_sync_resolvable(self) -> bool:
+        return self._is_sync_resolvable
+
+    @property
+    @override
+    def is_sync_creatable(self) -> bool:
+        return self._is_sync_creatable
@@ -1,11 +1,13 @@
 import inspect
 import typing
+from inspect import Parameter
 from typing import Final, final
 
 from wirio._service_lookup._parameter_information import (
     ParameterInformation,
 )
 from wirio._service_lookup._typed_type import TypedType
+from wirio.diagnostics.startup_profiler import profile_startup
 
 
 @final
@@ -15,23 +17,34 @@ class ConstructorInformation:
     def __init__(self, type_: TypedType) -> None:
         self._type_ = type_
 
+    @property
+    def type_(self) -> TypedType:
+        return self._type_
+
     def invoke(self, parameter_values: list[object]) -> object:
         return self._type_.invoke(parameter_values)
 
     def get_parameters(self) -> list[ParameterInformation]:
+        return [
+            ParameterInformation(parameter)
+            for parameter in self.get_signature_parameters()
+        ]
+
+    def get_signature_parameters(self) -> list[Parameter]:
+        """Get the parameters of the constructor, with their type hints resolved."""
         init_method = self._type_.to_type().__init__
-        init_signature = inspect.signature(init_method)
-        init_type_hints = typing.get_type_hints(init_method, include_extras=True)  # pyright: ignore[reportUnusedVariable]
-        parameter_informations: list[ParameterInformation] = []
+        with profile_startup("type-hints", self._type_.to_type()):
+            init_signature = inspect.signature(init_method)
+            init_type_hints = typing.get_type_hints(init_method, include_extras=True)  # pyright: ignore[reportUnusedVariable]
+
+        parameters: list[Parameter] = []
 
         for parameter_name, parameter in init_signature.parameters.items():
             if parameter_name in ["self", "args", "kwargs"]:
                 continue
 
-            parameter_to_use = parameter.replace(
-                annotation=init_type_hints[parameter_name]
+            parameters.append(
+                parameter.replace(annotation=init_type_hints[parameter_name])
             )
-            parameter_information = ParameterInformation(parameter_to_use)
-            parameter_informations.append(parameter_information)
 
-        return parameter_informations
+        return parameters
@@ -0,0 +1,480 @@
+import hashlib
+import json
+import os
+import sys
+import typing
+from collections.abc import Callable
+from contextlib import suppress
+from inspect import Parameter
+from pathlib import Path
+from types import NoneType, UnionType
+from typing import Annotated, Any, ClassVar, Final, TypeAliasType, Union, cast, final
+
+_FORMAT_VERSION: Final = 2
+
+# Metadata of `Annotated` saved as is, as it doesn't depend on object identity
+_JSON_SCALAR_TYPES: Final = (str, int, float, bool, NoneType)
+
+
+@final
+class _CacheEntry:
+    """Introspected value of a type or a function, with the modules whose source it comes from."""
+
+    __slots__ = ("module_names", "value")
+
+    module_names: Final[tuple[str, ...]]
+    value: Final[object]
+
+    def __init__(self, module_names: tuple[str, ...], value: object) -> None:
+        self.module_names = module_names
+        self.value = value
+
+
+@final
+class DependencyGraphCache:
+    """On-disk cache of what introspecting the services returns, to skip `inspect.signature` and `typing.get_type_hints` at startup.
+
+    Only the names, kinds and type annotations of the parameters are saved, as JSON. Types are saved by their module
+    and qualified name, and default values are taken from the live functions, so that they keep their identity.
+    Entries are keyed by the Python version and the hash of the module files they come from, including the modules
+    defining the types and type aliases they reference, so that an entry is introspected again when one of them changes.
+    Values that can't be saved this way are introspected on every run.
+    """
+
+    CONSTRUCTOR_PARAMETERS: ClassVar[str] = "constructor-parameters"
+    IMPLEMENTATION_FACTORY_PARAMETERS: ClassVar[str] = (
+        "implementation-factory-parameters"
+    )
+    IMPLEMENTATION_FACTORY_RETURN_TYPE: ClassVar[str] = (
+        "implementation-factory-return-type"
+    )
+
+    _path: Final[Path]
+    _entries: dict[str, _CacheEntry] | None
+    _module_hashes: dict[str, str]
+    _current_module_hashes: Final[dict[str, str | None]]
+    _is_dirty: bool
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._entries = None
+        self._module_hashes = {}
+        self._current_module_hashes = {}
+        self._is_dirty = False
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def get_or_introspect_parameters(
+        self, kind: str, target: object, introspect: Callable[[], list[Parameter]]
+    ) -> list[Parameter]:
+        """Get the parameters introspected from the target in a previous run, or introspect them and keep them for the next runs.
+
+        The target is either a function, or a class whose constructor parameters are introspected.
+        """
+        function = cast(
+            "Callable[..., object]",
+            target.__init__ if isinstance(target, type) else target,
+        )
+        cached_value = self._get_cached_value(kind, target)
+
+        if cached_value is not None:
+            with suppress(Exception):
+                return self._decode_parameters(cached_value, function)
+
+        parameters = introspect()
+
+        with suppress(Exception):
+            # Annotations referencing local classes or objects other than types can't be saved
+            module_names: set[str] = set()
+            encoded_parameters = self._encode_parameters(
+                parameters, function, module_names
+            )
+            self._add_entry(kind, target, module_names, encoded_parameters)
+
+        return parameters
+
+    def get_or_introspect_annotation(
+        self, kind: str, target: object, introspect: Callable[[], object]
+    ) -> object:
+        """Get the type annotation introspected from the target in a previous run, or introspect it and keep it for the next runs."""
+        cached_value = self._get_cached_value(kind, target)
+
+        if cached_value is not None:
+            with suppress(Exception):
+                return self._decode_annotation(cached_value)
+
+        annotation = introspect()
+
+        with suppress(Exception):
+            module_names: set[str] = set()
+            encoded_annotation = self._encode_annotation(annotation, module_names)
+            self._add_entry(kind, target, module_names, encoded_annotation)
+
+        return annotation
+
+    def save(self) -> None:
+        """Write the entries introspected since the cache was loaded, if any."""
+        if not self._is_dirty or self._entries is None:
+            return
+
+        content = {
+            "format_version": _FORMAT_VERSION,
+            "python_version": sys.version,
+            "module_hashes": self._module_hashes,
+            "entries": {
+                key: [list(entry.module_names), entry.value]
+                for key, entry in self._entries.items()
+            },
+        }
+        temporary_path = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path.write_text(json.dumps(content), encoding="utf-8")
+            # Replacing the file is atomic, so that other processes never read a partially written cache
+            temporary_path.replace(self._path)
+        except OSError:
+            # The cache is an optimization, so read-only file systems only disable it
+            temporary_path.unlink(missing_ok=True)
+            return
+
+        self._is_dirty = False
+
+    def _get_cached_value(self, kind: str, target: object) -> object | None:
+        key = self._get_key(kind, target)
+
+        if key is None:
+            return None
+
+        entry = self._get_entries().get(key)
+
+        if entry is None or not self._is_entry_valid(entry):
+            return None
+
+        return entry.value
+
+    def _add_entry(
+        self, kind: str, target: object, module_names: set[str], value: object
+    ) -> None:
+        key = self._get_key(kind, target)
+
+        if key is None:
+            return
+
+        entries = self._get_entries()
+        entry_module_names = (*self._get_module_names(target), *sorted(module_names))
+
+        for module_name in entry_module_names:
+            module_hash = self._get_current_module_hash(module_name)
+
+            if module_hash is None:
+                entries.pop(key, None)
+                return
+
+            self._module_hashes[module_name] = module_hash
+
+        entries[key] = _CacheEntry(tuple(dict.fromkeys(entry_module_names)), value)
+        self._is_dirty = True
+
+    def _get_entries(self) -> dict[str, _CacheEntry]:
+        if self._entries is None:
+            self._entries = self._load()
+
+        return self._entries
+
+    def _load(self) -> dict[str, _CacheEntry]:
+        try:
+            content = cast(
+                "dict[str, Any]", json.loads(self._path.read_text(encoding="utf-8"))
+            )
+            is_current_format = (
+                content.get("format_version") == _FORMAT_VERSION
+                and content.get("python_version") == sys.version
+            )
+        except FileNotFoundError:
+            return {}
+        except Exception:  # noqa: BLE001
+            # A corrupted cache is rebuilt from scratch
+            self._is_dirty = True
+            return {}
+
+        if not is_current_format:
+            self._is_dirty = True
+            return {}
+
+        self._module_hashes = cast("dict[str, str]", content["module_hashes"])
+        entries = cast("dict[str, list[Any]]", content["entries"])
+        return {
+            key: _CacheEntry(tuple(module_names), value)
+            for key, (module_names, value) in entries.items()
+        }
+
+    def _is_entry_valid(self, entry: _CacheEntry) -> bool:
+        return all(
+            self._module_hashes.get(module_name) is not None
+            and self._get_current_module_hash(module_name)
+            == self._module_hashes[module_name]
+            for module_name in entry.module_names
+        )
+
+    def _get_current_module_hash(self, module_name: str) -> str | None:
+        if module_name in self._current_module_hashes:
+            return self._current_module_hashes[module_name]
+
+        module_hash: str | None = None
+        module = sys.modules.get(module_name)
+
+        if module is not None:
+            module_file = getattr(module, "__file__", None)
+
+            # Built-in and standard library modules only change with the Python version
+            if (
+                module_file is None
+                or module_name.partition(".")[0] in sys.stdlib_module_names
+            ):
+                module_hash = ""
+            else:
+                try:
+                    module_hash = hashlib.sha256(
+                        Path(module_file).read_bytes()
+                    ).hexdigest()
+                except OSError:
+                    module_hash = None
+
+        self._current_module_hashes[module_name] = module_hash
+        return module_hash
+
+    def _get_key(self, kind: str, target: object) -> str | None:
+        module_name = getattr(target, "__module__", None)
+        qualified_name = getattr(target, "__qualname__", None)
+
+        if not isinstance(module_name, str) or not isinstance(qualified_name, str):
+            return None
+
+        # Only targets found by their name identify the same target across runs, unlike local or generated ones
+        if self._find_object(module_name, qualified_name) is not target:
+            return None
+
+        return f"{kind}:{module_name}:{qualified_name}"
+
+    def _get_module_names(self, target: object) -> tuple[str, ...]:
+        module_names = [cast("str", getattr(target, "__module__"))]  # noqa: B009
+
+        # Constructors can be inherited from a class defined in another module
+        if isinstance(target, type):
+            init_module_name = getattr(target.__init__, "__module__", None)
+
+            if isinstance(init_module_name, str) and init_module_name not in (
+                module_names
+            ):
+                module_names.append(init_module_name)
+
+        return tuple(module_names)
+
+    def _find_object(self, module_name: str, qualified_name: str) -> object:
+        found_object: object = sys.modules.get(module_name)
+
+        for name in qualified_name.split("."):
+            found_object = getattr(found_object, name, None)
+
+        return found_object
+
+    def _encode_parameters(
+        self,
+        parameters: list[Parameter],
+        function: Callable[..., object],
+        module_names: set[str],
+    ) -> list[list[object]]:
+        default_values = self._get_default_values(function)
+
+        for parameter in parameters:
+            # Default values aren't saved, so they must be the ones the live function gives
+            if parameter.default is not default_values.get(
+                parameter.name, Parameter.empty
+            ):
+                error_message = f"The default value of '{parameter.name}' isn't the one of the function"
+                raise ValueError(error_message)
+
+        return [
+            [
+                parameter.name,
+                parameter.kind.name,
+                self._encode_annotation(parameter.annotation, module_names),
+            ]
+            for parameter in parameters
+        ]
+
+    def _decode_parameters(
+        self, value: object, function: Callable[..., object]
+    ) -> list[Parameter]:
+        default_values = self._get_default_values(function)
+        return [
+            Parameter(
+                name,
+                getattr(Parameter, kind_name),
+                default=default_values.get(name, Parameter.empty),
+                annotation=self._decode_annotation(annotation),
+            )
+            for name, kind_name, annotation in cast("list[list[Any]]", value)
+        ]
+
+    def _get_default_values(self, function: Callable[..., object]) -> dict[str, object]:
+        code = getattr(function, "__code__", None)
+
+        if code is None:
+            return {}
+
+        positional_names = code.co_varnames[: code.co_argcount]
+        positional_default_values: tuple[object, ...] = (
+            getattr(function, "__defaults__", None) or ()
+        )
+        keyword_default_values: dict[str, object] = (
+            getattr(function, "__kwdefaults__", None) or {}
+        )
+        default_values = dict(
+            zip(
+                positional_names[
+                    len(positional_names) - len(positional_default_values) :
+                ],
+                positional_default_values,
+                strict=True,
+            )
+        )
+        default_values.update(keyword_default_values)
+        return default_values
+
+    def _encode_annotation(self, annotation: object, module_names: set[str]) -> object:
+        encoded_annotation = self._encode_annotation_part(annotation, module_names)
+
+        # Aliases like `typing.Sequence[int]` are rebuilt from their origin as another alias, so they aren't saved
+        if self._decode_annotation(encoded_annotation) != annotation:
+            error_message = f"The annotation '{annotation}' can't be saved"
+            raise ValueError(error_message)
+
+        return encoded_annotation
+
+    def _encode_annotation_part(  # noqa: PLR0911
+        self, annotation: object, module_names: set[str]
+    ) -> object:
+        if annotation is None:
+            return None
+
+        if annotation is Parameter.empty:
+            return ["empty"]
+
+        if annotation is NoneType:
+            return ["none"]
+
+        # Postponed annotations of implementation factories are kept as strings
+        if isinstance(annotation, str):
+            return ["string", annotation]
+
+        origin = typing.get_origin(annotation)
+
+        if origin is None:
+            return self._encode_reference(annotation, module_names)
+
+        arguments = typing.get_args(annotation)
+
+        if origin is Annotated:
+            metadata = list(arguments[1:])
+
+            if not all(type(item) in _JSON_SCALAR_TYPES for item in metadata):
+                error_message = f"The metadata of '{annotation}' can't be saved"
+                raise ValueError(error_message)
+
+            return [
+                "annotated",
+                self._encode_annotation_part(arguments[0], module_names),
+                metadata,
+            ]
+
+        encoded_arguments = [
+            self._encode_annotation_part(argument, module_names)
+            for argument in arguments
+        ]
+
+        if origin is Union or origin is UnionType:
+            return ["union", encoded_arguments]
+
+        return [
+            "generic",
+            self._encode_reference(origin, module_names),
+            encoded_arguments,
+        ]
+
+    def _encode_reference(
+        self, annotation: object, module_names: set[str]
+    ) -> list[object]:
+        if isinstance(annotation, type):
+            module_name, qualified_name = annotation.__module__, annotation.__qualname__
+        elif (
+            isinstance(annotation, TypeAliasType) and annotation.__module__ is not None
+        ):
+            module_name, qualified_name = annotation.__module__, annotation.__name__
+        else:
+            error_message = f"The annotation '{annotation}' can't be saved"
+            raise ValueError(error_message)
+
+        # Local or generated types can't be found by their name in the next runs
+        if self._find_object(module_name, qualified_name) is not annotation:
+            error_message = f"The annotation '{annotation}' can't be found by its name"
+            raise ValueError(error_message)
+
+        module_names.add(module_name)
+        return ["reference", module_name, qualified_name]
+
+    def _decode_annotation(self, value: object) -> object:  # noqa: PLR0911
+        if value is None:
+            return None
+
+        tag, *arguments = cast("list[Any]", value)
+
+        match tag:
+            case "empty":
+                return Parameter.empty
+            case "none":
+                return NoneType
+            case "string":
+                return cast("str", arguments[0])
+            case "annotated":
+                annotated_type, metadata = arguments
+                return cast("Any", Annotated)[
+                    self._decode_annotation(annotated_type), *metadata
+                ]
+            case "union":
+                return self._decode_union(arguments[0])
+            case "generic":
+                origin, origin_arguments = arguments
+                return cast("Any", self._decode_annotation(origin))[
+                    tuple(
+                        self._decode_annotation(argument)
+                        for argument in origin_arguments
+                    )
+                ]
+            case "reference":
+                module_name, qualified_name = arguments
+                return self._decode_reference(module_name, qualified_name)
+            case _:
+                error_message = f"Unknown annotation tag '{tag}'"
+                raise ValueError(error_message)
+
+    def _decode_union(self, arguments: list[object]) -> object:
+        union: Any = None
+
+        for argument in arguments:
+            decoded_argument = self._decode_annotation(argument)
+            union = decoded_argument if union is None else union | decoded_argument
+
+        return union
+
+    def _decode_reference(self, module_name: str, qualified_name: str) -> object:
+        found_object = self._find_object(module_name, qualified_name)
+
+        if found_object is None:
+            error_message = f"'{module_name}.{qualified_name}' doesn't exist"
+            raise LookupError(error_message)
+
+        return found_object
@@ -0,0 +1,87 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Final, final, override
+
+from wirio._service_lookup._call_site_runtime_resolver import (
+    CallSiteRuntimeResolver,
+)
+from wirio._service_lookup._compiled_service_provider_engine import (
+    CompiledServiceProviderEngine,
+)
+from wirio._service_lookup._service_call_site import (
+    ServiceCallSite,
+)
+from wirio._service_lookup._service_provider_engine import (
+    ServiceProviderEngine,
+)
+from wirio.service_provider_engine_scope import (
+    ServiceProviderEngineScope,
+)
+
+if TYPE_CHECKING:
+    from wirio.service_provider import ServiceProvider
+
+
+@final
+class DynamicServiceProviderEngine(ServiceProviderEngine):
+    """Interpret call sites first and compile the ones resolved at least `compilation_threshold` times.
+
+    The compilation isn't run in another thread: it's scheduled with `call_soon` on the event loop, so it runs right
+    after the resolution that reached the threshold, on the loop thread.
+    """
+
+    _service_provider: Final["ServiceProvider"]
+    _compilation_threshold: Final[int]
+
+    def __init__(
+        self, service_provider: "ServiceProvider", compilation_threshold: int
+    ) -> None:
+        if compilation_threshold <= 0:
+            error_message = "'compilation_threshold' must be greater than 0"
+            raise ValueError(error_message)
+
+        self._service_provider = service_provider
+        self._compilation_threshold = compilation_threshold
+
+    @override
+    def realize_service(
+        self, call_site: ServiceCallSite
+    ) -> Callable[[ServiceProviderEngineScope], Awaitable[object | None]]:
+        resolution_count = 0
+        compiled_realized_service: (
+            Callable[[ServiceProviderEngineScope], Awaitable[object | None]] | None
+        ) = None
+
+        def compile_realized_service() -> None:
+            nonlocal compiled_realized_service
+
+            if self._service_provider.is_disposed:
+                return
+
+            compiled_realized_service = (
+                CompiledServiceProviderEngine.INSTANCE.realize_service(call_site)
+            )
+            self._service_provider.replace_service_accessor(
+                call_site=call_site,
+                realized_service=_create_realize_service,
+                new_realized_service=compiled_realized_service,
+            )
+
+        def _create_realize_service(
+            scope: ServiceProviderEngineScope,
+        ) -> Awaitable[object | None]:
+            nonlocal resolution_count
+
+            # The accessor may have been captured before it was replaced
+            if compiled_realized_service is not None:
+                return compiled_realized_service(scope)
+
+            resolution_count += 1
+
+            # Compile on the next event loop iteration, so the current resolution doesn't pay the compilation cost
+            if resolution_count == self._compilation_threshold:
+                asyncio.get_running_loop().call_soon(compile_realized_service)
+
+            return CallSiteRuntimeResolver.INSTANCE.resolve(call_site, scope)
+
+        return _create_realize_service
@@ -0,0 +1,106 @@
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Final, final, override
+
+from wirio._service_lookup._call_site_kind import CallSiteKind
+from wirio._service_lookup._result_cache import ResultCache
+from wirio._service_lookup._service_call_site import ServiceCallSite
+from wirio._service_lookup._service_identifier import ServiceIdentifier
+from wirio._service_lookup._typed_type import TypedType
+from wirio.factory import Factory
+
+if TYPE_CHECKING:
+    from wirio.service_provider_engine_scope import ServiceProviderEngineScope
+
+
+@final
+class FactoryDelegateCallSite(ServiceCallSite):
+    """Call site of a :class:`Factory` delegate, which resolves the wrapped call site each time it's called."""
+
+    __slots__ = (
+        "_realized_service",
+        "_service_call_site",
+        "_service_identifier",
+        "_service_type",
+    )
+
+    _service_type: Final[TypedType]
+    _service_identifier: Final[ServiceIdentifier]
+    _service_call_site: Final[ServiceCallSite]
+    _realized_service: (
+        tuple[Callable[["ServiceProviderEngineScope"], Awaitable[object | None]], int]
+        | None
+    )
+
+    def __init__(
+        self,
+        result_cache: ResultCache,
+        item_type: TypedType,
+        service_call_site: ServiceCallSite,
+        service_key: object | None = None,
+    ) -> None:
+        self._service_type = TypedType.from_type(Factory[item_type.annotation])
+        self._service_identifier = ServiceIdentifier.from_service_type(
+            service_type=item_type, service_key=service_key
+        )
+        self._service_call_site = service_call_site
+        self._realized_service = None
+        super().__init__(cache=result_cache, key=service_key)
+
+    @property
+    @override
+    def service_type(self) -> TypedType:
+        return self._service_type
+
+    @property
+    @override
+    def kind(self) -> CallSiteKind:
+        return CallSiteKind.FACTORY_DELEGATE
+
+    @property
+    def service_call_site(self) -> ServiceCallSite:
+        """Get the call site of the service the delegate creates."""
+        return self._service_call_site
+
+    @property
+    @override
+    def dependency_call_sites(self) -> list[ServiceCallSite]:
+        return [self._service_call_site]
+
+    @property
+    @override
+    def is_sync_resolvable(self) -> bool:
+        return True
+
+    def create_factory(self, scope: "ServiceProviderEngineScope") -> Factory[object]:
+        """Create a delegate resolving the wrapped service in the given scope."""
+        realized_service = self._realized_service
+
+        # The wrapped call site is realized once, and all the delegates share it
+        if realized_service is None:
+            generation = scope.root_provider.generation
+            realized_service = (
+                scope.root_provider.realize_call_site(self._service_call_site),
+                generation,
+            )
+            self._realized_service = realized_service
+
+        return Factory(
+            scope,
+            realized_service[0],
+            self._service_identifier,
+            realized_service[1],
+            self._update_realized_service,
+        )
+
+    def _update_realized_service(
+        self,
+        realized_service: Callable[
+            ["ServiceProviderEngineScope"], Awaitable[object | None]
+        ],
+        generation: int,
+    ) -> None:
+        # Keep the newest one, so that the next delegates don't look up the accessor again
+        current_realized_service = self._realized_service
+
+        if current_realized_service is None or current_realized_service[1] < generation:
+            self._realized_service = (realized_service, generation)
@@ -0,0 +1,78 @@
+from collections.abc import AsyncGenerator, Generator
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from types import TracebackType
+from typing import Final, Self, final, override
+
+from wirio.exceptions import GeneratorFactoryYieldedSeveralTimesError
+
+
+@final
+class GeneratorFactoryDisposable(AbstractContextManager["GeneratorFactoryDisposable"]):
+    """Wrap a generator factory so that the code after its `yield` runs when the service is disposed."""
+
+    _generator: Final[Generator[object]]
+    _service: object | None
+
+    def __init__(self, generator: Generator[object]) -> None:
+        self._generator = generator
+        self._service = None
+
+    @property
+    def service(self) -> object | None:
+        return self._service
+
+    @override
+    def __enter__(self) -> Self:
+        self._service = next(self._generator)
+        return self
+
+    @override
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool | None:
+        try:
+            next(self._generator)
+        except StopIteration:
+            return None
+
+        raise GeneratorFactoryYieldedSeveralTimesError
+
+
+@final
+class AsyncGeneratorFactoryDisposable(
+    AbstractAsyncContextManager["AsyncGeneratorFactoryDisposable"]
+):
+    """Wrap an async generator factory so that the code after its `yield` runs when the service is disposed."""
+
+    _generator: Final[AsyncGenerator[object]]
+    _service: object | None
+
+    def __init__(self, generator: AsyncGenerator[object]) -> None:
+        self._generator = generator
+        self._service = None
+
+    @property
+    def service(self) -> object | None:
+        return self._service
+
+    @override
+    async def __aenter__(self) -> Self:
+        self._service = await anext(self._generator)
+        return self
+
+    @override
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool | None:
+        try:
+            await anext(self._generator)
+        except StopAsyncIteration:
+            return None
+
+        raise GeneratorFactoryYieldedSeveralTimesError
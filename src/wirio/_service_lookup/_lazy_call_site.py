@@ -0,0 +1,61 @@
+from typing import Final, final, override
+
+from wirio._service_lookup._call_site_kind import CallSiteKind
+from wirio._service_lookup._result_cache import ResultCache
+from wirio._service_lookup._service_call_site import ServiceCallSite
+from wirio._service_lookup._typed_type import TypedType
+from wirio.abstractions.base_service_provider import BaseServiceProvider
+from wirio.lazy import Lazy
+
+
+@final
+class LazyCallSite(ServiceCallSite):
+    """Call site of a :class:`Lazy` handle, which creates the service of the wrapped call site on first use."""
+
+    __slots__ = ("_item_type", "_service_call_site", "_service_type")
+
+    _item_type: Final[TypedType]
+    _service_type: Final[TypedType]
+    _service_call_site: Final[ServiceCallSite]
+
+    def __init__(
+        self,
+        result_cache: ResultCache,
+        item_type: TypedType,
+        service_call_site: ServiceCallSite,
+        service_key: object | None = None,
+    ) -> None:
+        self._item_type = item_type
+        self._service_type = TypedType.from_type(Lazy[item_type.annotation])
+        self._service_call_site = service_call_site
+        super().__init__(cache=result_cache, key=service_key)
+
+    @property
+    @override
+    def service_type(self) -> TypedType:
+        return self._service_type
+
+    @property
+    @override
+    def kind(self) -> CallSiteKind:
+        return CallSiteKind.LAZY
+
+    @property
+    def service_call_site(self) -> ServiceCallSite:
+        """Get the call site of the service the handle resolves."""
+        return self._service_call_site
+
+    @property
+    @override
+    def dependency_call_sites(self) -> list[ServiceCallSite]:
+        # The wrapped service is created after the dependent service, but it's still one of its dependencies
+        return [self._service_call_site]
+
+    @property
+    @override
+    def is_sync_resolvable(self) -> bool:
+        return True
+
+    def create_lazy(self, service_provider: BaseServiceProvider) -> Lazy[object]:
+        """Create a handle resolving the wrapped service from the given scope."""
+        return Lazy(service_provider, self._item_type.annotation, self._key)
@@ -15,6 +15,8 @@ from wirio.service_lifetime import ServiceLifetime
 class ResultCache:
     """Track cached service."""
 
+    __slots__ = ("_key", "_location")
+
     _location: Final[CallSiteResultCacheLocation]
     _key: Final[ServiceCacheKey]
 
@@ -56,3 +58,16 @@ class ResultCache:
     @property
     def key(self) -> ServiceCacheKey:
         return self._key
+
+    @property
+    def lifetime(self) -> ServiceLifetime | None:
+        """Get the lifetime matching the location, or `None` if the result isn't cached."""
+        match self._location:
+            case CallSiteResultCacheLocation.ROOT:
+                return ServiceLifetime.SINGLETON
+            case CallSiteResultCacheLocation.SCOPE:
+                return ServiceLifetime.SCOPED
+            case CallSiteResultCacheLocation.DISPOSE:
+                return ServiceLifetime.TRANSIENT
+            case CallSiteResultCacheLocation.NONE:
+                return None
@@ -0,0 +1,99 @@
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Final, final, override
+
+from wirio._service_lookup._asyncio_reentrant_lock import AsyncioReentrantLock
+from wirio._service_lookup.service_cache_key import ServiceCacheKey
+from wirio.exceptions import ObjectDisposedError
+from wirio.wirio_undefined import WirioUndefined
+
+if TYPE_CHECKING:
+    from wirio._service_lookup._service_call_site import ServiceCallSite
+
+
+@final
+class ScopeState:
+    """Objects holding the state of a scope, that can be reset and reused by a later scope."""
+
+    scoped_services: Final[list[object]]
+    resolved_services: Final[dict[ServiceCacheKey, object | None]]
+    resolved_services_lock: Final[AsyncioReentrantLock]
+    disposables: Final[list[object]]
+    disposable_call_sites: Final[dict[int, "ServiceCallSite"]]
+
+    def __init__(self) -> None:
+        self.scoped_services = []
+        self.resolved_services = {}
+        self.resolved_services_lock = AsyncioReentrantLock()
+        self.disposables = []
+        self.disposable_call_sites = {}
+
+    def reset(self) -> None:
+        # Keep the slots, which the next scope would allocate again
+        self.scoped_services[:] = [WirioUndefined.INSTANCE] * len(self.scoped_services)
+        self.resolved_services.clear()
+        self.disposables.clear()
+        self.disposable_call_sites.clear()
+
+
+@final
+class _DetachedResolvedServices(dict[ServiceCacheKey, object | None]):
+    """Resolved services of a disposed scope whose state was returned to the pool.
+
+    It's always empty and rejects new services, so that coroutines still using the disposed scope can't see or store
+    services of the scope reusing its state.
+    """
+
+    @override
+    def __setitem__(self, key: ServiceCacheKey, value: object | None) -> None:
+        raise ObjectDisposedError
+
+
+@final
+class _DetachedScopedServices(list[object]):
+    """Scoped services of a disposed scope whose state was returned to the pool, which are always empty like :class:`_DetachedResolvedServices`."""
+
+    @override
+    def extend(self, iterable: Iterable[object], /) -> None:
+        raise ObjectDisposedError
+
+
+DETACHED_SCOPED_SERVICES: Final[list[object]] = _DetachedScopedServices()
+DETACHED_RESOLVED_SERVICES: Final[dict[ServiceCacheKey, object | None]] = (
+    _DetachedResolvedServices()
+)
+
+
+@final
+class ScopeStatePool:
+    """Pool of scope states, to avoid allocating them for every scope at high request rates."""
+
+    _states: Final[list[ScopeState]]
+    _max_size: Final[int]
+
+    def __init__(self, max_size: int) -> None:
+        self._states = []
+        self._max_size = max_size
+
+    @property
+    def size(self) -> int:
+        """Get the number of states ready to be reused."""
+        return len(self._states)
+
+    def rent(self) -> ScopeState:
+        """Get a reset state from the pool, or a new one when the pool is empty."""
+        if len(self._states) > 0:
+            return self._states.pop()
+
+        return ScopeState()
+
+    def give_back(self, state: ScopeState) -> None:
+        """Reset the state and keep it to be reused, unless the pool is full or a coroutine might still be using it."""
+        # A coroutine holding or waiting for the lock might still read or write the previous services
+        if (
+            len(self._states) >= self._max_size
+            or not state.resolved_services_lock.is_idle
+        ):
+            return
+
+        state.reset()
+        self._states.append(state)
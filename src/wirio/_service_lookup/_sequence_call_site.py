@@ -1,5 +1,5 @@
 from collections.abc import Sequence
-from typing import Final, final
+from typing import Final, final, override
 
 from wirio._service_lookup._call_site_kind import CallSiteKind
 from wirio._service_lookup._result_cache import ResultCache
@@ -9,8 +9,11 @@ from wirio._service_lookup._typed_type import TypedType
 
 @final
 class SequenceCallSite(ServiceCallSite):
+    __slots__ = ("_is_sync_resolvable", "_item_type", "_service_call_sites")
+
     _item_type: Final[TypedType]
     _service_call_sites: Final[list[ServiceCallSite]]
+    _is_sync_resolvable: Final[bool]
 
     def __init__(
         self,
@@ -21,6 +24,10 @@ class SequenceCallSite(ServiceCallSite):
     ) -> None:
         self._item_type = item_type
         self._service_call_sites = service_call_sites
+        self._is_sync_resolvable = all(
+            service_call_site.is_sync_resolvable
+            for service_call_site in service_call_sites
+        )
         super().__init__(cache=result_cache, key=service_key)
 
     @property
@@ -35,3 +42,18 @@ class SequenceCallSite(ServiceCallSite):
     @property
     def service_call_sites(self) -> list[ServiceCallSite]:
         return self._service_call_sites
+
+    @property
+    @override
+    def dependency_call_sites(self) -> list[ServiceCallSite]:
+        return self._service_call_sites
+
+    @property
+    @override
+    def is_sync_resolvable(self) -> bool:
+        return self._is_sync_resolvable
+
+    @property
+    @override
+    def is_sync_creatable(self) -> bool:
+        return True
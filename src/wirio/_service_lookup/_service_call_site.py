@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from wirio._service_lookup._asyncio_reentrant_lock import AsyncioReentrantLock
 from wirio._service_lookup._call_site_kind import CallSiteKind
@@ -9,10 +10,13 @@ from wirio._service_lookup._typed_type import TypedType
 class ServiceCallSite(ABC):
     """Representation of how a service must be created."""
 
+    __slots__ = ("_cache", "_key", "_lock", "_scope_slot", "_value")
+
     _cache: ResultCache
     _value: object | None
     _key: object | None
-    _lock: AsyncioReentrantLock
+    _lock: AsyncioReentrantLock | None
+    _scope_slot: int | None
 
     def __init__(
         self, cache: ResultCache, key: object | None, value: object | None = None
@@ -20,7 +24,8 @@ class ServiceCallSite(ABC):
         self._cache = cache
         self._key = key
         self._value = value
-        self._lock = AsyncioReentrantLock()
+        self._lock = None
+        self._scope_slot = None
 
     @property
     def cache(self) -> ResultCache:
@@ -38,8 +43,24 @@ class ServiceCallSite(ABC):
     def value(self, value: object | None) -> None:
         self._value = value
 
+    @property
+    def scope_slot(self) -> int | None:
+        """Get the index where scopes store the service, for call sites cached in the scope.
+
+        It's `None` for call sites that weren't built by the :class:`CallSiteFactory`, which scopes store by cache key.
+        """
+        return self._scope_slot
+
+    @scope_slot.setter
+    def scope_slot(self, scope_slot: int | None) -> None:
+        self._scope_slot = scope_slot
+
     @property
     def lock(self) -> AsyncioReentrantLock:
+        # Only call sites cached in the root scope use it, so it's created on first use
+        if self._lock is None:
+            self._lock = AsyncioReentrantLock()
+
         return self._lock
 
     @property
@@ -49,3 +70,18 @@ class ServiceCallSite(ABC):
     @property
     @abstractmethod
     def kind(self) -> CallSiteKind: ...
+
+    @property
+    def dependency_call_sites(self) -> Sequence["ServiceCallSite"]:
+        """Get the call sites of the services this service depends on."""
+        return ()
+
+    @property
+    @abstractmethod
+    def is_sync_resolvable(self) -> bool:
+        """Indicate whether the service and its dependencies can be created without awaiting."""
+
+    @property
+    def is_sync_creatable(self) -> bool:
+        """Indicate whether the service can be created without awaiting once its dependencies are resolved."""
+        return self.is_sync_resolvable
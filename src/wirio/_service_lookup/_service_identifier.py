@@ -1,9 +1,11 @@
 from collections.abc import Hashable
 from typing import (
+    ClassVar,
     Final,
     final,
     override,
 )
+from weakref import WeakValueDictionary
 
 from wirio._service_lookup._typed_type import TypedType
 from wirio.service_descriptor import ServiceDescriptor
@@ -13,12 +15,20 @@ from wirio.service_descriptor import ServiceDescriptor
 class ServiceIdentifier(Hashable):
     """Internal registered service during resolution."""
 
+    __slots__ = ("__weakref__", "_hash", "_service_key", "_service_type")
+
+    _interned: ClassVar[
+        WeakValueDictionary[tuple[object | None, TypedType], "ServiceIdentifier"]
+    ] = WeakValueDictionary()
+
     _service_key: Final[object | None]
     _service_type: Final[TypedType]
+    _hash: int | None
 
     def __init__(self, service_key: object | None, service_type: TypedType) -> None:
         self._service_key = service_key
         self._service_type = service_type
+        self._hash = None
 
     @property
     def service_key(self) -> object | None:
@@ -32,26 +42,46 @@ class ServiceIdentifier(Hashable):
     def from_service_type(
         cls, service_type: TypedType, service_key: object | None = None
     ) -> "ServiceIdentifier":
-        return cls(service_key=service_key, service_type=service_type)
+        # Resolving the same service returns the same instance, so its hash is only computed
+        # once and equality checks in dictionaries are resolved by identity
+        interning_key = (service_key, service_type)
+
+        try:
+            service_identifier = cls._interned.get(interning_key)
+        except TypeError:
+            # Unhashable service keys can't be interned
+            return cls(service_key=service_key, service_type=service_type)
+
+        if service_identifier is None:
+            service_identifier = cls(service_key=service_key, service_type=service_type)
+            cls._interned[interning_key] = service_identifier
+
+        return service_identifier
 
     @classmethod
     def from_descriptor(
         cls, service_descriptor: ServiceDescriptor
     ) -> "ServiceIdentifier":
-        return cls(
-            service_key=service_descriptor.service_key,
+        return cls.from_service_type(
             service_type=service_descriptor.service_type,
+            service_key=service_descriptor.service_key,
         )
 
     @override
     def __hash__(self) -> int:
-        if self.service_key is None:
-            return hash(self._service_type)
+        if self._hash is None:
+            if self._service_key is None:
+                self._hash = hash(self._service_type)
+            else:
+                self._hash = (hash(self._service_type) * 397) ^ hash(self._service_key)
 
-        return (hash(self._service_type) * 397) ^ hash(self._service_key)
+        return self._hash
 
     @override
     def __eq__(self, value: object) -> bool:
+        if self is value:
+            return True
+
         if not isinstance(value, ServiceIdentifier):
             return NotImplemented
 
@@ -9,6 +9,8 @@ from wirio.abstractions.base_service_provider import BaseServiceProvider
 
 @final
 class ServiceProviderCallSite(ServiceCallSite):
+    __slots__ = ("_service_type",)
+
     _service_type: Final[TypedType]
 
     def __init__(self) -> None:
@@ -26,3 +28,8 @@ class ServiceProviderCallSite(ServiceCallSite):
     @override
     def kind(self) -> CallSiteKind:
         return CallSiteKind.SERVICE_PROVIDER
+
+    @property
+    @override
+    def is_sync_resolvable(self) -> bool:
+        return True
@@ -1,18 +1,34 @@
+import inspect
 from collections.abc import Callable
 from functools import partial
 from typing import Final, final, override
 
 from wirio._service_lookup._call_site_kind import CallSiteKind
+from wirio._service_lookup._parameter_information import (
+    ParameterInformation,
+)
 from wirio._service_lookup._result_cache import ResultCache
 from wirio._service_lookup._service_call_site import ServiceCallSite
+from wirio._service_lookup._supports_async_context_manager import (
+    SupportsAsyncContextManager,
+)
 from wirio._service_lookup._typed_type import TypedType
 from wirio.wirio_undefined import WirioUndefined
 
 
 @final
 class SyncFactoryCallSite(ServiceCallSite):
+    __slots__ = (
+        "_implementation_factory",
+        "_parameter_call_sites",
+        "_parameters",
+        "_service_type",
+    )
+
     _service_type: Final[TypedType]
     _implementation_factory: Callable[..., object]
+    _parameters: list[ParameterInformation]
+    _parameter_call_sites: list[ServiceCallSite | None]
 
     def __init__(
         self,
@@ -31,21 +47,31 @@ class SyncFactoryCallSite(ServiceCallSite):
         cache: ResultCache,
         service_type: TypedType,
         implementation_factory: Callable[..., object],
+        *,
+        parameters: list[ParameterInformation],
+        parameter_call_sites: list[ServiceCallSite | None],
     ) -> "SyncFactoryCallSite":
         self = cls(cache=cache, service_type=service_type)
         self._implementation_factory = implementation_factory
+        self._parameters = parameters
+        self._parameter_call_sites = parameter_call_sites
         return self
 
     @classmethod
-    def from_keyed_implementation_factory(
+    def from_keyed_implementation_factory(  # noqa: PLR0913
         cls,
         cache: ResultCache,
         service_type: TypedType,
         implementation_factory: Callable[..., object],
         service_key: object | None,
+        *,
+        parameters: list[ParameterInformation],
+        parameter_call_sites: list[ServiceCallSite | None],
     ) -> "SyncFactoryCallSite":
         self = cls(cache=cache, service_type=service_type, service_key=service_key)
         self._implementation_factory = partial(implementation_factory, service_key)
+        self._parameters = parameters
+        self._parameter_call_sites = parameter_call_sites
         return self
 
     @property
@@ -61,3 +87,42 @@ class SyncFactoryCallSite(ServiceCallSite):
     @property
     def implementation_factory(self) -> Callable[..., object]:
         return self._implementation_factory
+
+    @property
+    def parameters(self) -> list[ParameterInformation]:
+        return self._parameters
+
+    @property
+    def parameter_call_sites(self) -> list[ServiceCallSite | None]:
+        return self._parameter_call_sites
+
+    @property
+    @override
+    def dependency_call_sites(self) -> list[ServiceCallSite]:
+        return [
+            parameter_call_site
+            for parameter_call_site in self._parameter_call_sites
+            if parameter_call_site is not None
+        ]
+
+    @property
+    @override
+    def is_sync_resolvable(self) -> bool:
+        return self.is_sync_creatable and all(
+            parameter_call_site is not None and parameter_call_site.is_sync_resolvable
+            for parameter_call_site in self._parameter_call_sites
+        )
+
+    @property
+    @override
+    def is_sync_creatable(self) -> bool:
+        # Parameters without call site are looked up when resolving the service, which requires awaiting
+        if None in self._parameter_call_sites:
+            return False
+
+        # Async context managers are entered right after being created
+        service_type = self._service_type.to_type()
+        return not (
+            inspect.isclass(service_type)
+            and issubclass(service_type, SupportsAsyncContextManager)
+        )
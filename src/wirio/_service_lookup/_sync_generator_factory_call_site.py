@@ -3,6 +3,9 @@ from functools import partial
 from typing import Final, final, override
 
 from wirio._service_lookup._call_site_kind import CallSiteKind
+from wirio._service_lookup._parameter_information import (
+    ParameterInformation,
+)
 from wirio._service_lookup._result_cache import ResultCache
 from wirio._service_lookup._service_call_site import ServiceCallSite
 from wirio._service_lookup._typed_type import TypedType
@@ -11,8 +14,17 @@ from wirio.wirio_undefined import WirioUndefined
 
 @final
 class SyncGeneratorFactoryCallSite(ServiceCallSite):
+    __slots__ = (
+        "_implementation_factory",
+        "_parameter_call_sites",
+        "_parameters",
+        "_service_type",
+    )
+
     _service_type: Final[TypedType]
     _implementation_factory: Callable[..., Generator[object]]
+    _parameters: list[ParameterInformation]
+    _parameter_call_sites: list[ServiceCallSite | None]
 
     def __init__(
         self,
@@ -31,21 +43,31 @@ class SyncGeneratorFactoryCallSite(ServiceCallSite):
         cache: ResultCache,
         service_type: TypedType,
         implementation_factory: Callable[..., Generator[object]],
+        *,
+        parameters: list[ParameterInformation],
+        parameter_call_sites: list[ServiceCallSite | None],
     ) -> "SyncGeneratorFactoryCallSite":
         self = cls(cache=cache, service_type=service_type)
         self._implementation_factory = implementation_factory
+        self._parameters = parameters
+        self._parameter_call_sites = parameter_call_sites
         return self
 
     @classmethod
-    def from_keyed_implementation_factory(
+    def from_keyed_implementation_factory(  # noqa: PLR0913
         cls,
         cache: ResultCache,
         service_type: TypedType,
         implementation_factory: Callable[..., Generator[object]],
         service_key: object | None,
+        *,
+        parameters: list[ParameterInformation],
+        parameter_call_sites: list[ServiceCallSite | None],
     ) -> "SyncGeneratorFactoryCallSite":
         self = cls(cache=cache, service_type=service_type, service_key=service_key)
         self._implementation_factory = partial(implementation_factory, service_key)
+        self._parameters = parameters
+        self._parameter_call_sites = parameter_call_sites
         return self
 
     @property
@@ -63,3 +85,34 @@ class SyncGeneratorFactoryCallSite(ServiceCallSite):
         self,
     ) -> Callable[..., Generator[object]]:
         return self._implementation_factory
+
+    @property
+    def parameters(self) -> list[ParameterInformation]:
+        return self._parameters
+
+    @property
+    def parameter_call_sites(self) -> list[ServiceCallSite | None]:
+        return self._parameter_call_sites
+
+    @property
+    @override
+    def dependency_call_sites(self) -> list[ServiceCallSite]:
+        return [
+            parameter_call_site
+            for parameter_call_site in self._parameter_call_sites
+            if parameter_call_site is not None
+        ]
+
+    @property
+    @override
+    def is_sync_resolvable(self) -> bool:
+        return self.is_sync_creatable and all(
+            parameter_call_site is not None and parameter_call_site.is_sync_resolvable
+            for parameter_call_site in self._parameter_call_sites
+        )
+
+    @property
+    @override
+    def is_sync_creatable(self) -> bool:
+        # Parameters without call site are looked up when resolving the service, which requires awaiting
+        return None not in self._parameter_call_sites
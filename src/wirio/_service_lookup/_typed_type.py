@@ -4,22 +4,29 @@ from collections.abc import (
     Mapping,
     Sequence,
 )
-from typing import Any, Final, final, override
+from typing import Any, ClassVar, Final, final, override
+from weakref import WeakValueDictionary
 
 
 @final
 class TypedType(Hashable):
     """Version of :class:`type` that takes into account generic parameters."""
 
+    __slots__ = ("__weakref__", "_annotation", "_args", "_hash", "_origin")
+
+    _interned: ClassVar[WeakValueDictionary[Any, "TypedType"]] = WeakValueDictionary()
+
     _annotation: Final[Any]
     _origin: Final[Any]
     _args: Final[tuple[Any, ...]]
+    _hash: int | None
 
     def __init__(
         self,
         annotation: Any,  # noqa: ANN401
     ) -> None:
         self._annotation = annotation
+        self._hash = None
         origin = typing.get_origin(annotation)
         has_generics = origin is not None
 
@@ -33,7 +40,7 @@ class TypedType(Hashable):
 
     @classmethod
     def from_type(cls, type_: type) -> "TypedType":
-        return cls(type_)
+        return cls._intern(type_)
 
     @classmethod
     def from_instance(cls, instance: object) -> "TypedType":
@@ -43,7 +50,26 @@ class TypedType(Hashable):
             error_message = "The instance does not retain type hint information because it has no generics"
             raise ValueError(error_message)
 
-        return cls(instance_type)
+        return cls._intern(instance_type)
+
+    @classmethod
+    def _intern(
+        cls,
+        annotation: Any,  # noqa: ANN401
+    ) -> "TypedType":
+        # Resolving the same type returns the same instance, so it's only inspected once and
+        # equality checks in dictionaries are resolved by identity
+        try:
+            typed_type = cls._interned.get(annotation)
+        except TypeError:
+            # Annotations with unhashable arguments can't be interned
+            return cls(annotation)
+
+        if typed_type is None:
+            typed_type = cls(annotation)
+            cls._interned[annotation] = typed_type
+
+        return typed_type
 
     @property
     def annotation(
@@ -99,11 +125,11 @@ class TypedType(Hashable):
             error_message = "The current type is not a constructed generic type"
             raise RuntimeError(error_message)
 
-        return TypedType(self._origin)
+        return TypedType._intern(self._origin)
 
     def generic_type_arguments(self) -> list["TypedType"]:
         """Get an list of the generic type arguments for this type."""
-        return [TypedType(argument) for argument in self._args]
+        return [TypedType._intern(argument) for argument in self._args]
 
     def _create_representation(
         self,
@@ -139,10 +165,17 @@ class TypedType(Hashable):
 
     @override
     def __hash__(self) -> int:
-        return hash(self._origin) ^ hash(self._args)
+        # Computed on first use because some generic arguments aren't hashable
+        if self._hash is None:
+            self._hash = hash(self._origin) ^ hash(self._args)
+
+        return self._hash
 
     @override
     def __eq__(self, value: object) -> bool:
+        if self is value:
+            return True
+
         if not isinstance(value, TypedType):
             return NotImplemented
 
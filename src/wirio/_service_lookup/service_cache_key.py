@@ -8,12 +8,16 @@ from wirio._service_lookup._service_identifier import (
 
 @final
 class ServiceCacheKey(Hashable):
+    __slots__ = ("_hash", "_service_identifier", "_slot")
+
     _service_identifier: Final[ServiceIdentifier]
     _slot: Final[int]
+    _hash: int | None
 
     def __init__(self, service_identifier: ServiceIdentifier, slot: int) -> None:
         self._service_identifier = service_identifier
         self._slot = slot
+        self._hash = None
 
     @property
     def service_identifier(self) -> ServiceIdentifier:
@@ -25,10 +29,16 @@ class ServiceCacheKey(Hashable):
 
     @override
     def __hash__(self) -> int:
-        return (hash(self._service_identifier) * 397) ^ self._slot
+        if self._hash is None:
+            self._hash = (hash(self._service_identifier) * 397) ^ self._slot
+
+        return self._hash
 
     @override
     def __eq__(self, value: object) -> bool:
+        if self is value:
+            return True
+
         if not isinstance(value, ServiceCacheKey):
             return NotImplemented
 
@@ -33,6 +33,20 @@ class ServiceScope(AbstractAsyncContextManager["ServiceScope"], ABC):
         """Get service of type `TService` or raise :class:`NoServiceRegisteredError`."""
         ...
 
+    @abstractmethod
+    def get_service_sync[TService](
+        self, service_type: type[TService]
+    ) -> TService | None:
+        """Get service of type `TService` synchronously or return `None`."""
+        ...
+
+    @abstractmethod
+    def get_required_service_sync[TService](
+        self, service_type: type[TService]
+    ) -> TService:
+        """Get service of type `TService` synchronously or raise :class:`NoServiceRegisteredError`."""
+        ...
+
     @abstractmethod
     async def get_keyed_service[TService](
         self, service_key: object | None, service_type: type[TService]
@@ -60,3 +74,10 @@ class ServiceScope(AbstractAsyncContextManager["ServiceScope"], ABC):
     ) -> Sequence[TService]:
         """Get all services of type `TService`."""
         ...
+
+    @abstractmethod
+    async def get_services_batch(
+        self, service_requests: Sequence[type | tuple[object | None, type]]
+    ) -> tuple[object | None, ...]:
+        """Get several services at once, or `None` for the ones not registered."""
+        ...
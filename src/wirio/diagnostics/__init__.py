@@ -0,0 +1,24 @@
+from .diagnostic_events import (
+    CallSiteBuiltEvent,
+    ScopeCreatedEvent,
+    ScopeDisposedEvent,
+    ServiceProviderBuiltEvent,
+    ServiceRealizedEvent,
+    SingletonActivatedEvent,
+    SlowDisposalEvent,
+)
+from .diagnostic_listener import DiagnosticListener
+from .startup_profiler import StartupProfiler, StartupProfileSpan
+
+__all__ = [
+    "CallSiteBuiltEvent",
+    "DiagnosticListener",
+    "ScopeCreatedEvent",
+    "ScopeDisposedEvent",
+    "ServiceProviderBuiltEvent",
+    "ServiceRealizedEvent",
+    "SingletonActivatedEvent",
+    "SlowDisposalEvent",
+    "StartupProfileSpan",
+    "StartupProfiler",
+]
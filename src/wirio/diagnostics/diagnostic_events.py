@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+from typing import final
+
+from wirio._service_lookup._typed_type import TypedType
+from wirio.abstractions.service_scope import ServiceScope
+from wirio.service_lifetime import ServiceLifetime
+from wirio.service_provider_mode import ServiceProviderMode
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class CallSiteBuiltEvent:
+    """Event emitted when the call site describing how to create a service is built.
+
+    `duration` is the time, in seconds, spent building it, including the call sites of its dependencies.
+    """
+
+    service_type: TypedType
+    service_key: object | None
+    lifetime: ServiceLifetime | None
+    duration: float
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class ServiceRealizedEvent:
+    """Event emitted when a service is created.
+
+    `lifetime` is `None` for services that aren't cached, like constants and sequences of services.
+    `duration` is the time, in seconds, spent creating it, including the creation of its dependencies.
+    """
+
+    service_type: TypedType
+    service_key: object | None
+    lifetime: ServiceLifetime | None
+    duration: float
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class SingletonActivatedEvent:
+    """Event emitted when a singleton registered with `auto_activate=True` is activated while building the service provider.
+
+    `duration` is the time, in seconds, spent activating it, including the dependencies that weren't created yet.
+    """
+
+    service_type: TypedType
+    service_key: object | None
+    duration: float
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class ScopeCreatedEvent:
+    """Event emitted when a scope is created."""
+
+    scope: ServiceScope
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class ScopeDisposedEvent:
+    """Event emitted when a scope is disposed.
+
+    `duration` is the time, in seconds, spent disposing its `disposables_count` services.
+    """
+
+    scope: ServiceScope
+    disposables_count: int
+    duration: float
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class SlowDisposalEvent:
+    """Event emitted when disposing a service takes longer than the `dispose_timeout` of the service provider.
+
+    Async context managers are cancelled when the timeout expires, so `duration` is close to it. Sync ones can't be cancelled.
+    """
+
+    scope: ServiceScope
+    service_type: TypedType
+    duration: float
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class ServiceProviderBuiltEvent:
+    """Event emitted when a service provider is built.
+
+    `duration` is the time, in seconds, spent activating and validating its `descriptors_count` descriptors.
+    `mode` is the mode used to resolve services, which is always `RUNTIME` when a diagnostic listener is set.
+    """
+
+    descriptors_count: int
+    duration: float
+    mode: ServiceProviderMode
@@ -0,0 +1,37 @@
+from wirio.diagnostics.diagnostic_events import (
+    CallSiteBuiltEvent,
+    ScopeCreatedEvent,
+    ScopeDisposedEvent,
+    ServiceProviderBuiltEvent,
+    ServiceRealizedEvent,
+    SingletonActivatedEvent,
+    SlowDisposalEvent,
+)
+
+
+class DiagnosticListener:
+    """Listener of the events emitted by a :class:`ServiceProvider`, to observe the container at runtime.
+
+    Override the methods of the events to listen to. They're called synchronously, so they should return quickly.
+    """
+
+    def on_call_site_built(self, event: CallSiteBuiltEvent) -> None:
+        """Handle the event emitted when the call site of a service is built."""
+
+    def on_service_realized(self, event: ServiceRealizedEvent) -> None:
+        """Handle the event emitted when a service is created."""
+
+    def on_singleton_activated(self, event: SingletonActivatedEvent) -> None:
+        """Handle the event emitted when an auto-activated singleton is activated."""
+
+    def on_scope_created(self, event: ScopeCreatedEvent) -> None:
+        """Handle the event emitted when a scope is created."""
+
+    def on_scope_disposed(self, event: ScopeDisposedEvent) -> None:
+        """Handle the event emitted when a scope is disposed."""
+
+    def on_slow_disposal(self, event: SlowDisposalEvent) -> None:
+        """Handle the event emitted when disposing a service takes longer than the dispose timeout."""
+
+    def on_service_provider_built(self, event: ServiceProviderBuiltEvent) -> None:
+        """Handle the event emitted when a service provider is built."""
@@ -0,0 +1,234 @@
+import asyncio
+import os
+import sys
+import time
+from collections.abc import Generator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import ClassVar, Final, Self, final
+
+_current_startup_profiler: Final[ContextVar["StartupProfiler | None"]] = ContextVar(
+    "_current_startup_profiler", default=None
+)
+_NOT_PROFILING: Final[AbstractContextManager[None]] = nullcontext()
+_MAIN_TRACK: Final = "main"
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class StartupProfileSpan:
+    """Time spent in a startup step, like resolving the type hints of a type or building the call site of a service.
+
+    `started_at` and `duration` are in seconds, `started_at` being relative to when profiling started. `duration`
+    includes the steps nested in it. `track` is the name of the task the step ran in, or `"main"` outside tasks.
+    """
+
+    category: str
+    name: str
+    started_at: float
+    duration: float
+    track: str
+
+
+@final
+class StartupProfiler(AbstractContextManager["StartupProfiler"]):
+    """Profiler recording where the time goes while services are registered and the service provider is built.
+
+    Use it as a context manager around the startup code, or set the `WIRIO_STARTUP_PROFILE` environment variable to
+    the path of a file. In that case, profiling starts when the first :class:`ServiceCollection` is created and stops
+    when its service provider is built, printing a table of the slowest steps to stderr and writing a trace to the
+    file. Traces use the Chrome trace event format, which speedscope and Perfetto can open.
+    """
+
+    ENVIRONMENT_VARIABLE: ClassVar[str] = "WIRIO_STARTUP_PROFILE"
+
+    _spans: Final[list[StartupProfileSpan]]
+    _started_at: float
+    _is_running: bool
+    _token: Token["StartupProfiler | None"] | None
+
+    def __init__(self) -> None:
+        self._spans = []
+        self._started_at = 0.0
+        self._is_running = False
+        self._token = None
+
+    @property
+    def spans(self) -> list[StartupProfileSpan]:
+        """Get the recorded steps, in the order they finished."""
+        return self._spans
+
+    @property
+    def is_running(self) -> bool:
+        return self._is_running
+
+    @classmethod
+    def get_current(cls) -> "StartupProfiler | None":
+        """Get the profiler recording the startup steps of the current context, if any."""
+        return _current_startup_profiler.get()
+
+    @classmethod
+    def start_from_environment(cls) -> None:
+        """Start profiling if the environment variable is set and no profiler is running already."""
+        if cls.ENVIRONMENT_VARIABLE not in os.environ or cls.get_current() is not None:
+            return
+
+        cls().start()
+
+    @classmethod
+    def stop_from_environment(cls) -> None:
+        """Stop the profiler started from the environment variable, and report what it recorded."""
+        startup_profiler = cls.get_current()
+        output_path = os.environ.get(cls.ENVIRONMENT_VARIABLE)
+
+        if (
+            startup_profiler is None
+            or startup_profiler._token is not None  # noqa: SLF001
+            or not startup_profiler.is_running
+            or output_path is None
+        ):
+            return
+
+        startup_profiler.stop()
+        sys.stderr.write(startup_profiler.format_table())
+        startup_profiler.write_trace(output_path)
+
+    def start(self) -> None:
+        """Record the startup steps of the current context from now on."""
+        self._start_recording()
+        _current_startup_profiler.set(self)
+
+    def stop(self) -> None:
+        """Stop recording startup steps."""
+        self._is_running = False
+
+    @contextmanager
+    def record(self, category: str, subject: object) -> Generator[None]:
+        """Record the time spent in the startup step of the given category about the subject, like a type or a path."""
+        started_at = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            if self._is_running:
+                self._spans.append(
+                    StartupProfileSpan(
+                        category=category,
+                        name=_get_subject_name(subject),
+                        started_at=started_at - self._started_at,
+                        duration=time.perf_counter() - started_at,
+                        track=_get_current_track(),
+                    )
+                )
+
+    def format_table(self, limit: int | None = None) -> str:
+        """Format the recorded steps as a table, from the slowest to the fastest."""
+        spans = sorted(self._spans, key=lambda span: span.duration, reverse=True)[
+            :limit
+        ]
+        rows = [
+            ("Duration (ms)", "Category", "Name"),
+            *(
+                (f"{span.duration * 1000:.3f}", span.category, span.name)
+                for span in spans
+            ),
+        ]
+        duration_width = max(len(row[0]) for row in rows)
+        category_width = max(len(row[1]) for row in rows)
+        return "".join(
+            f"{duration:>{duration_width}}  {category:<{category_width}}  {name}\n"
+            for duration, category, name in rows
+        )
+
+    def to_trace(self) -> dict[str, object]:
+        """Convert the recorded steps to the Chrome trace event format."""
+        process_id = os.getpid()
+        track_ids: dict[str, int] = {}
+        events: list[dict[str, object]] = []
+
+        for span in self._spans:
+            track_id = track_ids.setdefault(span.track, len(track_ids))
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": span.started_at * 1_000_000,
+                    "dur": span.duration * 1_000_000,
+                    "pid": process_id,
+                    "tid": track_id,
+                }
+            )
+
+        events.extend(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": process_id,
+                "tid": track_id,
+                "args": {"name": track},
+            }
+            for track, track_id in track_ids.items()
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path: Path | str) -> None:
+        """Write the recorded steps to a file in the Chrome trace event format."""
+        import json  # noqa: PLC0415
+
+        Path(path).write_text(json.dumps(self.to_trace()), encoding="utf-8")
+
+    def __enter__(self) -> Self:
+        self._start_recording()
+        self._token = _current_startup_profiler.set(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+        if self._token is not None:
+            _current_startup_profiler.reset(self._token)
+            self._token = None
+
+    def _start_recording(self) -> None:
+        self._started_at = time.perf_counter()
+        self._is_running = True
+
+
+def profile_startup(category: str, subject: object) -> AbstractContextManager[None]:
+    """Record the time spent in a startup step if a :class:`StartupProfiler` is running, and do nothing otherwise."""
+    startup_profiler = _current_startup_profiler.get()
+
+    if startup_profiler is None or not startup_profiler.is_running:
+        return _NOT_PROFILING
+
+    return startup_profiler.record(category, subject)
+
+
+def _get_subject_name(subject: object) -> str:
+    if isinstance(subject, str):
+        return subject
+
+    qualified_name = getattr(subject, "__qualname__", None)
+
+    if isinstance(qualified_name, str):
+        return f"{getattr(subject, '__module__', '')}.{qualified_name}"
+
+    return str(subject)
+
+
+def _get_current_track() -> str:
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        return _MAIN_TRACK
+
+    return _MAIN_TRACK if task is None else task.get_name()
@@ -180,6 +180,24 @@ class ServiceContainerNotBuiltError(WirioError):
         super().__init__(message)
 
 
+@final
+class ServiceNotSyncResolvableError(WirioError):
+    """The exception that is thrown when a service can't be resolved synchronously."""
+
+    def __init__(self, service_type: TypedType) -> None:
+        message = f"Unable to resolve service for type '{service_type}' synchronously because it requires an async implementation factory, an async context manager or a service that is being created by another coroutine"
+        super().__init__(message)
+
+
+@final
+class ServiceProviderNotInitializedError(WirioError):
+    """The exception that is thrown when resolving a service synchronously while the service provider isn't initialized."""
+
+    def __init__(self, service_type: TypedType) -> None:
+        message = f"Unable to resolve service for type '{service_type}' synchronously because the service provider isn't initialized. Await its initialization or use 'async with' on it first"
+        super().__init__(message)
+
+
 @final
 class GeneratorFactoryYieldedSeveralTimesError(WirioError):
     """The exception that is thrown when a generator factory yields multiple times."""
@@ -187,3 +205,21 @@ class GeneratorFactoryYieldedSeveralTimesError(WirioError):
     def __init__(self) -> None:
         message = "Generator factory must yield exactly one service instance"
         super().__init__(message)
+
+
+@final
+class DisposeTimeoutError(WirioError):
+    """The exception that is thrown when disposing a service takes longer than the dispose timeout."""
+
+    def __init__(self, service_type: TypedType, dispose_timeout: float) -> None:
+        message = f"Disposing service of type '{service_type}' took longer than {dispose_timeout} seconds"
+        super().__init__(message)
+
+
+@final
+class ServiceProviderFrozenError(WirioError):
+    """The exception that is thrown when registering a service after the service provider has been frozen."""
+
+    def __init__(self, service_type: TypedType) -> None:
+        message = f"Unable to register service for type '{service_type}' because the service provider is frozen"
+        super().__init__(message)
@@ -0,0 +1,77 @@
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Final, cast, final
+
+from wirio.exceptions import ObjectDisposedError
+
+if TYPE_CHECKING:
+    from wirio._service_lookup._service_identifier import ServiceIdentifier
+    from wirio.service_provider_engine_scope import ServiceProviderEngineScope
+
+
+@final
+class Factory[TService]:
+    """Delegate creating a service each time it's called, without looking it up in the service provider.
+
+    Depend on `Factory[TService]` instead of calling `get_required_service` in a loop when many services of the same
+    type are created, like a handler per message. The delegate is bound to the call site of the service when the
+    dependent service is built, so calling it only runs the resolution of that call site in the scope the dependent
+    service was resolved from.
+    """
+
+    __slots__ = (
+        "_generation",
+        "_on_realized_service_changed",
+        "_realized_service",
+        "_scope",
+        "_service_identifier",
+    )
+
+    _scope: Final["ServiceProviderEngineScope"]
+    _service_identifier: Final["ServiceIdentifier"]
+    _realized_service: Callable[
+        ["ServiceProviderEngineScope"], Awaitable[object | None]
+    ]
+    _generation: int
+    _on_realized_service_changed: Final[
+        Callable[
+            [Callable[["ServiceProviderEngineScope"], Awaitable[object | None]], int],
+            None,
+        ]
+    ]
+
+    def __init__(
+        self,
+        scope: "ServiceProviderEngineScope",
+        realized_service: Callable[
+            ["ServiceProviderEngineScope"], Awaitable[object | None]
+        ],
+        service_identifier: "ServiceIdentifier",
+        generation: int,
+        on_realized_service_changed: Callable[
+            [Callable[["ServiceProviderEngineScope"], Awaitable[object | None]], int],
+            None,
+        ],
+    ) -> None:
+        self._scope = scope
+        self._realized_service = realized_service
+        self._service_identifier = service_identifier
+        self._generation = generation
+        self._on_realized_service_changed = on_realized_service_changed
+
+    async def __call__(self) -> TService:
+        """Resolve the service, which is a new instance for transient services."""
+        if self._scope.is_disposed:
+            raise ObjectDisposedError
+
+        root_provider = self._scope.root_provider
+
+        # Services registered or overridden since the delegate was bound might have replaced its call site
+        if self._generation != root_provider.generation:
+            generation = root_provider.generation
+            self._realized_service = await root_provider.get_realized_service(
+                self._service_identifier
+            )
+            self._generation = generation
+            self._on_realized_service_changed(self._realized_service, generation)
+
+        return cast("TService", await self._realized_service(self._scope))
@@ -3,3 +3,4 @@ from enum import StrEnum
 
 class EnvironmentVariable(StrEnum):
     WIRIO_ENVIRONMENT = "WIRIO_ENVIRONMENT"
+    WIRIO_CONTENT_ROOT_PATH = "WIRIO_CONTENT_ROOT_PATH"
@@ -6,6 +6,8 @@ from wirio._content_root_path_resolver import ContentRootPathResolver
 from wirio.hosting._environment_variable import EnvironmentVariable
 from wirio.hosting.environment import Environment
 
+_PACKAGE_ROOT: Final = Path(__file__).resolve().parent
+
 
 @final
 class HostEnvironment:
@@ -19,7 +21,7 @@ class HostEnvironment:
 
         Args:
             content_root_path: Absolute path to the directory that contains the application content files.
-                If not provided, the content root path will be inferred from where `HostEnvironment` is being instantiated, or from the current working directory if it can't be calculated.
+                If not provided, the content root path will be read from the `WIRIO_CONTENT_ROOT_PATH` environment variable, or inferred from where `HostEnvironment` is being instantiated, or from the current working directory if it can't be calculated.
 
         """
         self._environment_name = HostEnvironment.get_current_environment_name()
@@ -35,6 +37,16 @@ class HostEnvironment:
             EnvironmentVariable.WIRIO_ENVIRONMENT.value, Environment.LOCAL.value
         )
 
+    @staticmethod
+    def get_configured_content_root_path() -> str | None:
+        """Get the content root path set in the `WIRIO_CONTENT_ROOT_PATH` environment variable, if any."""
+        content_root_path = os.getenv(EnvironmentVariable.WIRIO_CONTENT_ROOT_PATH.value)
+
+        if not content_root_path:
+            return None
+
+        return str(Path(content_root_path).expanduser().resolve())
+
     @property
     def environment_name(self) -> str:
         """Environment name."""
@@ -66,5 +78,11 @@ class HostEnvironment:
         return self.is_environment(Environment.PRODUCTION.value)
 
     def _get_content_root_path(self) -> str:
-        package_root = Path(__file__).resolve().parent
-        return ContentRootPathResolver(package_root=package_root).resolve_path()
+        configured_content_root_path = (
+            HostEnvironment.get_configured_content_root_path()
+        )
+
+        if configured_content_root_path is not None:
+            return configured_content_root_path
+
+        return ContentRootPathResolver(package_root=_PACKAGE_ROOT).resolve_path()
@@ -16,6 +16,7 @@ from starlette.websockets import WebSocket
 from wirio._service_lookup._parameter_information import (
     ParameterInformation,
 )
+from wirio._service_lookup._service_identifier import ServiceIdentifier
 from wirio._utils._param_utils import ParamUtils
 from wirio.abstractions.service_scope import ServiceScope
 from wirio.annotations import FromKeyedServicesInjectable
@@ -94,15 +95,19 @@ class FastapiDependencyInjection:
 
     @classmethod
     def _inject_from_container(cls, target: Callable[..., Any]) -> Callable[..., Any]:
+        # Inspected on the first request, once the annotations of the endpoint can be evaluated
+        parameters_to_inject: dict[str, ParameterInformation] | None = None
+
         @functools.wraps(target)
         async def _inject_async_target(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
-            parameters_to_inject = cls._get_parameters_to_inject(target)
-            parameters_to_inject_resolved: dict[str, Any] = {
-                injected_parameter_name: await cls._resolve_injected_parameter(
-                    parameter_information
-                )
-                for injected_parameter_name, parameter_information in parameters_to_inject.items()
-            }
+            nonlocal parameters_to_inject
+
+            if parameters_to_inject is None:
+                parameters_to_inject = cls._get_parameters_to_inject(target)
+
+            parameters_to_inject_resolved = await cls._resolve_injected_parameters(
+                parameters_to_inject
+            )
             return await target(*args, **{**kwargs, **parameters_to_inject_resolved})
 
         return _inject_async_target
@@ -137,34 +142,54 @@ class FastapiDependencyInjection:
         return result
 
     @classmethod
-    async def _resolve_injected_parameter(
-        cls, parameter_information: ParameterInformation
-    ) -> object | None:
-        parameter_service: object | None
-
-        if isinstance(
-            parameter_information.injectable_dependency, FromKeyedServicesInjectable
-        ):
-            parameter_service = await cls._get_request_container().service_provider.get_keyed_service_object(
-                parameter_information.injectable_dependency.key,
+    async def _resolve_injected_parameters(
+        cls, parameters_to_inject: dict[str, ParameterInformation]
+    ) -> dict[str, object | None]:
+        keyed_service_types = [
+            (
+                parameter_information.injectable_dependency.key
+                if isinstance(
+                    parameter_information.injectable_dependency,
+                    FromKeyedServicesInjectable,
+                )
+                else None,
                 parameter_information.parameter_type,
             )
-        else:
-            parameter_service = (
-                await cls._get_request_container().service_provider.get_service_object(
-                    parameter_information.parameter_type
+            for parameter_information in parameters_to_inject.values()
+        ]
+        service_provider: ServiceProvider = (
+            _current_request.get().app.state.wirio_service_provider
+        )
+
+        # Fail before creating any service if a required one can't be resolved
+        for parameter_information, (service_key, service_type) in zip(
+            parameters_to_inject.values(), keyed_service_types, strict=True
+        ):
+            if (
+                not parameter_information.is_optional
+                and not service_provider.is_resolvable(
+                    ServiceIdentifier.from_service_type(
+                        service_type=service_type, service_key=service_key
+                    )
                 )
-            )
-
-        if parameter_service is None:
-            if parameter_information.is_optional:
-                return None
+            ):
+                raise CannotResolveServiceFromEndpointError(service_type)
 
-            raise CannotResolveServiceFromEndpointError(
-                parameter_information.parameter_type
+        parameter_services = (
+            await cls._get_request_container().service_provider.get_service_objects(
+                keyed_service_types
             )
+        )
+
+        for parameter_information, parameter_service in zip(
+            parameters_to_inject.values(), parameter_services, strict=True
+        ):
+            if parameter_service is None and not parameter_information.is_optional:
+                raise CannotResolveServiceFromEndpointError(
+                    parameter_information.parameter_type
+                )
 
-        return parameter_service
+        return dict(zip(parameters_to_inject, parameter_services, strict=True))
 
     @classmethod
     def _get_wirio_services(cls, app: FastAPI) -> "ServiceCollection|ServiceContainer":
@@ -0,0 +1,59 @@
+from typing import TYPE_CHECKING, cast, final
+
+if TYPE_CHECKING:
+    from wirio.abstractions.base_service_provider import BaseServiceProvider
+
+
+@final
+class Lazy[TService]:
+    """Handle to a service that is only created the first time it's requested.
+
+    Depend on `Lazy[TService]` instead of `TService` when the service is expensive to create and only some code paths
+    use it. The service is resolved from the scope the dependent service was resolved from, so its lifetime and its
+    disposal are the same as if it was injected directly.
+    """
+
+    __slots__ = (
+        "_is_value_created",
+        "_service_key",
+        "_service_provider",
+        "_service_type",
+        "_value",
+    )
+
+    _service_provider: "BaseServiceProvider"
+    _service_type: type[TService]
+    _service_key: object | None
+    _value: TService | None
+    _is_value_created: bool
+
+    def __init__(
+        self,
+        service_provider: "BaseServiceProvider",
+        service_type: type[TService],
+        service_key: object | None = None,
+    ) -> None:
+        self._service_provider = service_provider
+        self._service_type = service_type
+        self._service_key = service_key
+        self._value = None
+        self._is_value_created = False
+
+    @property
+    def is_value_created(self) -> bool:
+        """Indicate whether the service has been resolved already."""
+        return self._is_value_created
+
+    async def get(self) -> TService:
+        """Resolve the service on the first call, and return the same service on the next ones."""
+        if not self._is_value_created:
+            value = await self._service_provider.get_required_keyed_service(
+                self._service_key, self._service_type
+            )
+
+            # Another task might have resolved it while this one was waiting
+            if not self._is_value_created:
+                self._value = value
+                self._is_value_created = True
+
+        return cast("TService", self._value)
@@ -4,11 +4,11 @@ from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Iter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Final, cast, overload
 
-from pydantic import BaseModel
-
 from wirio._content_root_path_resolver import ContentRootPathResolver
 from wirio._service_lookup._typed_type import TypedType
 from wirio._utils._extra_dependencies import ExtraDependencies
+from wirio.diagnostics.diagnostic_listener import DiagnosticListener
+from wirio.diagnostics.startup_profiler import StartupProfiler, profile_startup
 from wirio.exceptions import (
     NoKeyedSingletonServiceRegisteredError,
     NoSingletonServiceRegisteredError,
@@ -17,39 +17,59 @@ from wirio.hosting.host_environment import HostEnvironment
 from wirio.service_descriptor import ServiceDescriptor
 from wirio.service_lifetime import ServiceLifetime
 from wirio.service_provider import ServiceProvider
-from wirio.settings.settings_manager import SettingsManager
+from wirio.service_provider_mode import ServiceProviderMode
 from wirio.wirio_undefined import WirioUndefined
 
 if TYPE_CHECKING:
     from fastapi import FastAPI
+    from pydantic import BaseModel
 
+    from wirio._service_lookup._dependency_graph_cache import DependencyGraphCache
     from wirio.integrations._fastapi_dependency_injection import (
         FastapiDependencyInjection,
     )
     from wirio.integrations._sqlmodel_integration import SqlmodelIntegration
+    from wirio.settings.settings_manager import SettingsManager
 else:
     FastAPI = Any
     FastapiDependencyInjection = Any
     SqlmodelIntegration = Any
 
 
+# Resolved once, since content roots are inferred every time a collection is created
+_PACKAGE_ROOT: Final = Path(__file__).resolve().parent
+
+
 class ServiceCollection:
     """Collection of service descriptors provided during configuration."""
 
     _descriptors: Final[list[ServiceDescriptor]]
-    _settings: SettingsManager | None
+    _settings: "SettingsManager | None"
     _host_environment: Final[HostEnvironment]
+    _dependency_graph_cache: "DependencyGraphCache | None"
 
-    def __init__(self) -> None:
+    def __init__(self, content_root_path: str | None = None) -> None:
+        """Initialize the collection.
+
+        Args:
+            content_root_path: Absolute path to the directory that contains the application content files.
+                If not provided, the content root path will be read from the `WIRIO_CONTENT_ROOT_PATH` environment variable, or inferred from where `ServiceCollection` is being instantiated, or from the current working directory if it can't be calculated.
+
+        """
+        StartupProfiler.start_from_environment()
         self._descriptors = []
         self._settings = None
-        content_root_path = self._get_content_root_path()
+        self._dependency_graph_cache = None
+
+        if content_root_path is None:
+            content_root_path = self._get_content_root_path()
+
         self._host_environment = HostEnvironment(content_root_path=content_root_path)
         self._validate_on_build = True
         self._populate()
 
     @property
-    def settings(self) -> SettingsManager:
+    def settings(self) -> "SettingsManager":
         """Collection of settings providers for the application to compose."""
         if self._settings is None:
             self._settings = self._create_settings()
@@ -61,16 +81,51 @@ class ServiceCollection:
         """Provide information about the hosting environment an application is running."""
         return self._host_environment
 
-    def build_service_provider(
-        self, validate_scopes: bool = False, validate_on_build: bool = True
+    def build_service_provider(  # noqa: PLR0913
+        self,
+        validate_scopes: bool = False,
+        validate_on_build: bool = True,
+        *,
+        mode: ServiceProviderMode = ServiceProviderMode.RUNTIME,
+        compilation_threshold: int = 2,
+        diagnostic_listener: DiagnosticListener | None = None,
+        resolves_concurrently: bool = False,
+        auto_activation_concurrency: int = 1,
+        disposes_concurrently: bool = False,
+        dispose_timeout: float | None = None,
+        scope_pool_size: int = 0,
+        frozen: bool = False,
     ) -> ServiceProvider:
         """Create a :class:`ServiceProvider` containing services from the this :class:`ServiceCollection`."""
         return ServiceProvider(
             descriptors=self._descriptors,
             validate_scopes=validate_scopes,
             validate_on_build=validate_on_build,
+            mode=mode,
+            compilation_threshold=compilation_threshold,
+            diagnostic_listener=diagnostic_listener,
+            resolves_concurrently=resolves_concurrently,
+            auto_activation_concurrency=auto_activation_concurrency,
+            disposes_concurrently=disposes_concurrently,
+            dispose_timeout=dispose_timeout,
+            scope_pool_size=scope_pool_size,
+            frozen=frozen,
+            dependency_graph_cache=self._dependency_graph_cache,
         )
 
+    def use_dependency_graph_cache(self, path: Path | str) -> None:
+        """Cache what introspecting the services returns in the given file, so that the next runs start faster.
+
+        Call it before registering services, so that their registration uses the cache too. Entries are introspected
+        again when the modules defining them or the types they reference change, and the file is only written if it's
+        writable.
+        """
+        from wirio._service_lookup._dependency_graph_cache import (  # noqa: PLC0415
+            DependencyGraphCache,
+        )
+
+        self._dependency_graph_cache = DependencyGraphCache(Path(path))
+
     @overload
     def add_transient[TService](self, service_type: type[TService], /) -> None: ...
 
@@ -1287,8 +1342,26 @@ class ServiceCollection:
 
         assert implementation_factory is not None
 
-        type_hints: dict[str, type] = typing.get_type_hints(implementation_factory)
-        return_type = type_hints.get("return")
+        def get_return_type() -> type | None:
+            with profile_startup("type-hints", implementation_factory):
+                type_hints: dict[str, type] = typing.get_type_hints(
+                    implementation_factory
+                )
+
+            return type_hints.get("return")
+
+        return_type = (
+            get_return_type()
+            if self._dependency_graph_cache is None
+            else cast(
+                "type | None",
+                self._dependency_graph_cache.get_or_introspect_annotation(
+                    self._dependency_graph_cache.IMPLEMENTATION_FACTORY_RETURN_TYPE,
+                    implementation_factory,
+                    get_return_type,
+                ),
+            )
+        )
 
         if return_type is None:
             error_message = "Missing return type hints from 'implementation_factory'"
@@ -1309,15 +1382,25 @@ class ServiceCollection:
             SqlmodelIntegration,
         )
 
-    def _create_settings(self) -> SettingsManager:
+    def _create_settings(self) -> "SettingsManager":
+        # Settings load pydantic, so they're only imported by applications using them
+        from wirio.settings.settings_manager import SettingsManager  # noqa: PLC0415
+
         return SettingsManager(
             content_root_path=self._host_environment.content_root_path,
             add_default_providers=True,
         )
 
     def _get_content_root_path(self) -> str:
-        package_root = Path(__file__).resolve().parent
-        return ContentRootPathResolver(package_root=package_root).resolve_path()
+        configured_content_root_path = (
+            HostEnvironment.get_configured_content_root_path()
+        )
+
+        if configured_content_root_path is not None:
+            return configured_content_root_path
+
+        with profile_startup("content-root", "ServiceCollection"):
+            return ContentRootPathResolver(package_root=_PACKAGE_ROOT).resolve_path()
 
     def _populate(self) -> None:
         self.add_singleton(HostEnvironment, self._host_environment)
@@ -4,11 +4,17 @@ from contextlib import AbstractAsyncContextManager, contextmanager
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Self, final
 
+from wirio._service_lookup._typed_type import TypedType
 from wirio.abstractions.service_scope import ServiceScope
-from wirio.exceptions import ServiceContainerNotBuiltError
+from wirio.diagnostics.diagnostic_listener import DiagnosticListener
+from wirio.exceptions import (
+    ServiceContainerNotBuiltError,
+    ServiceProviderFrozenError,
+)
 from wirio.service_collection import ServiceCollection
 from wirio.service_lifetime import ServiceLifetime
 from wirio.service_provider import ServiceProvider
+from wirio.service_provider_mode import ServiceProviderMode
 
 if TYPE_CHECKING:
     from fastapi import FastAPI
@@ -24,19 +30,43 @@ class ServiceContainer(
 
     _service_provider: ServiceProvider | None
 
-    def __init__(self) -> None:
+    def __init__(self, content_root_path: str | None = None) -> None:
         self._service_provider = None
-        super().__init__()
+        super().__init__(content_root_path)
 
     @typing.override
     def build_service_provider(
-        self, validate_scopes: bool = False, validate_on_build: bool = True
+        self,
+        validate_scopes: bool = False,
+        validate_on_build: bool = True,
+        *,
+        mode: ServiceProviderMode = ServiceProviderMode.RUNTIME,
+        compilation_threshold: int = 2,
+        diagnostic_listener: DiagnosticListener | None = None,
+        resolves_concurrently: bool = False,
+        auto_activation_concurrency: int = 1,
+        disposes_concurrently: bool = False,
+        dispose_timeout: float | None = None,
+        scope_pool_size: int = 0,
+        frozen: bool = False,
     ) -> ServiceProvider:
         """Create a :class:`ServiceProvider` containing services from the this :class:`ServiceContainer`."""
         if self._service_provider is not None:
             return self._service_provider
 
-        return super().build_service_provider(validate_scopes, validate_on_build)
+        return super().build_service_provider(
+            validate_scopes=validate_scopes,
+            validate_on_build=validate_on_build,
+            mode=mode,
+            compilation_threshold=compilation_threshold,
+            diagnostic_listener=diagnostic_listener,
+            resolves_concurrently=resolves_concurrently,
+            auto_activation_concurrency=auto_activation_concurrency,
+            disposes_concurrently=disposes_concurrently,
+            dispose_timeout=dispose_timeout,
+            scope_pool_size=scope_pool_size,
+            frozen=frozen,
+        )
 
     @property
     def service_provider(self) -> ServiceProvider | None:
@@ -93,6 +123,11 @@ class ServiceContainer(
 
         return self._service_provider.create_scope()
 
+    async def freeze(self) -> None:
+        """Forbid registering services from now on, which makes resolutions faster. See :meth:`ServiceProvider.freeze`."""
+        service_provider = await self._get_service_provider()
+        await service_provider.freeze()
+
     async def aclose(self) -> None:
         if self._service_provider is not None:
             await self._service_provider.__aexit__(None, None, None)
@@ -155,6 +190,16 @@ class ServiceContainer(
         service_key: object | None,
         auto_activate: bool,
     ) -> None:
+        # Check it before adding the descriptor, so that the container stays consistent with its provider
+        if self._service_provider is not None and self._service_provider.is_frozen:
+            raise ServiceProviderFrozenError(
+                TypedType.from_type(
+                    self._get_provided_service_type(
+                        service_type, implementation_factory
+                    )
+                )
+            )
+
         super()._add(
             lifetime=lifetime,
             service_type=service_type,
@@ -378,6 +378,23 @@ class ServiceDescriptor:
 
         return self._implementation_type
 
+    def get_implementation_factory(self) -> Callable[..., object] | None:
+        """Get the implementation factory of any kind, whether the service is keyed or not."""
+        implementation_factories: tuple[Callable[..., object] | None, ...] = (
+            self._sync_implementation_factory,
+            self._async_implementation_factory,
+            self._sync_generator_implementation_factory,
+            self._async_generator_implementation_factory,
+        )
+        return next(
+            (
+                implementation_factory
+                for implementation_factory in implementation_factories
+                if implementation_factory is not None
+            ),
+            None,
+        )
+
     def has_implementation_instance(self) -> bool:
         return self.get_implementation_instance() is not None
 
@@ -1,9 +1,10 @@
 import asyncio
-from collections.abc import Awaitable, Callable, Generator
-from contextlib import contextmanager
+import time
+from collections.abc import Awaitable, Callable, Coroutine, Generator, Sequence
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 from types import TracebackType
-from typing import Final, Self, final, override
+from typing import TYPE_CHECKING, Any, Final, Self, cast, final, override
 
 from wirio._service_lookup._async_concurrent_dictionary import (
     AsyncConcurrentDictionary,
@@ -12,13 +13,21 @@ from wirio._service_lookup._asyncio_reentrant_lock import AsyncioReentrantLock
 from wirio._service_lookup._call_site_chain import CallSiteChain
 from wirio._service_lookup._call_site_factory import CallSiteFactory
 from wirio._service_lookup._call_site_runtime_resolver import CallSiteRuntimeResolver
+from wirio._service_lookup._call_site_sync_resolver import CallSiteSyncResolver
 from wirio._service_lookup._call_site_validator import CallSiteValidator
+from wirio._service_lookup._compiled_service_provider_engine import (
+    CompiledServiceProviderEngine,
+)
 from wirio._service_lookup._constant_call_site import (
     ConstantCallSite,
 )
+from wirio._service_lookup._dynamic_service_provider_engine import (
+    DynamicServiceProviderEngine,
+)
 from wirio._service_lookup._runtime_service_provider_engine import (
     RuntimeServiceProviderEngine,
 )
+from wirio._service_lookup._scope_state_pool import ScopeStatePool
 from wirio._service_lookup._service_call_site import (
     ServiceCallSite,
 )
@@ -49,13 +58,28 @@ from wirio.abstractions.service_scope import (
 from wirio.abstractions.service_scope_factory import (
     ServiceScopeFactory,
 )
+from wirio.diagnostics.diagnostic_events import (
+    ScopeCreatedEvent,
+    ServiceProviderBuiltEvent,
+    SingletonActivatedEvent,
+)
+from wirio.diagnostics.diagnostic_listener import DiagnosticListener
+from wirio.diagnostics.startup_profiler import StartupProfiler, profile_startup
 from wirio.exceptions import (
+    NoServiceRegisteredError,
     ObjectDisposedError,
+    ServiceNotSyncResolvableError,
+    ServiceProviderFrozenError,
+    ServiceProviderNotInitializedError,
 )
 from wirio.service_descriptor import ServiceDescriptor
 from wirio.service_provider_engine_scope import (
     ServiceProviderEngineScope,
 )
+from wirio.service_provider_mode import ServiceProviderMode
+
+if TYPE_CHECKING:
+    from wirio._service_lookup._dependency_graph_cache import DependencyGraphCache
 
 
 @final
@@ -75,41 +99,85 @@ class ServiceProvider(
     _pending_descriptors: Final[list["ServiceDescriptor"]]
     _call_site_validator: Final[CallSiteValidator | None]
     _validate_on_build: Final[bool]
+    _mode: Final[ServiceProviderMode]
+    _compilation_threshold: Final[int]
     _root: Final[ServiceProviderEngineScope]
     _engine: Final[ServiceProviderEngine]
     _service_accessors: Final[
         AsyncConcurrentDictionary[ServiceIdentifier, _ServiceAccessor]
     ]
+    _ready_service_accessors: Final[dict[ServiceIdentifier, _ServiceAccessor]]
+    _generation: int
     _service_accessor_identifiers_by_type: Final[
         dict[TypedType, set[ServiceIdentifier]]
     ]
     _invalid_service_accessor_types: Final[set[TypedType]]
     _service_accessor_invalidation_lock: Final[AsyncioReentrantLock]
+    _is_frozen: bool
     _is_disposed: bool
     _call_site_factory: Final[CallSiteFactory]
     _is_aenter_executed: bool
+    _event_loop: asyncio.AbstractEventLoop | None
+    _diagnostic_listener: Final[DiagnosticListener | None]
+    _resolves_concurrently: Final[bool]
+    _auto_activation_concurrency: Final[int]
+    _disposes_concurrently: Final[bool]
+    _dispose_timeout: Final[float | None]
+    _scope_state_pool: Final[ScopeStatePool | None]
+    _dependency_graph_cache: Final["DependencyGraphCache | None"]
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         descriptors: list["ServiceDescriptor"],
         validate_scopes: bool,
         validate_on_build: bool,
+        *,
+        mode: ServiceProviderMode = ServiceProviderMode.RUNTIME,
+        compilation_threshold: int = 2,
+        diagnostic_listener: DiagnosticListener | None = None,
+        resolves_concurrently: bool = False,
+        auto_activation_concurrency: int = 1,
+        disposes_concurrently: bool = False,
+        dispose_timeout: float | None = None,
+        scope_pool_size: int = 0,
+        frozen: bool = False,
+        dependency_graph_cache: "DependencyGraphCache | None" = None,
     ) -> None:
         self._descriptors = []
         self._pending_descriptors = descriptors.copy()
         self._call_site_validator = CallSiteValidator() if validate_scopes else None
         self._validate_on_build = validate_on_build
+        self._mode = mode
+        self._compilation_threshold = compilation_threshold
+        self._diagnostic_listener = diagnostic_listener
+        self._resolves_concurrently = resolves_concurrently
+        self._auto_activation_concurrency = auto_activation_concurrency
+        self._disposes_concurrently = disposes_concurrently
+        self._dispose_timeout = dispose_timeout
+        self._scope_state_pool = (
+            ScopeStatePool(scope_pool_size) if scope_pool_size > 0 else None
+        )
         self._root = ServiceProviderEngineScope(
             service_provider=self, is_root_scope=True
         )
         self._engine = self._get_engine()
         self._service_accessors = AsyncConcurrentDictionary()
+        self._ready_service_accessors = {}
+        self._generation = 0
         self._service_accessor_identifiers_by_type = {}
         self._invalid_service_accessor_types = set()
         self._service_accessor_invalidation_lock = AsyncioReentrantLock()
+        self._is_frozen = frozen
         self._is_disposed = False
-        self._call_site_factory = CallSiteFactory(descriptors)
+        self._dependency_graph_cache = dependency_graph_cache
+        self._call_site_factory = CallSiteFactory(
+            descriptors,
+            diagnostic_listener=diagnostic_listener,
+            frozen=frozen,
+            dependency_graph_cache=dependency_graph_cache,
+        )
         self._is_aenter_executed = False
+        self._event_loop = None
 
     @property
     def root(self) -> ServiceProviderEngineScope:
@@ -119,15 +187,64 @@ class ServiceProvider(
     def is_disposed(self) -> bool:
         return self._is_disposed
 
+    @property
+    def is_frozen(self) -> bool:
+        """Indicate whether registering services is no longer allowed, so that resolutions skip the invalidation checks."""
+        return self._is_frozen
+
     @property
     def is_fully_initialized(self) -> bool:
         """Indicate whether the provider is fully initialized (useful for Jupyter notebooks, which don't work well with context managers)."""
         return self._is_aenter_executed and len(self._pending_descriptors) == 0
 
+    @property
+    def mode(self) -> ServiceProviderMode:
+        """Get the requested mode, which is replaced by `RUNTIME` when a diagnostic listener is set or dependencies are resolved concurrently."""
+        return self._mode
+
+    @property
+    def generation(self) -> int:
+        """Get the number of times the accessors were invalidated, by registering or overriding services."""
+        return self._generation
+
+    @property
+    def has_service_overrides(self) -> bool:
+        """Indicate whether any service is overridden at the moment."""
+        return self._call_site_factory.has_service_overrides
+
+    @property
+    def scope_slots_count(self) -> int:
+        """Get the number of slots that scopes preallocate to store scoped services."""
+        return self._call_site_factory.scope_slots_count
+
     @property
     def call_site_validator(self) -> CallSiteValidator | None:
         return self._call_site_validator
 
+    @property
+    def diagnostic_listener(self) -> DiagnosticListener | None:
+        return self._diagnostic_listener
+
+    @property
+    def resolves_concurrently(self) -> bool:
+        """Indicate whether the dependencies of a service that need to be created are resolved concurrently."""
+        return self._resolves_concurrently
+
+    @property
+    def disposes_concurrently(self) -> bool:
+        """Indicate whether the services of a scope that don't depend on each other are disposed concurrently."""
+        return self._disposes_concurrently
+
+    @property
+    def dispose_timeout(self) -> float | None:
+        """Get the time, in seconds, after which disposing a service is reported as slow and async ones are cancelled."""
+        return self._dispose_timeout
+
+    @property
+    def scope_state_pool(self) -> ScopeStatePool | None:
+        """Get the pool reusing the state of disposed scopes, if scope pooling is enabled."""
+        return self._scope_state_pool
+
     @property
     def pending_descriptors(self) -> list[ServiceDescriptor]:
         return self._pending_descriptors
@@ -158,12 +275,77 @@ class ServiceProvider(
             service_provider_engine_scope=self._root,
         )
 
+    @override
+    async def get_service_objects(
+        self, keyed_service_types: Sequence[tuple[object | None, TypedType]]
+    ) -> tuple[object | None, ...]:
+        if self._is_disposed:
+            raise ObjectDisposedError
+
+        await self.fully_initialize_if_not_fully_initialized()
+        return await self.get_services_from_service_identifiers(
+            service_identifiers=[
+                ServiceIdentifier.from_service_type(
+                    service_type=service_type, service_key=service_key
+                )
+                for service_key, service_type in keyed_service_types
+            ],
+            service_provider_engine_scope=self._root,
+        )
+
+    def get_service_sync[TService](
+        self, service_type: type[TService]
+    ) -> TService | None:
+        """Get service of type `TService` synchronously or return `None`.
+
+        The service must be sync resolvable, that is, neither it nor its dependencies can be created by async implementation factories or be async context managers, unless they're already created.
+        The provider must have been initialized with `await` or `async with` before.
+        """
+        if self._is_disposed:
+            raise ObjectDisposedError
+
+        typed_service_type = TypedType.from_type(service_type)
+
+        # Initializing requires awaiting, and creating an event loop here would bind the services to it
+        if not self._is_aenter_executed:
+            raise ServiceProviderNotInitializedError(typed_service_type)
+
+        service = self.get_service_from_service_identifier_sync(
+            service_identifier=ServiceIdentifier.from_service_type(typed_service_type),
+            service_provider_engine_scope=self._root,
+        )
+        return cast("TService | None", service)
+
+    def get_required_service_sync[TService](
+        self, service_type: type[TService]
+    ) -> TService:
+        """Get service of type `TService` synchronously or raise :class:`NoServiceRegisteredError`."""
+        service = self.get_service_sync(service_type)
+
+        if service is None:
+            raise NoServiceRegisteredError(TypedType.from_type(service_type))
+
+        return service
+
     def create_scope(self) -> ServiceScope:
         """Create a new :class:`ServiceScope` that can be used to resolve scoped services."""
         if self._is_disposed:
             raise ObjectDisposedError
 
-        return ServiceProviderEngineScope(service_provider=self, is_root_scope=False)
+        scope = ServiceProviderEngineScope(
+            service_provider=self,
+            is_root_scope=False,
+            pooled_state=(
+                self._scope_state_pool.rent()
+                if self._scope_state_pool is not None
+                else None
+            ),
+        )
+
+        if self._diagnostic_listener is not None:
+            self._diagnostic_listener.on_scope_created(ScopeCreatedEvent(scope=scope))
+
+        return scope
 
     async def aclose(self) -> None:
         """Dispose the service provider and release all resources."""
@@ -174,21 +356,145 @@ class ServiceProvider(
         service_identifier: ServiceIdentifier,
         service_provider_engine_scope: ServiceProviderEngineScope,
     ) -> object | None:
-        await self._invalidate_service_accessors_if_needed(
-            service_identifier.service_type
-        )
+        # Fast path: accessors are only ready while no invalidation or override happened
+        service_accessor = self._ready_service_accessors.get(service_identifier)
+
+        if service_accessor is not None:
+            if self._call_site_validator is not None:
+                self._on_resolve(
+                    service_accessor.call_site, service_provider_engine_scope
+                )
+
+            return await service_accessor.realized_service(
+                service_provider_engine_scope
+            )
+
         override_call_site = self.get_overridden_call_site(service_identifier)
 
         if override_call_site is not None:
             realized_override = self._engine.realize_service(override_call_site)
             return await realized_override(service_provider_engine_scope)
 
-        service_accessor = await self._service_accessors.get_or_add(
-            key=service_identifier, value_factory=self._create_service_accessor
+        service_accessor = await self._get_service_accessor(service_identifier)
+        self._on_resolve(service_accessor.call_site, service_provider_engine_scope)
+        return await service_accessor.realized_service(service_provider_engine_scope)
+
+    async def get_services_from_service_identifiers(
+        self,
+        service_identifiers: Sequence[ServiceIdentifier],
+        service_provider_engine_scope: ServiceProviderEngineScope,
+    ) -> tuple[object | None, ...]:
+        """Resolve several services, looking up all their accessors before creating any of them.
+
+        When the provider resolves concurrently, the services are created concurrently under a single acquisition of
+        the scope lock. Otherwise, they're created one after another by their accessors, like single resolutions.
+        """
+        # Overrides are only used in tests, so they take the regular path, which checks them on each resolution
+        if self.has_service_overrides:
+            return tuple(
+                [
+                    await self.get_service_from_service_identifier(
+                        service_identifier, service_provider_engine_scope
+                    )
+                    for service_identifier in service_identifiers
+                ]
+            )
+
+        service_accessors: list[_ServiceAccessor] = []
+
+        for service_identifier in service_identifiers:
+            service_accessor = self._ready_service_accessors.get(service_identifier)
+
+            if service_accessor is None:
+                service_accessor = await self._get_service_accessor(service_identifier)
+
+            service_accessors.append(service_accessor)
+
+        if self._call_site_validator is not None:
+            for service_accessor in service_accessors:
+                self._on_resolve(
+                    service_accessor.call_site, service_provider_engine_scope
+                )
+
+        if self._resolves_concurrently and len(service_accessors) > 1:
+            services = await CallSiteRuntimeResolver.INSTANCE.resolve_many(
+                [service_accessor.call_site for service_accessor in service_accessors],
+                service_provider_engine_scope,
+            )
+            return tuple(services)
+
+        return tuple(
+            [
+                await service_accessor.realized_service(service_provider_engine_scope)
+                for service_accessor in service_accessors
+            ]
         )
+
+    def get_service_from_service_identifier_sync(
+        self,
+        service_identifier: ServiceIdentifier,
+        service_provider_engine_scope: ServiceProviderEngineScope,
+    ) -> object | None:
+        event_loop = self._get_event_loop_running_in_another_thread()
+
+        # Resolution isn't thread-safe, so it's delegated to the thread running the event loop
+        if event_loop is not None:
+            return asyncio.run_coroutine_threadsafe(
+                self.get_service_from_service_identifier(
+                    service_identifier, service_provider_engine_scope
+                ),
+                event_loop,
+            ).result()
+
+        service_accessor = self._ready_service_accessors.get(service_identifier)
+
+        if service_accessor is not None:
+            self._on_resolve(service_accessor.call_site, service_provider_engine_scope)
+
+            if service_accessor.call_site is None:
+                return None
+
+            return CallSiteSyncResolver.INSTANCE.resolve(
+                service_accessor.call_site, service_provider_engine_scope
+            )
+
+        generation = self._generation
+        service_type = service_identifier.service_type
+
+        if not self._is_frozen and service_type in self._invalid_service_accessor_types:
+            self._run_synchronously(
+                self._invalidate_service_accessors_if_needed(service_type),
+                service_type,
+            )
+
+        override_call_site = self.get_overridden_call_site(service_identifier)
+
+        if override_call_site is not None:
+            return override_call_site.value
+
+        service_accessor = self._service_accessors.get(service_identifier)
+
+        if service_accessor is None:
+            service_accessor = self._run_synchronously(
+                self._service_accessors.get_or_add(
+                    key=service_identifier,
+                    value_factory=self._create_service_accessor_resolving_synchronously,
+                ),
+                service_type,
+            )
+
         self._register_service_accessor_identifier(service_identifier)
+        self._mark_service_accessor_ready(
+            service_identifier, service_accessor, generation
+        )
         self._on_resolve(service_accessor.call_site, service_provider_engine_scope)
-        return await service_accessor.realized_service(service_provider_engine_scope)
+
+        if service_accessor.call_site is None:
+            return None
+
+        return CallSiteSyncResolver.INSTANCE.resolve(
+            service_accessor.call_site, service_provider_engine_scope
+        )
 
     @contextmanager
     def override_service(
@@ -202,11 +508,15 @@ class ServiceProvider(
             TypedType.from_type(service_type)
         )
 
-        with self._call_site_factory.override_service(
-            service_identifier=service_identifier,
-            implementation_instance=implementation_instance,
-        ):
-            yield
+        try:
+            with self._call_site_factory.override_service(
+                service_identifier=service_identifier,
+                implementation_instance=implementation_instance,
+            ):
+                self._increment_generation()
+                yield
+        finally:
+            self._increment_generation()
 
     @contextmanager
     def override_keyed_service(
@@ -224,11 +534,19 @@ class ServiceProvider(
             service_key=service_key,
         )
 
-        with self._call_site_factory.override_service(
-            service_identifier=service_identifier,
-            implementation_instance=implementation_instance,
-        ):
-            yield
+        try:
+            with self._call_site_factory.override_service(
+                service_identifier=service_identifier,
+                implementation_instance=implementation_instance,
+            ):
+                self._increment_generation()
+                yield
+        finally:
+            self._increment_generation()
+
+    def is_resolvable(self, service_identifier: ServiceIdentifier) -> bool:
+        """Indicate whether the service is registered, overridden or a sequence of services, without creating it."""
+        return self._call_site_factory.is_resolvable(service_identifier)
 
     def get_overridden_call_site(
         self, service_identifier: ServiceIdentifier
@@ -236,37 +554,151 @@ class ServiceProvider(
         """Retrieve the override call site for a given identifier if present."""
         return self._call_site_factory.get_overridden_call_site(service_identifier)
 
+    def replace_service_accessor(
+        self,
+        call_site: ServiceCallSite,
+        realized_service: Callable[
+            [ServiceProviderEngineScope], Awaitable[object | None]
+        ],
+        new_realized_service: Callable[
+            [ServiceProviderEngineScope], Awaitable[object | None]
+        ],
+    ) -> None:
+        """Replace the realized service of the accessors still using the given call site and realized service."""
+        service_identifiers = self._service_accessor_identifiers_by_type.get(
+            call_site.service_type, set()
+        )
+
+        for service_identifier in service_identifiers:
+            service_accessor = self._service_accessors.get(service_identifier)
+
+            if (
+                service_accessor is None
+                or service_accessor.call_site is not call_site
+                or service_accessor.realized_service is not realized_service
+            ):
+                continue
+
+            new_service_accessor = _ServiceAccessor(
+                call_site=call_site, realized_service=new_realized_service
+            )
+            is_updated = self._service_accessors.try_update(
+                key=service_identifier,
+                new_value=new_service_accessor,
+                comparison_value=service_accessor,
+            )
+
+            if (
+                is_updated
+                and self._ready_service_accessors.get(service_identifier)
+                is service_accessor
+            ):
+                self._ready_service_accessors[service_identifier] = new_service_accessor
+
+    def realize_call_site(
+        self, call_site: ServiceCallSite
+    ) -> Callable[[ServiceProviderEngineScope], Awaitable[object | None]]:
+        """Get a function resolving the call site with the engine of the provider, without looking up its accessor."""
+        return self._engine.realize_service(call_site)
+
+    async def get_realized_service(
+        self, service_identifier: ServiceIdentifier
+    ) -> Callable[[ServiceProviderEngineScope], Awaitable[object | None]]:
+        """Get the function resolving the service from its current accessor, for handles bound to an outdated call site."""
+        service_accessor = self._ready_service_accessors.get(service_identifier)
+
+        if service_accessor is None:
+            service_accessor = await self._get_service_accessor(service_identifier)
+
+        return service_accessor.realized_service
+
     def add_descriptor(self, descriptor: ServiceDescriptor) -> None:
+        if self._is_frozen:
+            raise ServiceProviderFrozenError(descriptor.service_type)
+
         self._pending_descriptors.append(descriptor)
         self._call_site_factory.add_descriptor(descriptor)
         self._mark_service_accessor_dirty(descriptor.service_type)
 
+        for (
+            dependent_service_type
+        ) in self._call_site_factory.get_dependent_service_types(
+            descriptor.service_type
+        ):
+            self._mark_service_accessor_dirty(dependent_service_type)
+
+    async def freeze(self) -> None:
+        """Forbid registering services from now on, so that resolutions no longer check whether their accessors and call sites are outdated."""
+        if self._is_frozen:
+            return
+
+        # Services registered before freezing must still replace the previous accessors and call sites
+        for service_type in list(self._invalid_service_accessor_types):
+            await self._invalidate_service_accessors_if_needed(service_type)
+
+        await self._call_site_factory.freeze()
+        self._is_frozen = True
+
     async def fully_initialize_if_not_fully_initialized(self) -> None:
         if not self.is_fully_initialized:
             await self.__aenter__()
 
+    async def _get_service_accessor(
+        self, service_identifier: ServiceIdentifier
+    ) -> _ServiceAccessor:
+        generation = self._generation
+
+        if not self._is_frozen:
+            await self._invalidate_service_accessors_if_needed(
+                service_identifier.service_type
+            )
+
+        service_accessor = await self._service_accessors.get_or_add(
+            key=service_identifier, value_factory=self._create_service_accessor
+        )
+        self._register_service_accessor_identifier(service_identifier)
+        self._mark_service_accessor_ready(
+            service_identifier, service_accessor, generation
+        )
+        return service_accessor
+
     async def _create_service_accessor(
         self, service_identifier: ServiceIdentifier
     ) -> _ServiceAccessor:
-        def get_realized_service_returning_service_object(
-            service_object: object | None,
-        ) -> Callable[[ServiceProviderEngineScope], Awaitable[object | None]]:
-            def realized_service_returning_service_object(
-                _: ServiceProviderEngineScope,
-            ) -> Awaitable[object | None]:
-                future = asyncio.Future[object | None]()
-                future.set_result(service_object)
-                return future
-
-            return realized_service_returning_service_object
+        call_site = await self._create_service_accessor_call_site(service_identifier)
 
-        def realized_service_returning_none(
-            _: ServiceProviderEngineScope,
-        ) -> Awaitable[object | None]:
-            future = asyncio.Future[None]()
-            future.set_result(None)
-            return future
+        # Optimize singleton case
+        if (
+            call_site is not None
+            and call_site.cache.location == CallSiteResultCacheLocation.ROOT
+        ):
+            service_object = await CallSiteRuntimeResolver.INSTANCE.resolve(
+                call_site, self._root
+            )
+            return self._create_singleton_service_accessor(call_site, service_object)
+
+        return self._create_realized_service_accessor(call_site)
+
+    async def _create_service_accessor_resolving_synchronously(
+        self, service_identifier: ServiceIdentifier
+    ) -> _ServiceAccessor:
+        """Create a service accessor like :meth:`_create_service_accessor`, but without awaiting to resolve singletons."""
+        call_site = await self._create_service_accessor_call_site(service_identifier)
+
+        if (
+            call_site is not None
+            and call_site.cache.location == CallSiteResultCacheLocation.ROOT
+        ):
+            service_object = CallSiteSyncResolver.INSTANCE.resolve(
+                call_site, self._root
+            )
+            return self._create_singleton_service_accessor(call_site, service_object)
 
+        return self._create_realized_service_accessor(call_site)
+
+    async def _create_service_accessor_call_site(
+        self, service_identifier: ServiceIdentifier
+    ) -> ServiceCallSite | None:
         call_site = await self._call_site_factory.get_call_site_from_service_identifier(
             service_identifier, CallSiteChain()
         )
@@ -274,27 +706,78 @@ class ServiceProvider(
         if call_site is not None:
             await self._on_create(call_site)
 
-            # Optimize singleton case
-            if call_site.cache.location == CallSiteResultCacheLocation.ROOT:
-                service_object = await CallSiteRuntimeResolver.INSTANCE.resolve(
-                    call_site, self._root
-                )
-                realized_service = get_realized_service_returning_service_object(
-                    service_object
-                )
-                return _ServiceAccessor(
-                    call_site=call_site, realized_service=realized_service
-                )
+        return call_site
 
-            realized_service = self._engine.realize_service(call_site)
+    def _create_singleton_service_accessor(
+        self, call_site: ServiceCallSite, service_object: object | None
+    ) -> _ServiceAccessor:
+        def realized_service_returning_service_object(
+            _: ServiceProviderEngineScope,
+        ) -> Awaitable[object | None]:
+            future = asyncio.Future[object | None]()
+            future.set_result(service_object)
+            return future
+
+        return _ServiceAccessor(
+            call_site=call_site,
+            realized_service=realized_service_returning_service_object,
+        )
+
+    def _create_realized_service_accessor(
+        self, call_site: ServiceCallSite | None
+    ) -> _ServiceAccessor:
+        def realized_service_returning_none(
+            _: ServiceProviderEngineScope,
+        ) -> Awaitable[object | None]:
+            future = asyncio.Future[None]()
+            future.set_result(None)
+            return future
+
+        if call_site is None:
             return _ServiceAccessor(
-                call_site=call_site, realized_service=realized_service
+                call_site=call_site, realized_service=realized_service_returning_none
             )
 
         return _ServiceAccessor(
-            call_site=call_site, realized_service=realized_service_returning_none
+            call_site=call_site,
+            realized_service=self._engine.realize_service(call_site),
         )
 
+    def _get_event_loop_running_in_another_thread(
+        self,
+    ) -> asyncio.AbstractEventLoop | None:
+        if self._event_loop is None or not self._event_loop.is_running():
+            return None
+
+        try:
+            running_event_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._event_loop
+
+        return None if running_event_loop is self._event_loop else self._event_loop
+
+    def _run_synchronously[TResult](
+        self, coroutine: Coroutine[Any, Any, TResult], service_type: TypedType
+    ) -> TResult:
+        """Run a coroutine of the provider without giving control back to the event loop."""
+        event_loop = self._get_event_loop_running_in_another_thread()
+
+        if event_loop is not None:
+            return asyncio.run_coroutine_threadsafe(coroutine, event_loop).result()
+
+        # The coroutine only suspends when it waits for a lock held by another task,
+        # which can't be released until we give control back to the event loop
+        try:
+            coroutine.send(None)
+        except StopIteration as stop_iteration:
+            return stop_iteration.value
+
+        with suppress(asyncio.CancelledError):
+            coroutine.throw(asyncio.CancelledError())
+
+        coroutine.close()
+        raise ServiceNotSyncResolvableError(service_type)
+
     def _register_service_accessor_identifier(
         self, service_identifier: ServiceIdentifier
     ) -> None:
@@ -303,8 +786,24 @@ class ServiceProvider(
         )
         identifiers.add(service_identifier)
 
+    def _mark_service_accessor_ready(
+        self,
+        service_identifier: ServiceIdentifier,
+        service_accessor: _ServiceAccessor,
+        generation: int,
+    ) -> None:
+        # Skip it if an invalidation or an override happened while the accessor was created
+        if generation == self._generation and not self.has_service_overrides:
+            self._ready_service_accessors[service_identifier] = service_accessor
+
     def _mark_service_accessor_dirty(self, service_type: TypedType) -> None:
         self._invalid_service_accessor_types.add(service_type)
+        self._increment_generation()
+
+    def _increment_generation(self) -> None:
+        """Invalidate the ready accessors, so that the next resolutions take the full path."""
+        self._generation += 1
+        self._ready_service_accessors.clear()
 
     async def _invalidate_service_accessors_if_needed(
         self, service_type: TypedType
@@ -325,8 +824,24 @@ class ServiceProvider(
 
             self._invalid_service_accessor_types.remove(service_type)
 
+    def _get_effective_mode(self) -> ServiceProviderMode:
+        # Compiled call sites neither emit events nor resolve dependencies concurrently
+        if self._diagnostic_listener is not None or self._resolves_concurrently:
+            return ServiceProviderMode.RUNTIME
+
+        return self._mode
+
     def _get_engine(self) -> ServiceProviderEngine:
-        return RuntimeServiceProviderEngine.INSTANCE
+        match self._get_effective_mode():
+            case ServiceProviderMode.RUNTIME:
+                return RuntimeServiceProviderEngine.INSTANCE
+            case ServiceProviderMode.COMPILED:
+                return CompiledServiceProviderEngine.INSTANCE
+            case ServiceProviderMode.DYNAMIC:
+                return DynamicServiceProviderEngine(
+                    service_provider=self,
+                    compilation_threshold=self._compilation_threshold,
+                )
 
     async def _add_built_in_services(self) -> None:
         """Add built-in services that aren't part of the list of service descriptors."""
@@ -367,28 +882,152 @@ class ServiceProvider(
         )
 
     async def _activate_auto_activated_singletons(self) -> None:
-        """Activate all singletons registered with auto_activate=True."""
-        for service_descriptor in self._pending_descriptors:
-            if not service_descriptor.auto_activate:
-                continue
+        """Activate all singletons registered with auto_activate=True.
 
-            await self.get_service_from_service_identifier(
-                service_identifier=ServiceIdentifier.from_descriptor(
-                    service_descriptor
+        They're activated level by level of their dependency graph, so that the ones of a level
+        only depend on the ones of the previous levels and can be activated concurrently.
+        """
+        service_identifiers = list(
+            dict.fromkeys(
+                ServiceIdentifier.from_descriptor(service_descriptor)
+                for service_descriptor in self._pending_descriptors
+                if service_descriptor.auto_activate
+            )
+        )
+
+        if len(service_identifiers) == 0:
+            return
+
+        levels = await self._get_auto_activation_levels(service_identifiers)
+
+        if self._auto_activation_concurrency == 1:
+            for level in levels:
+                for service_identifier in level:
+                    await self._activate_auto_activated_singleton(service_identifier)
+
+            return
+
+        await self._activate_auto_activated_singletons_concurrently(levels)
+
+    async def _activate_auto_activated_singletons_concurrently(
+        self, levels: list[list[ServiceIdentifier]]
+    ) -> None:
+        semaphore = asyncio.Semaphore(self._auto_activation_concurrency)
+        exceptions: list[Exception] = []
+
+        async def activate_with_semaphore(
+            service_identifier: ServiceIdentifier,
+        ) -> None:
+            async with semaphore:
+                # The provider can't be built anymore, so the ones still waiting aren't activated
+                if len(exceptions) > 0:
+                    return
+
+                try:
+                    await self._activate_auto_activated_singleton(service_identifier)
+                except Exception as exception:  # noqa: BLE001
+                    exceptions.append(exception)
+
+        for level in levels:
+            # The ones being activated when another one fails are awaited instead of cancelled
+            async with asyncio.TaskGroup() as task_group:
+                for service_identifier in level:
+                    task_group.create_task(activate_with_semaphore(service_identifier))
+
+            if len(exceptions) == 1:
+                # Raise the same error as when singletons are activated one after another
+                raise exceptions[0]
+
+            if len(exceptions) > 1:
+                error_message = "Some auto-activated singletons failed to be activated"
+                raise ExceptionGroup(error_message, exceptions)
+
+    async def _get_auto_activation_levels(
+        self, service_identifiers: list[ServiceIdentifier]
+    ) -> list[list[ServiceIdentifier]]:
+        auto_activated_call_sites: dict[int, ServiceIdentifier] = {}
+        call_sites: dict[ServiceIdentifier, ServiceCallSite] = {}
+
+        for service_identifier in service_identifiers:
+            call_site = (
+                await self._call_site_factory.get_call_site_from_service_identifier(
+                    service_identifier, CallSiteChain()
+                )
+            )
+
+            # Unresolvable services are activated first, so that they raise their error right away
+            if call_site is not None:
+                auto_activated_call_sites[id(call_site)] = service_identifier
+                call_sites[service_identifier] = call_site
+
+        # Call sites are shared between the services depending on them, so each one is visited once
+        levels_by_call_site: dict[int, int] = {}
+
+        def get_level(call_site: ServiceCallSite) -> int:
+            level = levels_by_call_site.get(id(call_site))
+
+            if level is not None:
+                return level
+
+            level = max(
+                (
+                    get_level(dependency_call_site)
+                    for dependency_call_site in call_site.dependency_call_sites
                 ),
+                default=0,
+            )
+
+            if id(call_site) in auto_activated_call_sites:
+                level += 1
+
+            levels_by_call_site[id(call_site)] = level
+            return level
+
+        levels: list[list[ServiceIdentifier]] = [[]]
+
+        for service_identifier in service_identifiers:
+            call_site = call_sites.get(service_identifier)
+            level = 0 if call_site is None else get_level(call_site)
+
+            while len(levels) <= level:
+                levels.append([])
+
+            levels[level].append(service_identifier)
+
+        return [level for level in levels if len(level) > 0]
+
+    async def _activate_auto_activated_singleton(
+        self, service_identifier: ServiceIdentifier
+    ) -> None:
+        started_at = (
+            time.perf_counter() if self._diagnostic_listener is not None else 0.0
+        )
+        with profile_startup("auto-activation", service_identifier):
+            await self.get_service_from_service_identifier(
+                service_identifier=service_identifier,
                 service_provider_engine_scope=self._root,
             )
 
+        if self._diagnostic_listener is not None:
+            self._diagnostic_listener.on_singleton_activated(
+                SingletonActivatedEvent(
+                    service_type=service_identifier.service_type,
+                    service_key=service_identifier.service_key,
+                    duration=time.perf_counter() - started_at,
+                )
+            )
+
     async def _validate_service(self, service_descriptor: "ServiceDescriptor") -> None:
         try:
-            call_site = (
-                await self._call_site_factory.get_call_site_from_service_descriptor(
-                    service_descriptor, CallSiteChain()
+            with profile_startup("validation", service_descriptor.service_type):
+                call_site = (
+                    await self._call_site_factory.get_call_site_from_service_descriptor(
+                        service_descriptor, CallSiteChain()
+                    )
                 )
-            )
 
-            if call_site is not None:
-                await self._on_create(call_site)
+                if call_site is not None:
+                    await self._on_create(call_site)
         except Exception as exception:
             error_message = f"Error while validating the service descriptor '{service_descriptor}': {exception!r}"
             raise RuntimeError(error_message) from exception
@@ -407,19 +1046,45 @@ class ServiceProvider(
 
     @override
     async def __aenter__(self) -> Self:
-        await self._add_built_in_services()
-        await self._activate_auto_activated_singletons()
-        await self._validate_services()
+        started_at = (
+            time.perf_counter() if self._diagnostic_listener is not None else 0.0
+        )
+        self._event_loop = asyncio.get_running_loop()
+
+        with profile_startup("service-provider-build", "ServiceProvider"):
+            await self._add_built_in_services()
+            await self._activate_auto_activated_singletons()
+            await self._validate_services()
+
+        descriptors_count = len(self._pending_descriptors)
         self._descriptors.extend(self._pending_descriptors)
         self._pending_descriptors.clear()
         self._is_aenter_executed = True
+
+        # Validating the services introspected all of them, so the next runs can skip it
+        if self._dependency_graph_cache is not None:
+            self._dependency_graph_cache.save()
+
+        if self._diagnostic_listener is not None:
+            self._diagnostic_listener.on_service_provider_built(
+                ServiceProviderBuiltEvent(
+                    descriptors_count=descriptors_count,
+                    duration=time.perf_counter() - started_at,
+                    mode=self._get_effective_mode(),
+                )
+            )
+
+        StartupProfiler.stop_from_environment()
         return self
 
     async def _validate_services(self) -> None:
         if self._validate_on_build:
             exceptions: list[Exception] | None = None
 
-            for service_descriptor in self._pending_descriptors:
+            # Dependencies are validated first, so that their call sites are built once and reused
+            for service_descriptor in self._call_site_factory.sort_by_dependencies(
+                self._pending_descriptors
+            ):
                 try:
                     await self._validate_service(service_descriptor)
                 except Exception as exception:  # noqa: BLE001
@@ -441,3 +1106,7 @@ class ServiceProvider(
     ) -> bool | None:
         self._is_disposed = True
         await self._root.__aexit__(exc_type, exc_val, exc_tb)
+
+        # Services resolved after the build may have been introspected lazily
+        if self._dependency_graph_cache is not None:
+            self._dependency_graph_cache.save()
@@ -1,9 +1,17 @@
+import asyncio
+import time
+from collections.abc import Sequence
 from types import TracebackType
-from typing import TYPE_CHECKING, Final, Self, final, override
+from typing import TYPE_CHECKING, Final, Self, cast, final, override
 
 from wirio._service_lookup._asyncio_reentrant_lock import (
     AsyncioReentrantLock,
 )
+from wirio._service_lookup._scope_state_pool import (
+    DETACHED_RESOLVED_SERVICES,
+    DETACHED_SCOPED_SERVICES,
+    ScopeState,
+)
 from wirio._service_lookup._service_identifier import (
     ServiceIdentifier,
 )
@@ -17,9 +25,16 @@ from wirio._service_lookup._typed_type import TypedType
 from wirio._service_lookup.service_cache_key import ServiceCacheKey
 from wirio.abstractions.base_service_provider import BaseServiceProvider
 from wirio.abstractions.service_scope import ServiceScope
-from wirio.exceptions import ObjectDisposedError
+from wirio.diagnostics.diagnostic_events import ScopeDisposedEvent, SlowDisposalEvent
+from wirio.exceptions import (
+    DisposeTimeoutError,
+    NoServiceRegisteredError,
+    ObjectDisposedError,
+)
+from wirio.wirio_undefined import WirioUndefined
 
 if TYPE_CHECKING:
+    from wirio._service_lookup._service_call_site import ServiceCallSite
     from wirio.service_provider import ServiceProvider
 
 
@@ -31,20 +46,47 @@ class ServiceProviderEngineScope(BaseServiceProvider, ServiceScope):
     _is_root_scope: Final[bool]
     _is_disposed: bool
     _disposables: list[object] | None
-    _resolved_services: Final[dict[ServiceCacheKey, object | None]]
+    # Call sites that created the disposables, by disposable id, to know which ones depend on each other
+    _disposable_call_sites: Final[dict[int, "ServiceCallSite"]]
+    # Services of the call sites with a scope slot, indexed by it, or `WirioUndefined.INSTANCE` until they're created
+    _scoped_services: list[object]
+    # Services of the call sites without a scope slot, by cache key
+    _resolved_services: dict[ServiceCacheKey, object | None]
 
     # A reentrant lock is needed when the lifetime is scoped and the service has a context manager
     _resolved_services_lock: Final[AsyncioReentrantLock]
 
+    # State rented from the pool of the service provider, given back once the scope is disposed
+    _pooled_state: ScopeState | None
+
     def __init__(
-        self, service_provider: "ServiceProvider", is_root_scope: bool
+        self,
+        service_provider: "ServiceProvider",
+        is_root_scope: bool,
+        pooled_state: ScopeState | None = None,
     ) -> None:
         self._root_provider = service_provider
         self._is_root_scope = is_root_scope
         self._is_disposed = False
-        self._disposables = None
-        self._resolved_services = {}
-        self._resolved_services_lock = AsyncioReentrantLock()
+        self._pooled_state = pooled_state
+
+        if pooled_state is None:
+            self._disposables = None
+            self._disposable_call_sites = {}
+            # The root scope is created before any call site and caches scoped services as singletons
+            self._scoped_services = (
+                []
+                if is_root_scope
+                else [WirioUndefined.INSTANCE] * service_provider.scope_slots_count
+            )
+            self._resolved_services = {}
+            self._resolved_services_lock = AsyncioReentrantLock()
+        else:
+            self._disposables = pooled_state.disposables
+            self._disposable_call_sites = pooled_state.disposable_call_sites
+            self._scoped_services = pooled_state.scoped_services
+            self._resolved_services = pooled_state.resolved_services
+            self._resolved_services_lock = pooled_state.resolved_services_lock
 
     @property
     def root_provider(self) -> "ServiceProvider":
@@ -54,10 +96,55 @@ class ServiceProviderEngineScope(BaseServiceProvider, ServiceScope):
     def is_root_scope(self) -> bool:
         return self._is_root_scope
 
+    @property
+    def is_disposed(self) -> bool:
+        return self._is_disposed
+
+    @property
+    def scoped_services(self) -> list[object]:
+        """Get the services created in this scope by the call sites with a scope slot, indexed by it."""
+        return self._scoped_services
+
     @property
     def resolved_services(self) -> dict[ServiceCacheKey, object | None]:
+        """Get the services created in this scope by the call sites without a scope slot, by cache key."""
         return self._resolved_services
 
+    def get_resolved_service(self, call_site: "ServiceCallSite") -> object | None:
+        """Get the service created in this scope by the call site, or `WirioUndefined.INSTANCE` if it wasn't created yet."""
+        scope_slot = call_site.scope_slot
+
+        if scope_slot is None:
+            return self._resolved_services.get(
+                call_site.cache.key, WirioUndefined.INSTANCE
+            )
+
+        scoped_services = self._scoped_services
+
+        # Call sites built after this scope was created have slots beyond the preallocated ones
+        if scope_slot < len(scoped_services):
+            return scoped_services[scope_slot]
+
+        return WirioUndefined.INSTANCE
+
+    def set_resolved_service(
+        self, call_site: "ServiceCallSite", service: object | None
+    ) -> None:
+        """Store the service created in this scope by the call site."""
+        scope_slot = call_site.scope_slot
+
+        if scope_slot is None:
+            self._resolved_services[call_site.cache.key] = service
+            return
+
+        scoped_services = self._scoped_services
+        missing_slots_count = scope_slot + 1 - len(scoped_services)
+
+        if missing_slots_count > 0:
+            scoped_services.extend([WirioUndefined.INSTANCE] * missing_slots_count)
+
+        scoped_services[scope_slot] = service
+
     @property
     def resolved_services_lock(self) -> AsyncioReentrantLock:
         """Protect the state on the scope.
@@ -101,7 +188,65 @@ class ServiceProviderEngineScope(BaseServiceProvider, ServiceScope):
             service_provider_engine_scope=self,
         )
 
-    async def capture_disposable(self, service: object | None) -> object | None:
+    @override
+    async def get_service_objects(
+        self, keyed_service_types: Sequence[tuple[object | None, TypedType]]
+    ) -> tuple[object | None, ...]:
+        if self._is_disposed:
+            raise ObjectDisposedError
+
+        return await self._root_provider.get_services_from_service_identifiers(
+            service_identifiers=[
+                ServiceIdentifier.from_service_type(
+                    service_type=service_type, service_key=service_key
+                )
+                for service_key, service_type in keyed_service_types
+            ],
+            service_provider_engine_scope=self,
+        )
+
+    @override
+    def get_service_sync[TService](
+        self, service_type: type[TService]
+    ) -> TService | None:
+        """Get service of type `TService` synchronously or return `None`.
+
+        The service must be sync resolvable, that is, neither it nor its dependencies can be created by async implementation factories or be async context managers, unless they're already created.
+        """
+        if self._is_disposed:
+            raise ObjectDisposedError
+
+        service = self._root_provider.get_service_from_service_identifier_sync(
+            service_identifier=ServiceIdentifier.from_service_type(
+                TypedType.from_type(service_type)
+            ),
+            service_provider_engine_scope=self,
+        )
+        return cast("TService | None", service)
+
+    @override
+    def get_required_service_sync[TService](
+        self, service_type: type[TService]
+    ) -> TService:
+        """Get service of type `TService` synchronously or raise :class:`NoServiceRegisteredError`."""
+        service = self.get_service_sync(service_type)
+
+        if service is None:
+            raise NoServiceRegisteredError(TypedType.from_type(service_type))
+
+        return service
+
+    async def capture_disposable(
+        self,
+        service: object | None,
+        is_lock_taken: bool = False,
+        call_site: "ServiceCallSite | None" = None,
+    ) -> object | None:
+        """Register the service to be disposed with the scope.
+
+        `is_lock_taken` indicates that :attr:`resolved_services_lock` is already held for the caller, maybe by a parent task that can't reenter it.
+        `call_site` is the call site that created the service, used to dispose services that don't depend on each other concurrently.
+        """
         if service is self or not (
             isinstance(
                 service, (SupportsAsyncContextManager, SupportsSyncContextManager)
@@ -109,16 +254,11 @@ class ServiceProviderEngineScope(BaseServiceProvider, ServiceScope):
         ):
             return service
 
-        is_disposed = False
-
-        async with self._resolved_services_lock:
-            if self._is_disposed:
-                is_disposed = True
-            else:
-                if self._disposables is None:
-                    self._disposables = []
-
-                self._disposables.append(service)
+        if is_lock_taken:
+            is_disposed = not self._try_add_disposable(service, call_site)
+        else:
+            async with self._resolved_services_lock:
+                is_disposed = not self._try_add_disposable(service, call_site)
 
         # Don't run customer code under the lock
         if is_disposed:
@@ -131,7 +271,37 @@ class ServiceProviderEngineScope(BaseServiceProvider, ServiceScope):
 
         return service
 
-    async def _begin_dispose(self) -> list[object] | None:
+    def _try_add_disposable(
+        self, service: object, call_site: "ServiceCallSite | None"
+    ) -> bool:
+        if self._is_disposed:
+            return False
+
+        if self._disposables is None:
+            self._disposables = []
+
+        self._disposables.append(service)
+
+        if call_site is not None:
+            self._disposable_call_sites[id(service)] = call_site
+
+        return True
+
+    def capture_disposable_sync(
+        self, service: object | None, call_site: "ServiceCallSite | None" = None
+    ) -> object | None:
+        """Capture a disposable without awaiting, for services created by :class:`CallSiteSyncResolver`."""
+        if service is self or not isinstance(service, SupportsSyncContextManager):
+            return service
+
+        if self._is_disposed:
+            service.__exit__(None, None, None)
+            raise ObjectDisposedError
+
+        self._try_add_disposable(service, call_site)
+        return service
+
+    async def _begin_dispose(self) -> Sequence[object] | None:
         async with self._resolved_services_lock:
             if self._is_disposed:
                 return None
@@ -150,7 +320,7 @@ class ServiceProviderEngineScope(BaseServiceProvider, ServiceScope):
         # :attr:`_resolved_services` is never cleared for singletons because there might be a compilation running in background
         # trying to get a cached singleton service. If it doesn't find it
         # it will try to create a new one which will result in an :class:`ObjectDisposedError`.
-        return self._disposables
+        return self._disposables if self._disposables is not None else ()
 
     @override
     async def __aenter__(self) -> Self:
@@ -171,10 +341,207 @@ class ServiceProviderEngineScope(BaseServiceProvider, ServiceScope):
         if to_dispose is None:
             return None
 
-        for i in range(len(to_dispose) - 1, -1, -1):
-            service = to_dispose[i]
+        try:
+            await self._dispose(to_dispose)
+        finally:
+            if self._pooled_state is not None:
+                self._give_back_pooled_state(self._pooled_state)
+
+        return None
+
+    async def _dispose(self, to_dispose: Sequence[object]) -> None:
+        diagnostic_listener = self._root_provider.diagnostic_listener
+        started_at = time.perf_counter() if diagnostic_listener is not None else 0.0
+
+        if self._root_provider.disposes_concurrently:
+            await self._dispose_concurrently(to_dispose)
+        else:
+            for i in range(len(to_dispose) - 1, -1, -1):
+                await self._dispose_service(to_dispose[i])
+
+        if diagnostic_listener is not None:
+            diagnostic_listener.on_scope_disposed(
+                ScopeDisposedEvent(
+                    scope=self,
+                    disposables_count=len(to_dispose),
+                    duration=time.perf_counter() - started_at,
+                )
+            )
+
+    async def _dispose_concurrently(self, to_dispose: Sequence[object]) -> None:
+        """Dispose the services in waves, disposing concurrently the ones that no remaining service depends on.
+
+        Services that depend on each other are still disposed in reverse creation order. Every service is disposed even when
+        others fail, and the failures are raised at the end.
+        """
+        dependencies = self._get_disposable_dependencies(to_dispose)
+        remaining_dependents_counts = [0] * len(to_dispose)
+
+        for service_dependencies in dependencies:
+            for dependency in service_dependencies:
+                remaining_dependents_counts[dependency] += 1
+
+        exceptions: list[Exception] = []
+        wave = [
+            i
+            for i in range(len(to_dispose) - 1, -1, -1)
+            if remaining_dependents_counts[i] == 0
+        ]
+
+        while len(wave) > 0:
+            await self._dispose_wave([to_dispose[i] for i in wave], exceptions)
+            next_wave: list[int] = []
+
+            for i in wave:
+                for dependency in dependencies[i]:
+                    remaining_dependents_counts[dependency] -= 1
 
+                    if remaining_dependents_counts[dependency] == 0:
+                        next_wave.append(dependency)
+
+            wave = sorted(next_wave, reverse=True)
+
+        if len(exceptions) == 1:
+            raise exceptions[0]
+
+        if len(exceptions) > 1:
+            error_message = "Some services failed to be disposed"
+            raise ExceptionGroup(error_message, exceptions)
+
+    async def _dispose_wave(
+        self, services: list[object], exceptions: list[Exception]
+    ) -> None:
+        async def dispose_service(service: object) -> None:
+            try:
+                await self._dispose_service(service)
+            except Exception as exception:  # noqa: BLE001
+                exceptions.append(exception)
+
+        if len(services) == 1:
+            await dispose_service(services[0])
+            return
+
+        async with asyncio.TaskGroup() as task_group:
+            for service in services:
+                task_group.create_task(dispose_service(service))
+
+    def _get_disposable_dependencies(
+        self, to_dispose: Sequence[object]
+    ) -> list[list[int]]:
+        """Get the indexes of the disposables created before each disposable that it might depend on.
+
+        A disposable depends on the disposables created by the call sites reachable from its own call site. Disposables
+        without a known call site depend on all the disposables created before them, and the ones created after depend on them.
+        """
+        indexes_by_cache_key: dict[ServiceCacheKey, list[int]] = {}
+        # Depending on the last disposable without a known call site is enough, since it depends on all the previous ones
+        last_unknown_index: int | None = None
+        dependencies: list[list[int]] = []
+
+        for i, service in enumerate(to_dispose):
+            call_site = self._disposable_call_sites.get(id(service))
+
+            if call_site is None:
+                dependencies.append(
+                    list(
+                        range(
+                            0 if last_unknown_index is None else last_unknown_index, i
+                        )
+                    )
+                )
+                last_unknown_index = i
+                continue
+
+            service_dependencies = (
+                [] if last_unknown_index is None else [last_unknown_index]
+            )
+
+            for cache_key in self._get_dependency_cache_keys(call_site):
+                service_dependencies.extend(indexes_by_cache_key.get(cache_key, []))
+
+            dependencies.append(service_dependencies)
+            indexes_by_cache_key.setdefault(call_site.cache.key, []).append(i)
+
+        return dependencies
+
+    @staticmethod
+    def _get_dependency_cache_keys(
+        call_site: "ServiceCallSite",
+    ) -> set[ServiceCacheKey]:
+        cache_keys: set[ServiceCacheKey] = set()
+        pending_call_sites = list(call_site.dependency_call_sites)
+
+        while len(pending_call_sites) > 0:
+            dependency_call_site = pending_call_sites.pop()
+
+            if dependency_call_site.cache.key in cache_keys:
+                continue
+
+            cache_keys.add(dependency_call_site.cache.key)
+            pending_call_sites.extend(dependency_call_site.dependency_call_sites)
+
+        return cache_keys
+
+    async def _dispose_service(self, service: object) -> None:
+        dispose_timeout = self._root_provider.dispose_timeout
+
+        if dispose_timeout is None:
             if isinstance(service, SupportsAsyncContextManager):
                 await service.__aexit__(None, None, None)
             elif isinstance(service, SupportsSyncContextManager):
                 service.__exit__(None, None, None)
+
+            return
+
+        started_at = time.perf_counter()
+
+        try:
+            if isinstance(service, SupportsAsyncContextManager):
+                timeout = asyncio.timeout(dispose_timeout)
+
+                try:
+                    async with timeout:
+                        await service.__aexit__(None, None, None)
+                except TimeoutError:
+                    # Timeouts raised by the service itself are propagated as they are
+                    if not timeout.expired():
+                        raise
+
+                if timeout.expired():
+                    raise DisposeTimeoutError(
+                        self._get_disposable_service_type(service), dispose_timeout
+                    )
+            elif isinstance(service, SupportsSyncContextManager):
+                service.__exit__(None, None, None)
+        finally:
+            duration = time.perf_counter() - started_at
+            diagnostic_listener = self._root_provider.diagnostic_listener
+
+            if duration > dispose_timeout and diagnostic_listener is not None:
+                diagnostic_listener.on_slow_disposal(
+                    SlowDisposalEvent(
+                        scope=self,
+                        service_type=self._get_disposable_service_type(service),
+                        duration=duration,
+                    )
+                )
+
+    def _get_disposable_service_type(self, service: object) -> TypedType:
+        call_site = self._disposable_call_sites.get(id(service))
+
+        if call_site is not None:
+            return call_site.service_type
+
+        return TypedType.from_type(type(service))
+
+    def _give_back_pooled_state(self, pooled_state: ScopeState) -> None:
+        scope_state_pool = self._root_provider.scope_state_pool
+
+        # Detach the state, so that the services of the scope reusing it are never reachable from this disposed scope
+        self._pooled_state = None
+        self._scoped_services = DETACHED_SCOPED_SERVICES
+        self._resolved_services = DETACHED_RESOLVED_SERVICES
+        self._disposables = None
+
+        if scope_state_pool is not None:
+            scope_state_pool.give_back(pooled_state)
@@ -0,0 +1,18 @@
+from enum import Enum, auto
+
+
+class ServiceProviderMode(Enum):
+    """Strategy used by :class:`ServiceProvider` to resolve non-singleton services.
+
+    Compiled call sites neither emit diagnostic events nor resolve dependencies concurrently, so providers with a
+    diagnostic listener or resolving concurrently use `RUNTIME`, whatever the requested mode.
+    """
+
+    RUNTIME = auto()
+    """Interpret the call site tree of the service on every resolution."""
+
+    COMPILED = auto()
+    """Compile the call site tree of the service into specialized closures the first time it's resolved."""
+
+    DYNAMIC = auto()
+    """Interpret the call site tree of the service and compile it in background once it's resolved often enough."""
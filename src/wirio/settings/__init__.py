@@ -1,12 +1,29 @@
-from .convention_changer import ConventionChanger
-from .settings_binder import SettingsBinder
-from .settings_builder import SettingsBuilder
-from .settings_manager import SettingsManager
-from .settings_path import SettingsPath
-from .settings_provider import SettingsProvider
-from .settings_root import SettingsRoot
-from .settings_section import SettingsSection
-from .settings_source import SettingsSource
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .convention_changer import ConventionChanger
+    from .settings_binder import SettingsBinder
+    from .settings_builder import SettingsBuilder
+    from .settings_manager import SettingsManager
+    from .settings_path import SettingsPath
+    from .settings_provider import SettingsProvider
+    from .settings_root import SettingsRoot
+    from .settings_section import SettingsSection
+    from .settings_source import SettingsSource
+
+# Modules are imported on first access (PEP 562), so that pydantic is only loaded once settings are bound
+_MODULES_BY_ATTRIBUTE = {
+    "ConventionChanger": ".convention_changer",
+    "SettingsBinder": ".settings_binder",
+    "SettingsBuilder": ".settings_builder",
+    "SettingsManager": ".settings_manager",
+    "SettingsPath": ".settings_path",
+    "SettingsProvider": ".settings_provider",
+    "SettingsRoot": ".settings_root",
+    "SettingsSection": ".settings_section",
+    "SettingsSource": ".settings_source",
+}
 
 __all__ = [
     "ConventionChanger",
@@ -19,3 +36,20 @@ __all__ = [
     "SettingsSection",
     "SettingsSource",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _MODULES_BY_ATTRIBUTE.get(name)
+
+    if module_name is None:
+        error_message = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(error_message)
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache it, so that the next accesses don't go through this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -11,6 +11,7 @@ from pydantic import BaseModel, TypeAdapter
 from pydantic.fields import FieldInfo
 
 from wirio._service_lookup._typed_type import TypedType
+from wirio.diagnostics.startup_profiler import profile_startup
 from wirio.wirio_undefined import WirioUndefined
 
 if TYPE_CHECKING:
@@ -24,11 +25,12 @@ class SettingsBinder:
         settings: "Settings",
         model_type: type[TModel],
     ) -> TModel:
-        return cls._bind_instance(
-            model_type=model_type,
-            settings=settings,
-            key_prefix="",
-        )
+        with profile_startup("settings-binding", model_type):
+            return cls._bind_instance(
+                model_type=model_type,
+                settings=settings,
+                key_prefix="",
+            )
 
     @classmethod
     def _bind_instance[TModel: BaseModel](
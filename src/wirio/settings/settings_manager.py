@@ -9,6 +9,7 @@ from pydantic import TypeAdapter
 from wirio._content_root_path_resolver import ContentRootPathResolver
 from wirio._service_lookup._typed_type import TypedType
 from wirio._utils._extra_dependencies import ExtraDependencies
+from wirio.diagnostics.startup_profiler import profile_startup
 from wirio.hosting import HostEnvironment
 from wirio.settings.environment_variables.environment_variables_settings_source import (
     EnvironmentVariablesSettingsSource,
@@ -37,6 +38,9 @@ else:
     AzureKeyVaultSettingsSource = Any
 
 
+_PACKAGE_ROOT: Final = Path(__file__).resolve().parent
+
+
 @final
 class SettingsManager(SettingsBuilder, SettingsRoot):
     _content_root_path: Final[str]
@@ -50,7 +54,7 @@ class SettingsManager(SettingsBuilder, SettingsRoot):
 
         Args:
             content_root_path: Absolute path to the directory that contains the application content files.
-                If not provided, the content root path will be inferred from where `SettingsManager` is being instantiated, or from the current working directory if it can't be calculated.
+                If not provided, the content root path will be read from the `WIRIO_CONTENT_ROOT_PATH` environment variable, or inferred from where `SettingsManager` is being instantiated, or from the current working directory if it can't be calculated.
             add_default_providers: Whether to add the default settings providers.
 
         """
@@ -132,7 +136,10 @@ class SettingsManager(SettingsBuilder, SettingsRoot):
     def _add_source(self, source: SettingsSource) -> None:
         self._sources.append(source)
         provider = source.build(self)
-        self._call_async(provider.load())
+
+        with profile_startup("settings-load", provider):
+            self._call_async(provider.load())
+
         self._providers.append(provider)
 
     def _call_async(self, coroutine: Coroutine[Any, Any, None]) -> None:
@@ -255,8 +262,15 @@ class SettingsManager(SettingsBuilder, SettingsRoot):
         return any(not child.key.isdigit() for child in children)
 
     def _get_content_root_path(self) -> str:
-        package_root = Path(__file__).resolve().parent
-        return ContentRootPathResolver(package_root=package_root).resolve_path()
+        configured_content_root_path = (
+            HostEnvironment.get_configured_content_root_path()
+        )
+
+        if configured_content_root_path is not None:
+            return configured_content_root_path
+
+        with profile_startup("content-root", "SettingsManager"):
+            return ContentRootPathResolver(package_root=_PACKAGE_ROOT).resolve_path()
 
     def _call_async_in_new_thread(self, coroutine: Coroutine[Any, Any, None]) -> None:
         def run_coroutine() -> None:
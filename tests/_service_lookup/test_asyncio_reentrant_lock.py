@@ -35,6 +35,7 @@ import pytest
 
 from wirio._service_lookup._asyncio_reentrant_lock import (
     AsyncioReentrantLock,
+    AsyncioReentrantLockStatistics,
 )
 
 
@@ -758,3 +759,72 @@ class TestAsyncioReentrantLock:
         assert third_acquired.is_set()
         assert lock.owner is None
         assert len(lock.queue) == 0
+
+    async def test_task_waits_for_lock_acquired_outside_task(self) -> None:
+        lock = AsyncioReentrantLock()
+        acquired_outside_task = Event()
+
+        def acquire_outside_task() -> None:
+            with pytest.raises(StopIteration):
+                lock.acquire().send(None)
+
+            acquired_outside_task.set()
+
+        asyncio.get_running_loop().call_soon(acquire_outside_task)
+        await acquired_outside_task.wait()
+
+        assert lock.is_locked
+        assert lock.owner is None
+
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(lock.acquire(), 0.1)
+
+
+class TestAsyncioReentrantLockStatistics:
+    async def test_count_uncontended_acquisitions(self) -> None:
+        statistics = AsyncioReentrantLockStatistics()
+        lock = AsyncioReentrantLock(statistics)
+
+        async with lock, lock:
+            pass
+
+        assert statistics == AsyncioReentrantLockStatistics(acquisitions=2)
+
+    async def test_count_contended_acquisitions(self) -> None:
+        statistics = AsyncioReentrantLockStatistics()
+        lock = AsyncioReentrantLock(statistics)
+        waiters_count = 3
+
+        async def waiter() -> None:
+            async with lock:
+                pass
+
+        async with lock:
+            tasks = [asyncio.create_task(waiter()) for _ in range(waiters_count)]
+            await asyncio.sleep(0.01)
+
+        await asyncio.gather(*tasks)
+
+        assert statistics.acquisitions == waiters_count + 1
+        assert statistics.contended_acquisitions == waiters_count
+        assert statistics.max_queue_depth == waiters_count
+        assert statistics.total_wait_time > 0
+
+    async def test_share_default_statistics(self) -> None:
+        statistics = AsyncioReentrantLockStatistics()
+        AsyncioReentrantLock.set_default_statistics(statistics)
+
+        try:
+            first_lock = AsyncioReentrantLock()
+            second_lock = AsyncioReentrantLock()
+        finally:
+            AsyncioReentrantLock.set_default_statistics(None)
+
+        async with first_lock, second_lock:
+            pass
+
+        expected_acquisitions = 2
+        assert first_lock.statistics is statistics
+        assert second_lock.statistics is statistics
+        assert statistics.acquisitions == expected_acquisitions
+        assert AsyncioReentrantLock().statistics is None
@@ -2,7 +2,11 @@ from collections.abc import Sequence
 
 import pytest
 
-from tests.utils.services import ServiceWithGeneric, ServiceWithNoDependencies
+from tests.utils.services import (
+    ServiceWithDependencies,
+    ServiceWithGeneric,
+    ServiceWithNoDependencies,
+)
 from wirio._service_lookup._call_site_chain import CallSiteChain
 from wirio._service_lookup._call_site_factory import (
     CallSiteFactory,
@@ -11,6 +15,7 @@ from wirio._service_lookup._call_site_factory import (
 from wirio._service_lookup._constant_call_site import ConstantCallSite
 from wirio._service_lookup._sequence_call_site import SequenceCallSite
 from wirio._service_lookup._service_identifier import ServiceIdentifier
+from wirio._service_lookup._sync_factory_call_site import SyncFactoryCallSite
 from wirio._service_lookup._typed_type import TypedType
 from wirio._service_lookup.call_site_result_cache_location import (
     CallSiteResultCacheLocation,
@@ -141,6 +146,73 @@ class TestCallSiteFactory:
             CallSiteResultCacheLocation.SCOPE,
         ]
 
+    async def test_create_parameter_call_sites_for_implementation_factory(
+        self,
+    ) -> None:
+        def implementation_factory(
+            service_with_no_dependencies: ServiceWithNoDependencies,
+            _unregistered_service: ServiceWithGeneric[int] | None = None,
+        ) -> ServiceWithDependencies:
+            return ServiceWithDependencies(service_with_no_dependencies)
+
+        dependency_descriptor = ServiceDescriptor.from_implementation_type(
+            service_type=ServiceWithNoDependencies,
+            implementation_type=ServiceWithNoDependencies,
+            service_key=None,
+            lifetime=ServiceLifetime.SCOPED,
+            auto_activate=False,
+        )
+        factory_descriptor = ServiceDescriptor.from_sync_implementation_factory(
+            service_type=ServiceWithDependencies,
+            implementation_factory=implementation_factory,
+            lifetime=ServiceLifetime.TRANSIENT,
+            auto_activate=False,
+        )
+        call_site_factory = CallSiteFactory([dependency_descriptor, factory_descriptor])
+
+        call_site = await call_site_factory.get_call_site_from_service_descriptor(
+            factory_descriptor, CallSiteChain()
+        )
+        dependency_call_site = (
+            await call_site_factory.get_call_site_from_service_descriptor(
+                dependency_descriptor, CallSiteChain()
+            )
+        )
+
+        assert isinstance(call_site, SyncFactoryCallSite)
+        assert [parameter.parameter_type for parameter in call_site.parameters] == [
+            TypedType.from_type(ServiceWithNoDependencies),
+            TypedType.from_type(ServiceWithGeneric[int]),
+        ]
+        assert call_site.parameter_call_sites == [dependency_call_site, None]
+
+    async def test_skip_service_key_parameter_of_keyed_implementation_factory(
+        self,
+    ) -> None:
+        def implementation_factory(
+            _: str | None, service_with_no_dependencies: ServiceWithNoDependencies
+        ) -> ServiceWithDependencies:
+            return ServiceWithDependencies(service_with_no_dependencies)
+
+        factory_descriptor = ServiceDescriptor.from_keyed_sync_implementation_factory(
+            service_type=ServiceWithDependencies,
+            implementation_factory=implementation_factory,
+            service_key="key",
+            lifetime=ServiceLifetime.TRANSIENT,
+            auto_activate=False,
+        )
+        call_site_factory = CallSiteFactory([factory_descriptor])
+
+        call_site = await call_site_factory.get_call_site_from_service_descriptor(
+            factory_descriptor, CallSiteChain()
+        )
+
+        assert isinstance(call_site, SyncFactoryCallSite)
+        assert [parameter.parameter_type for parameter in call_site.parameters] == [
+            TypedType.from_type(ServiceWithNoDependencies)
+        ]
+        assert call_site.parameter_call_sites == [None]
+
     async def test_reuse_cached_sequence_call_site(self) -> None:
         descriptor = ServiceDescriptor.from_implementation_type(
             service_type=ServiceWithNoDependencies,
@@ -377,3 +449,50 @@ class TestCallSiteFactory:
         cache_item = ServiceDescriptorCacheItem()
 
         assert list(cache_item) == []
+
+    def test_sort_descriptors_by_dependencies(self) -> None:
+        service_with_dependencies_descriptor = (
+            ServiceDescriptor.from_implementation_type(
+                service_type=ServiceWithDependencies,
+                implementation_type=ServiceWithDependencies,
+                service_key=None,
+                lifetime=ServiceLifetime.TRANSIENT,
+                auto_activate=False,
+            )
+        )
+
+        def create_service_with_dependencies_sequence(
+            services: Sequence[ServiceWithDependencies],
+        ) -> ServiceWithGeneric[ServiceWithDependencies]:
+            del services
+            return ServiceWithGeneric[ServiceWithDependencies]()
+
+        service_with_generic_descriptor = (
+            ServiceDescriptor.from_sync_implementation_factory(
+                service_type=ServiceWithGeneric[ServiceWithDependencies],
+                implementation_factory=create_service_with_dependencies_sequence,
+                lifetime=ServiceLifetime.TRANSIENT,
+                auto_activate=False,
+            )
+        )
+        service_with_no_dependencies_descriptor = (
+            ServiceDescriptor.from_implementation_type(
+                service_type=ServiceWithNoDependencies,
+                implementation_type=ServiceWithNoDependencies,
+                service_key=None,
+                lifetime=ServiceLifetime.TRANSIENT,
+                auto_activate=False,
+            )
+        )
+        descriptors = [
+            service_with_generic_descriptor,
+            service_with_dependencies_descriptor,
+            service_with_no_dependencies_descriptor,
+        ]
+        call_site_factory = CallSiteFactory(descriptors)
+
+        assert call_site_factory.sort_by_dependencies(descriptors) == [
+            service_with_no_dependencies_descriptor,
+            service_with_dependencies_descriptor,
+            service_with_generic_descriptor,
+        ]
@@ -0,0 +1,207 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+
+from tests.utils.services import ServiceWithAsyncContextManagerAndNoDependencies
+from wirio.abstractions.base_service_provider import BaseServiceProvider
+from wirio.service_collection import ServiceCollection
+
+CONCURRENT_DEPENDENCIES_COUNT = 3
+
+
+class Session:
+    pass
+
+
+class HttpClient:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+
+class Database:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+
+class Cache:
+    pass
+
+
+class Application:
+    def __init__(
+        self, http_client: HttpClient, database: Database, cache: Cache
+    ) -> None:
+        self.http_client = http_client
+        self.database = database
+        self.cache = cache
+
+
+class TestCallSiteRuntimeResolverConcurrentResolution:
+    async def test_resolve_dependencies_concurrently(self) -> None:
+        barrier = asyncio.Barrier(CONCURRENT_DEPENDENCIES_COUNT)
+
+        async def create_http_client(session: Session) -> HttpClient:
+            await barrier.wait()
+            return HttpClient(session)
+
+        async def create_database(session: Session) -> Database:
+            await barrier.wait()
+            return Database(session)
+
+        async def create_cache() -> Cache:
+            await barrier.wait()
+            return Cache()
+
+        services = ServiceCollection()
+        services.add_scoped(Session)
+        services.add_scoped(HttpClient, create_http_client)
+        services.add_scoped(Database, create_database)
+        services.add_scoped(Cache, create_cache)
+        services.add_scoped(Application)
+
+        async with (
+            services.build_service_provider(
+                resolves_concurrently=True
+            ) as service_provider,
+            service_provider.create_scope() as service_scope,
+            asyncio.timeout(1),
+        ):
+            # Each factory waits for the others, so it only finishes if they run concurrently
+            application = await service_scope.get_required_service(Application)
+
+        assert application.http_client.session is application.database.session
+
+    async def test_create_shared_scoped_dependency_once(self) -> None:
+        created_sessions_count = 0
+
+        async def create_session() -> Session:
+            nonlocal created_sessions_count
+            created_sessions_count += 1
+            await asyncio.sleep(0)
+            return Session()
+
+        services = ServiceCollection()
+        services.add_scoped(Session, create_session)
+        services.add_transient(HttpClient)
+        services.add_transient(Database)
+
+        async def create_application(
+            http_client: HttpClient, database: Database
+        ) -> Application:
+            return Application(http_client, database, Cache())
+
+        services.add_scoped(Application, create_application)
+
+        async with (
+            services.build_service_provider(
+                resolves_concurrently=True
+            ) as service_provider,
+            service_provider.create_scope() as service_scope,
+        ):
+            application = await service_scope.get_required_service(Application)
+
+        assert created_sessions_count == 1
+        assert application.http_client.session is application.database.session
+
+    async def test_resolve_scoped_service_from_factory_resolved_concurrently(
+        self,
+    ) -> None:
+        barrier = asyncio.Barrier(2)
+
+        async def create_http_client(
+            service_provider: BaseServiceProvider,
+        ) -> HttpClient:
+            session = await service_provider.get_required_service(Session)
+            await barrier.wait()
+            return HttpClient(session)
+
+        async def create_database(service_provider: BaseServiceProvider) -> Database:
+            session = await service_provider.get_required_service(Session)
+            await barrier.wait()
+            return Database(session)
+
+        async def create_application(
+            http_client: HttpClient, database: Database
+        ) -> Application:
+            return Application(http_client, database, Cache())
+
+        services = ServiceCollection()
+        services.add_scoped(Session)
+        services.add_scoped(HttpClient, create_http_client)
+        services.add_scoped(Database, create_database)
+        services.add_scoped(Application, create_application)
+
+        async with (
+            services.build_service_provider(
+                resolves_concurrently=True
+            ) as service_provider,
+            service_provider.create_scope() as service_scope,
+            asyncio.timeout(1),
+        ):
+            # The factories run in child tasks while the parent task holds the lock of the scope
+            application = await service_scope.get_required_service(Application)
+            session = await service_scope.get_required_service(Session)
+
+        assert application.http_client.session is session
+        assert application.database.session is session
+
+    async def test_dispose_services_created_concurrently(self) -> None:
+        disposables: list[ServiceWithAsyncContextManagerAndNoDependencies] = []
+
+        async def create_disposable() -> AsyncGenerator[
+            ServiceWithAsyncContextManagerAndNoDependencies
+        ]:
+            disposable = ServiceWithAsyncContextManagerAndNoDependencies()
+            disposables.append(disposable)
+
+            async with disposable:
+                yield disposable
+
+        class Consumer:
+            def __init__(
+                self,
+                first: ServiceWithAsyncContextManagerAndNoDependencies,
+                second: ServiceWithAsyncContextManagerAndNoDependencies,
+            ) -> None:
+                self.first = first
+                self.second = second
+
+        services = ServiceCollection()
+        services.add_transient(
+            ServiceWithAsyncContextManagerAndNoDependencies, create_disposable
+        )
+        services.add_scoped(Consumer)
+
+        async with (
+            services.build_service_provider(
+                resolves_concurrently=True
+            ) as service_provider,
+            service_provider.create_scope() as service_scope,
+        ):
+            consumer = await service_scope.get_required_service(Consumer)
+
+        assert consumer.first is not consumer.second
+        assert [disposable.is_disposed for disposable in disposables] == [True, True]
+
+    async def test_raise_dependency_error_when_resolving_concurrently(self) -> None:
+        error_message = "Database is unavailable"
+
+        async def create_database() -> Database:
+            raise RuntimeError(error_message)
+
+        services = ServiceCollection()
+        services.add_scoped(Session)
+        services.add_scoped(HttpClient)
+        services.add_scoped(Database, create_database)
+        services.add_scoped(Cache)
+        services.add_scoped(Application)
+
+        async with (
+            services.build_service_provider(
+                resolves_concurrently=True
+            ) as service_provider,
+            service_provider.create_scope() as service_scope,
+        ):
+            with pytest.raises(RuntimeError, match=error_message):
+                await service_scope.get_required_service(Application)
@@ -0,0 +1,274 @@
+import asyncio
+from collections.abc import Generator, Sequence
+
+import pytest
+
+from tests.utils.services import (
+    ServiceWithNoDependencies,
+    ServiceWithSyncContextManagerAndNoDependencies,
+)
+from wirio.exceptions import (
+    NoServiceRegisteredError,
+    ServiceNotSyncResolvableError,
+    ServiceProviderNotInitializedError,
+)
+from wirio.service_collection import ServiceCollection
+
+
+class Clock:
+    pass
+
+
+class Repository:
+    def __init__(self, clock: Clock) -> None:
+        self.clock = clock
+
+
+class Handler:
+    def __init__(self, repository: Repository) -> None:
+        self.repository = repository
+
+
+class AsyncHandler:
+    def __init__(self, service_with_no_dependencies: ServiceWithNoDependencies) -> None:
+        self.service_with_no_dependencies = service_with_no_dependencies
+
+
+class TestCallSiteSyncResolver:
+    async def test_resolve_sync_resolvable_graph(self) -> None:
+        services = ServiceCollection()
+        services.add_singleton(Clock)
+        services.add_scoped(Repository)
+        services.add_transient(Handler)
+
+        async with services.build_service_provider() as service_provider:
+            async with service_provider.create_scope() as service_scope:
+                first_handler = service_scope.get_required_service_sync(Handler)
+                second_handler = service_scope.get_required_service_sync(Handler)
+                clock = await service_scope.get_required_service(Clock)
+
+            async with service_provider.create_scope() as other_service_scope:
+                other_handler = other_service_scope.get_required_service_sync(Handler)
+
+        assert first_handler is not second_handler
+        assert first_handler.repository is second_handler.repository
+        assert first_handler.repository is not other_handler.repository
+        assert first_handler.repository.clock is clock
+        assert other_handler.repository.clock is clock
+
+    async def test_dispose_sync_services_when_scope_is_disposed(self) -> None:
+        is_generator_disposed = False
+
+        def create_repository(clock: Clock) -> Generator[Repository]:
+            nonlocal is_generator_disposed
+            yield Repository(clock)
+            is_generator_disposed = True
+
+        services = ServiceCollection()
+        services.add_singleton(Clock)
+        services.add_scoped(create_repository)
+        services.add_transient(ServiceWithSyncContextManagerAndNoDependencies)
+
+        async with services.build_service_provider() as service_provider:
+            async with service_provider.create_scope() as service_scope:
+                repository = service_scope.get_required_service_sync(Repository)
+                sync_service = service_scope.get_required_service_sync(
+                    ServiceWithSyncContextManagerAndNoDependencies
+                )
+
+                assert isinstance(repository, Repository)
+                assert sync_service.is_disposed_initialized
+                assert not sync_service.is_disposed
+                assert not is_generator_disposed
+
+            assert sync_service.is_disposed
+            assert is_generator_disposed
+
+    async def test_resolve_sequence(self) -> None:
+        services = ServiceCollection()
+        services.add_scoped(Clock)
+        services.add_transient(Clock)
+
+        async with (
+            services.build_service_provider() as service_provider,
+            service_provider.create_scope() as service_scope,
+        ):
+            clocks = service_scope.get_required_service_sync(Sequence[Clock])
+            clocks_again = service_scope.get_required_service_sync(Sequence[Clock])
+
+        expected_services_count = 2
+        assert len(clocks) == expected_services_count
+        assert clocks[0] is clocks_again[0]
+        assert clocks[1] is not clocks_again[1]
+
+    async def test_fail_when_service_requires_async_factory(self) -> None:
+        async def create_clock() -> Clock:
+            return Clock()
+
+        services = ServiceCollection()
+        services.add_transient(create_clock)
+        services.add_transient(Repository)
+
+        async with services.build_service_provider() as service_provider:
+            with pytest.raises(ServiceNotSyncResolvableError):
+                service_provider.get_required_service_sync(Repository)
+
+    async def test_fail_when_service_requires_async_context_manager(self) -> None:
+        services = ServiceCollection()
+        services.add_transient(ServiceWithNoDependencies)
+        services.add_transient(AsyncHandler)
+
+        async with services.build_service_provider() as service_provider:
+            with pytest.raises(ServiceNotSyncResolvableError):
+                service_provider.get_required_service_sync(AsyncHandler)
+
+    async def test_not_run_async_singleton_factory_when_service_is_not_sync_resolvable(
+        self,
+    ) -> None:
+        is_clock_factory_called = False
+
+        async def create_clock() -> Clock:
+            nonlocal is_clock_factory_called
+            is_clock_factory_called = True
+            return Clock()
+
+        services = ServiceCollection()
+        services.add_singleton(create_clock)
+
+        async with services.build_service_provider(
+            validate_on_build=False
+        ) as service_provider:
+            with pytest.raises(ServiceNotSyncResolvableError):
+                service_provider.get_required_service_sync(Clock)
+
+        assert not is_clock_factory_called
+
+    async def test_not_create_services_when_dependency_is_async_context_manager(
+        self,
+    ) -> None:
+        created_services: list[object] = []
+
+        class CountedClock(Clock):
+            def __init__(self) -> None:
+                created_services.append(self)
+
+        class CountedAsyncHandler(AsyncHandler):
+            def __init__(
+                self,
+                clock: Clock,
+                service_with_no_dependencies: ServiceWithNoDependencies,
+            ) -> None:
+                super().__init__(service_with_no_dependencies)
+                self.clock = clock
+                created_services.append(self)
+
+        class CountedServiceWithNoDependencies(ServiceWithNoDependencies):
+            def __init__(self) -> None:
+                created_services.append(self)
+
+        services = ServiceCollection()
+        services.add_transient(Clock, CountedClock)
+        services.add_transient(
+            ServiceWithNoDependencies, CountedServiceWithNoDependencies
+        )
+        services.add_transient(AsyncHandler, CountedAsyncHandler)
+
+        async with services.build_service_provider() as service_provider:
+            with pytest.raises(ServiceNotSyncResolvableError):
+                service_provider.get_required_service_sync(AsyncHandler)
+
+        assert created_services == []
+
+    async def test_return_already_created_async_scoped_service(self) -> None:
+        services = ServiceCollection()
+        services.add_scoped(ServiceWithNoDependencies)
+
+        async with (
+            services.build_service_provider() as service_provider,
+            service_provider.create_scope() as service_scope,
+        ):
+            service = await service_scope.get_required_service(
+                ServiceWithNoDependencies
+            )
+            sync_service = service_scope.get_required_service_sync(
+                ServiceWithNoDependencies
+            )
+
+        assert sync_service is service
+
+    async def test_resolve_dependent_of_already_created_async_singletons(
+        self,
+    ) -> None:
+        async def create_clock() -> Clock:
+            return Clock()
+
+        services = ServiceCollection()
+        services.add_singleton(create_clock)
+        services.add_singleton(ServiceWithNoDependencies)
+        services.add_transient(Repository)
+        services.add_transient(AsyncHandler)
+
+        async with services.build_service_provider() as service_provider:
+            clock = await service_provider.get_required_service(Clock)
+            service_with_no_dependencies = await service_provider.get_required_service(
+                ServiceWithNoDependencies
+            )
+            repository = service_provider.get_required_service_sync(Repository)
+            async_handler = service_provider.get_required_service_sync(AsyncHandler)
+
+        assert repository.clock is clock
+        assert async_handler.service_with_no_dependencies is (
+            service_with_no_dependencies
+        )
+
+    async def test_resolve_async_graph_from_another_thread(self) -> None:
+        services = ServiceCollection()
+        services.add_singleton(ServiceWithNoDependencies)
+        services.add_transient(AsyncHandler)
+
+        async with services.build_service_provider() as service_provider:
+
+            def get_handler() -> AsyncHandler:
+                return service_provider.get_required_service_sync(AsyncHandler)
+
+            handler = await asyncio.to_thread(get_handler)
+            service = await service_provider.get_required_service(
+                ServiceWithNoDependencies
+            )
+
+        assert handler.service_with_no_dependencies is service
+
+    async def test_fail_when_service_is_not_registered(self) -> None:
+        services = ServiceCollection()
+
+        async with services.build_service_provider() as service_provider:
+            assert service_provider.get_service_sync(Clock) is None
+
+            with pytest.raises(NoServiceRegisteredError):
+                service_provider.get_required_service_sync(Clock)
+
+    async def test_fail_when_service_provider_is_not_initialized(self) -> None:
+        services = ServiceCollection()
+        services.add_transient(Clock)
+        service_provider = services.build_service_provider()
+
+        with pytest.raises(ServiceProviderNotInitializedError):
+            service_provider.get_required_service_sync(Clock)
+
+        assert not service_provider.is_fully_initialized
+
+    def test_resolve_without_running_event_loop(self) -> None:
+        services = ServiceCollection()
+        services.add_singleton(Clock)
+        services.add_transient(Repository)
+        service_provider = services.build_service_provider()
+        asyncio.run(service_provider.__aenter__())
+
+        try:
+            repository = service_provider.get_required_service_sync(Repository)
+            other_repository = service_provider.get_required_service_sync(Repository)
+        finally:
+            asyncio.run(service_provider.aclose())
+
+        assert repository is not other_repository
+        assert repository.clock is other_repository.clock
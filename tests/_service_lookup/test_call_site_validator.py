@@ -1,5 +1,7 @@
 from collections.abc import AsyncGenerator, Generator, Sequence
 
+from pytest_mock import MockerFixture
+
 from tests.utils.services import ServiceWithNoDependencies
 from wirio._service_lookup._async_factory_call_site import AsyncFactoryCallSite
 from wirio._service_lookup._async_generator_factory_call_site import (
@@ -81,6 +83,36 @@ class TestCallSiteValidator:
             root_scope = service_provider.root
             validator.validate_resolution(sequence_call_site, root_scope, root_scope)
 
+    async def test_visit_call_site_without_scoped_dependencies_once(
+        self, mocker: MockerFixture
+    ) -> None:
+        item_type = TypedType.from_type(ServiceWithNoDependencies)
+        singleton_call_site = ConstructorCallSite(
+            cache=ResultCache.from_lifetime(
+                lifetime=ServiceLifetime.SINGLETON,
+                service_identifier=ServiceIdentifier.from_service_type(item_type),
+                slot=0,
+            ),
+            service_type=item_type,
+            constructor_information=ConstructorInformation(item_type),
+            parameters=[],
+            parameter_call_sites=[],
+        )
+        sequence_type = TypedType.from_type(Sequence[ServiceWithNoDependencies])
+        sequence_call_site = SequenceCallSite(
+            result_cache=ResultCache.none(sequence_type),
+            item_type=item_type,
+            service_call_sites=[singleton_call_site, singleton_call_site],
+            service_key=None,
+        )
+        validator = CallSiteValidator()
+        visit_constructor_spy = mocker.spy(validator, "_visit_constructor")
+
+        await validator.validate_call_site(sequence_call_site)
+        await validator.validate_call_site(singleton_call_site)
+
+        assert visit_constructor_spy.call_count == 1
+
     async def test_not_fail_when_resolving_constant_from_root(self) -> None:
         service_type = TypedType.from_type(ServiceWithNoDependencies)
         call_site = ConstantCallSite(
@@ -100,6 +132,8 @@ class TestCallSiteValidator:
             cache=ResultCache.none(service_type=service_type),
             service_type=service_type,
             implementation_factory=implementation_factory,
+            parameters=[],
+            parameter_call_sites=[],
         )
 
         await self._assert_not_fail_when_resolving_from_root(call_site)
@@ -114,6 +148,8 @@ class TestCallSiteValidator:
             cache=ResultCache.none(service_type=service_type),
             service_type=service_type,
             implementation_factory=implementation_factory,
+            parameters=[],
+            parameter_call_sites=[],
         )
 
         await self._assert_not_fail_when_resolving_from_root(call_site)
@@ -130,6 +166,8 @@ class TestCallSiteValidator:
             cache=ResultCache.none(service_type=service_type),
             service_type=service_type,
             implementation_factory=implementation_factory,
+            parameters=[],
+            parameter_call_sites=[],
         )
 
         await self._assert_not_fail_when_resolving_from_root(call_site)
@@ -146,6 +184,8 @@ class TestCallSiteValidator:
             cache=ResultCache.none(service_type=service_type),
             service_type=service_type,
             implementation_factory=implementation_factory,
+            parameters=[],
+            parameter_call_sites=[],
         )
 
         await self._assert_not_fail_when_resolving_from_root(call_site)
@@ -0,0 +1,230 @@
+from collections.abc import AsyncGenerator, Generator, Sequence
+
+import pytest
+
+from tests.utils.services import (
+    ServiceWithAsyncContextManagerAndDependencies,
+    ServiceWithAsyncContextManagerAndNoDependencies,
+    ServiceWithDependencies,
+    ServiceWithNoDependencies,
+    ServiceWithOptionalDependency,
+    ServiceWithOptionalDependencyWithDefault,
+    ServiceWithSyncContextManagerAndNoDependencies,
+)
+from wirio.service_collection import ServiceCollection
+from wirio.service_provider_mode import ServiceProviderMode
+
+
+class TestCompiledServiceProviderEngine:
+    async def test_resolve_same_scoped_instance_within_scope(self) -> None:
+        services = ServiceCollection()
+        services.add_scoped(ServiceWithNoDependencies)
+        services.add_transient(ServiceWithDependencies)
+
+        async with services.build_service_provider(
+            mode=ServiceProviderMode.COMPILED
+        ) as service_provider:
+            async with service_provider.create_scope() as service_scope:
+                first_service = await service_scope.get_required_service(
+                    ServiceWithDependencies
+                )
+                second_service = await service_scope.get_required_service(
+                    ServiceWithDependencies
+                )
+
+            async with service_provider.create_scope() as other_service_scope:
+                other_service = await other_service_scope.get_required_service(
+                    ServiceWithDependencies
+                )
+
+        assert first_service is not second_service
+        assert (
+            first_service.service_with_no_dependencies
+            is second_service.service_with_no_dependencies
+        )
+        assert (
+            first_service.service_with_no_dependencies
+            is not other_service.service_with_no_dependencies
+        )
+
+    async def test_resolve_same_singleton_instance_from_scopes(self) -> None:
+        services = ServiceCollection()
+        services.add_singleton(ServiceWithNoDependencies)
+        services.add_scoped(ServiceWithDependencies)
+
+        async with services.build_service_provider(
+            mode=ServiceProviderMode.COMPILED
+        ) as service_provider:
+            async with service_provider.create_scope() as service_scope:
+                first_service = await service_scope.get_required_service(
+                    ServiceWithDependencies
+                )
+
+            async with service_provider.create_scope() as other_service_scope:
+                other_service = await other_service_scope.get_required_service(
+                    ServiceWithDependencies
+                )
+
+        assert first_service is not other_service
+        assert (
+            first_service.service_with_no_dependencies
+            is other_service.service_with_no_dependencies
+        )
+
+    async def test_dispose_services_when_scope_is_disposed(self) -> None:
+        services = ServiceCollection()
+        services.add_scoped(ServiceWithAsyncContextManagerAndNoDependencies)
+        services.add_transient(ServiceWithAsyncContextManagerAndDependencies)
+        services.add_transient(ServiceWithSyncContextManagerAndNoDependencies)
+
+        async with services.build_service_provider(
+            mode=ServiceProviderMode.COMPILED
+        ) as service_provider:
+            async with service_provider.create_scope() as service_scope:
+                service = await service_scope.get_required_service(
+                    ServiceWithAsyncContextManagerAndDependencies
+                )
+                sync_service = await service_scope.get_required_service(
+                    ServiceWithSyncContextManagerAndNoDependencies
+                )
+
+                assert service.is_disposed_initialized
+                assert sync_service.is_disposed_initialized
+                assert not service.is_disposed
+
+            assert service.is_disposed
+            assert service.service_with_async_context_manager_and_no_dependencies.is_disposed
+            assert sync_service.is_disposed
+
+    async def test_resolve_generator_factories(self) -> None:
+        is_sync_generator_disposed = False
+        is_async_generator_disposed = False
+
+        def create_service_with_no_dependencies() -> Generator[
+            ServiceWithNoDependencies
+        ]:
+            nonlocal is_sync_generator_disposed
+            yield ServiceWithNoDependencies()
+            is_sync_generator_disposed = True
+
+        async def create_service_with_dependencies(
+            service_with_no_dependencies: ServiceWithNoDependencies,
+        ) -> AsyncGenerator[ServiceWithDependencies]:
+            nonlocal is_async_generator_disposed
+            yield ServiceWithDependencies(service_with_no_dependencies)
+            is_async_generator_disposed = True
+
+        services = ServiceCollection()
+        services.add_scoped(create_service_with_no_dependencies)
+        services.add_transient(create_service_with_dependencies)
+
+        async with services.build_service_provider(
+            mode=ServiceProviderMode.COMPILED
+        ) as service_provider:
+            async with service_provider.create_scope() as service_scope:
+                service = await service_scope.get_required_service(
+                    ServiceWithDependencies
+                )
+
+                assert isinstance(
+                    service.service_with_no_dependencies, ServiceWithNoDependencies
+                )
+
+            assert is_sync_generator_disposed
+            assert is_async_generator_disposed
+
+    async def test_resolve_sequence(self) -> None:
+        services = ServiceCollection()
+        services.add_scoped(ServiceWithNoDependencies)
+        services.add_transient(ServiceWithNoDependencies)
+
+        async with (
+            services.build_service_provider(
+                mode=ServiceProviderMode.COMPILED
+            ) as service_provider,
+            service_provider.create_scope() as service_scope,
+        ):
+            resolved_services = await service_scope.get_required_service(
+                Sequence[ServiceWithNoDependencies]
+            )
+            resolved_services_again = await service_scope.get_required_service(
+                Sequence[ServiceWithNoDependencies]
+            )
+
+        expected_services_count = 2
+        assert len(resolved_services) == expected_services_count
+        assert resolved_services[0] is resolved_services_again[0]
+        assert resolved_services[1] is not resolved_services_again[1]
+
+    async def test_resolve_optional_dependencies(self) -> None:
+        services = ServiceCollection()
+        services.add_transient(ServiceWithOptionalDependency)
+        services.add_transient(ServiceWithOptionalDependencyWithDefault)
+
+        async with services.build_service_provider(
+            mode=ServiceProviderMode.COMPILED
+        ) as service_provider:
+            service_with_optional_dependency = (
+                await service_provider.get_required_service(
+                    ServiceWithOptionalDependency
+                )
+            )
+            service_with_optional_dependency_with_default = (
+                await service_provider.get_required_service(
+                    ServiceWithOptionalDependencyWithDefault
+                )
+            )
+
+        assert service_with_optional_dependency.optional_dependency is None
+        assert (
+            service_with_optional_dependency_with_default.optional_dependency
+            is ServiceWithOptionalDependencyWithDefault.DEFAULT_DEPENDENCY
+        )
+
+    async def test_resolve_overridden_dependency_after_compilation(self) -> None:
+        services = ServiceCollection()
+        services.add_transient(ServiceWithNoDependencies)
+        services.add_transient(ServiceWithDependencies)
+
+        async with services.build_service_provider(
+            mode=ServiceProviderMode.COMPILED
+        ) as service_provider:
+            resolved_service = await service_provider.get_required_service(
+                ServiceWithDependencies
+            )
+            overridden_instance = ServiceWithNoDependencies()
+
+            with service_provider.override_service(
+                ServiceWithNoDependencies, overridden_instance
+            ):
+                overridden_service = await service_provider.get_required_service(
+                    ServiceWithDependencies
+                )
+
+            resolved_service_after_override = (
+                await service_provider.get_required_service(ServiceWithDependencies)
+            )
+
+        assert resolved_service.service_with_no_dependencies is not overridden_instance
+        assert overridden_service.service_with_no_dependencies is overridden_instance
+        assert (
+            resolved_service_after_override.service_with_no_dependencies
+            is not overridden_instance
+        )
+
+    async def test_fail_when_required_dependency_resolves_to_none(self) -> None:
+        def create_service_with_no_dependencies() -> ServiceWithNoDependencies:
+            return None  # ty: ignore[invalid-return-type] # pyright: ignore[reportReturnType]
+
+        services = ServiceCollection()
+        services.add_transient(create_service_with_no_dependencies)
+        services.add_transient(ServiceWithDependencies)
+
+        async with services.build_service_provider(
+            mode=ServiceProviderMode.COMPILED
+        ) as service_provider:
+            with pytest.raises(
+                RuntimeError,
+                match=r"Unable to resolve service with type '.*ServiceWithNoDependencies' while attempting to activate '.*ServiceWithDependencies'",
+            ):
+                await service_provider.get_required_service(ServiceWithDependencies)
@@ -41,3 +41,12 @@ class TestConstantCallSite:
         )
 
         assert constant_call_site.service_type is service_type
+
+    def test_create_lock_on_first_use(self) -> None:
+        service_type = TypedType.from_type(ServiceWithNoDependencies)
+        constant_call_site = ConstantCallSite(
+            service_type=service_type, default_value=None
+        )
+
+        assert constant_call_site.lock is constant_call_site.lock
+        assert not hasattr(constant_call_site, "__dict__")
@@ -0,0 +1,227 @@
+import importlib
+import json
+import sys
+from inspect import Parameter
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from tests.utils.services import ServiceWithDependencies, ServiceWithNoDependencies
+from wirio._service_lookup._constructor_information import ConstructorInformation
+from wirio._service_lookup._dependency_graph_cache import DependencyGraphCache
+from wirio._service_lookup._typed_type import TypedType
+from wirio.service_collection import ServiceCollection
+
+KIND = DependencyGraphCache.CONSTRUCTOR_PARAMETERS
+
+
+_DEFAULT_SERVICE = object()
+
+
+class ServiceWithDefaultValue:
+    def __init__(self, service: object = _DEFAULT_SERVICE) -> None:
+        self.service = service
+
+
+def _introspect_service_with_dependencies() -> list[Parameter]:
+    return ConstructorInformation(
+        TypedType.from_type(ServiceWithDependencies)
+    ).get_signature_parameters()
+
+
+def _introspect_nothing() -> list[Parameter]:
+    return []
+
+
+class TestDependencyGraphCache:
+    def test_reuse_value_introspected_in_previous_run(
+        self, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        cache_path = tmp_path / "dependency-graph.cache"
+        dependency_graph_cache = DependencyGraphCache(cache_path)
+        value = dependency_graph_cache.get_or_introspect_parameters(
+            KIND, ServiceWithDependencies, _introspect_service_with_dependencies
+        )
+        dependency_graph_cache.save()
+        introspect = mocker.Mock(side_effect=_introspect_service_with_dependencies)
+
+        cached_value = DependencyGraphCache(cache_path).get_or_introspect_parameters(
+            KIND, ServiceWithDependencies, introspect
+        )
+
+        introspect.assert_not_called()
+        assert cached_value == value
+        assert [parameter.name for parameter in cached_value] == [
+            "service_with_no_dependencies"
+        ]
+        assert cached_value[0].annotation is ServiceWithNoDependencies
+
+    def test_introspect_again_when_module_changed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+    ) -> None:
+        module_path = tmp_path / "cached_services.py"
+        module_path.write_text("class CachedService:\n    pass\n")
+        monkeypatch.setattr(sys, "path", [str(tmp_path), *sys.path])
+        monkeypatch.delitem(sys.modules, "cached_services", raising=False)
+        cached_service_type = importlib.import_module("cached_services").CachedService
+        cache_path = tmp_path / "dependency-graph.cache"
+        dependency_graph_cache = DependencyGraphCache(cache_path)
+        dependency_graph_cache.get_or_introspect_parameters(
+            KIND, cached_service_type, _introspect_nothing
+        )
+        dependency_graph_cache.save()
+        module_path.write_text("class CachedService:\n    value = 1\n")
+        introspect = mocker.Mock(return_value=[])
+
+        DependencyGraphCache(cache_path).get_or_introspect_parameters(
+            KIND, cached_service_type, introspect
+        )
+
+        introspect.assert_called_once()
+
+    def test_introspect_again_when_module_of_annotation_type_changed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+    ) -> None:
+        annotation_module_path = tmp_path / "cached_dependencies.py"
+        annotation_module_path.write_text("class CachedDependency:\n    pass\n")
+        (tmp_path / "cached_dependents.py").write_text(
+            "from cached_dependencies import CachedDependency\n\n\n"
+            "class CachedDependent:\n"
+            "    def __init__(self, dependency: CachedDependency) -> None:\n"
+            "        pass\n"
+        )
+        monkeypatch.setattr(sys, "path", [str(tmp_path), *sys.path])
+        monkeypatch.delitem(sys.modules, "cached_dependencies", raising=False)
+        monkeypatch.delitem(sys.modules, "cached_dependents", raising=False)
+        cached_service_type = importlib.import_module(
+            "cached_dependents"
+        ).CachedDependent
+
+        def introspect_cached_service() -> list[Parameter]:
+            return ConstructorInformation(
+                TypedType.from_type(cached_service_type)
+            ).get_signature_parameters()
+
+        cache_path = tmp_path / "dependency-graph.cache"
+        dependency_graph_cache = DependencyGraphCache(cache_path)
+        dependency_graph_cache.get_or_introspect_parameters(
+            KIND, cached_service_type, introspect_cached_service
+        )
+        dependency_graph_cache.save()
+        annotation_module_path.write_text("class CachedDependency:\n    value = 1\n")
+        introspect = mocker.Mock(side_effect=introspect_cached_service)
+
+        DependencyGraphCache(cache_path).get_or_introspect_parameters(
+            KIND, cached_service_type, introspect
+        )
+
+        introspect.assert_called_once()
+
+    def test_keep_identity_of_default_values(self, tmp_path: Path) -> None:
+        def introspect() -> list[Parameter]:
+            return ConstructorInformation(
+                TypedType.from_type(ServiceWithDefaultValue)
+            ).get_signature_parameters()
+
+        cache_path = tmp_path / "dependency-graph.cache"
+        dependency_graph_cache = DependencyGraphCache(cache_path)
+        dependency_graph_cache.get_or_introspect_parameters(
+            KIND, ServiceWithDefaultValue, introspect
+        )
+        dependency_graph_cache.save()
+
+        cached_value = DependencyGraphCache(cache_path).get_or_introspect_parameters(
+            KIND, ServiceWithDefaultValue, _introspect_nothing
+        )
+
+        assert len(cached_value) == 1
+        assert cached_value[0].default is _DEFAULT_SERVICE
+
+    def test_save_data_only(self, tmp_path: Path) -> None:
+        cache_path = tmp_path / "dependency-graph.cache"
+        dependency_graph_cache = DependencyGraphCache(cache_path)
+        dependency_graph_cache.get_or_introspect_parameters(
+            KIND, ServiceWithDependencies, _introspect_service_with_dependencies
+        )
+        dependency_graph_cache.save()
+
+        content = json.loads(cache_path.read_text(encoding="utf-8"))
+
+        assert isinstance(content, dict)
+
+    def test_introspect_again_when_python_version_changed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+    ) -> None:
+        cache_path = tmp_path / "dependency-graph.cache"
+        dependency_graph_cache = DependencyGraphCache(cache_path)
+        dependency_graph_cache.get_or_introspect_parameters(
+            KIND, ServiceWithDependencies, _introspect_service_with_dependencies
+        )
+        dependency_graph_cache.save()
+        monkeypatch.setattr(sys, "version", "another version")
+        introspect = mocker.Mock(side_effect=_introspect_service_with_dependencies)
+
+        DependencyGraphCache(cache_path).get_or_introspect_parameters(
+            KIND, ServiceWithDependencies, introspect
+        )
+
+        introspect.assert_called_once()
+
+    def test_ignore_corrupted_cache(self, tmp_path: Path) -> None:
+        cache_path = tmp_path / "dependency-graph.cache"
+        cache_path.write_bytes(b"corrupted")
+        dependency_graph_cache = DependencyGraphCache(cache_path)
+
+        value = dependency_graph_cache.get_or_introspect_parameters(
+            KIND, ServiceWithDependencies, _introspect_service_with_dependencies
+        )
+        dependency_graph_cache.save()
+
+        assert [parameter.name for parameter in value] == [
+            "service_with_no_dependencies"
+        ]
+        assert cache_path.read_bytes() != b"corrupted"
+
+    def test_not_save_local_types(self, tmp_path: Path) -> None:
+        class LocalService:
+            pass
+
+        cache_path = tmp_path / "dependency-graph.cache"
+        dependency_graph_cache = DependencyGraphCache(cache_path)
+
+        dependency_graph_cache.get_or_introspect_parameters(
+            KIND, LocalService, _introspect_nothing
+        )
+        dependency_graph_cache.save()
+
+        assert not cache_path.exists()
+
+    async def test_build_service_provider_without_introspecting_cached_services(
+        self, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        cache_path = tmp_path / "dependency-graph.cache"
+
+        def create_services() -> ServiceCollection:
+            services = ServiceCollection()
+            services.use_dependency_graph_cache(cache_path)
+            services.add_singleton(ServiceWithNoDependencies)
+            services.add_transient(ServiceWithDependencies)
+            return services
+
+        async with create_services().build_service_provider():
+            pass
+
+        get_signature_parameters_spy = mocker.spy(
+            ConstructorInformation, "get_signature_parameters"
+        )
+
+        async with create_services().build_service_provider() as service_provider:
+            service = await service_provider.get_required_service(
+                ServiceWithDependencies
+            )
+
+        get_signature_parameters_spy.assert_not_called()
+        assert isinstance(
+            service.service_with_no_dependencies, ServiceWithNoDependencies
+        )
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+
+from tests.utils.services import ServiceWithDependencies, ServiceWithNoDependencies
+from wirio._service_lookup._call_site_compiler import CallSiteCompiler
+from wirio.service_collection import ServiceCollection
+from wirio.service_container import ServiceContainer
+from wirio.service_provider_mode import ServiceProviderMode
+
+
+class TestDynamicServiceProviderEngine:
+    async def test_compile_service_after_reaching_compilation_threshold(
+        self, mocker: MockerFixture
+    ) -> None:
+        compile_spy = mocker.spy(CallSiteCompiler, "compile")
+        compilation_threshold = 3
+        services = ServiceCollection()
+        services.add_transient(ServiceWithNoDependencies)
+
+        async with services.build_service_provider(
+            mode=ServiceProviderMode.DYNAMIC,
+            compilation_threshold=compilation_threshold,
+        ) as service_provider:
+            for _ in range(compilation_threshold - 1):
+                await service_provider.get_required_service(ServiceWithNoDependencies)
+                await asyncio.sleep(0)
+
+            compile_spy.assert_not_called()
+
+            await service_provider.get_required_service(ServiceWithNoDependencies)
+            await asyncio.sleep(0)
+
+            compile_spy.assert_called_once()
+
+            for _ in range(compilation_threshold):
+                await service_provider.get_required_service(ServiceWithNoDependencies)
+                await asyncio.sleep(0)
+
+            compile_spy.assert_called_once()
+
+    async def test_resolve_same_scoped_instance_after_compilation(self) -> None:
+        services = ServiceCollection()
+        services.add_scoped(ServiceWithNoDependencies)
+        services.add_transient(ServiceWithDependencies)
+
+        async with (
+            services.build_service_provider(
+                mode=ServiceProviderMode.DYNAMIC, compilation_threshold=1
+            ) as service_provider,
+            service_provider.create_scope() as service_scope,
+        ):
+            interpreted_service = await service_scope.get_required_service(
+                ServiceWithDependencies
+            )
+            await asyncio.sleep(0)
+            compiled_service = await service_scope.get_required_service(
+                ServiceWithDependencies
+            )
+
+        assert interpreted_service is not compiled_service
+        assert (
+            interpreted_service.service_with_no_dependencies
+            is compiled_service.service_with_no_dependencies
+        )
+
+    async def test_keep_new_registration_when_stale_compilation_finishes(
+        self,
+    ) -> None:
+        services = ServiceContainer()
+        services.add_transient(ServiceWithNoDependencies)
+        services.build_service_provider(
+            mode=ServiceProviderMode.DYNAMIC, compilation_threshold=1
+        )
+
+        async with services:
+            await services.get(ServiceWithNoDependencies)
+            instance = ServiceWithNoDependencies()
+            services.add_singleton(ServiceWithNoDependencies, instance)
+            await asyncio.sleep(0)
+
+            resolved_service = await services.get(ServiceWithNoDependencies)
+
+        assert resolved_service is instance
+
+    @pytest.mark.parametrize(argnames="compilation_threshold", argvalues=[0, -1])
+    def test_fail_when_compilation_threshold_is_not_positive(
+        self, compilation_threshold: int
+    ) -> None:
+        services = ServiceCollection()
+
+        with pytest.raises(ValueError, match="compilation_threshold"):
+            services.build_service_provider(
+                mode=ServiceProviderMode.DYNAMIC,
+                compilation_threshold=compilation_threshold,
+            )
@@ -0,0 +1,66 @@
+import pytest
+
+from tests.utils.services import ServiceWithNoDependencies
+from wirio._service_lookup._scope_state_pool import (
+    DETACHED_RESOLVED_SERVICES,
+    DETACHED_SCOPED_SERVICES,
+    ScopeStatePool,
+)
+from wirio._service_lookup._service_identifier import ServiceIdentifier
+from wirio._service_lookup._typed_type import TypedType
+from wirio._service_lookup.service_cache_key import ServiceCacheKey
+from wirio.exceptions import ObjectDisposedError
+from wirio.wirio_undefined import WirioUndefined
+
+CACHE_KEY = ServiceCacheKey(
+    ServiceIdentifier.from_service_type(TypedType.from_type(ServiceWithNoDependencies)),
+    0,
+)
+
+
+class TestScopeStatePool:
+    def test_reuse_reset_state(self) -> None:
+        scope_state_pool = ScopeStatePool(max_size=1)
+        scope_state = scope_state_pool.rent()
+        scope_state.scoped_services.append(ServiceWithNoDependencies())
+        scope_state.resolved_services[CACHE_KEY] = ServiceWithNoDependencies()
+        scope_state.disposables.append(ServiceWithNoDependencies())
+
+        scope_state_pool.give_back(scope_state)
+        reused_scope_state = scope_state_pool.rent()
+
+        assert reused_scope_state is scope_state
+        assert reused_scope_state.scoped_services == [WirioUndefined.INSTANCE]
+        assert reused_scope_state.resolved_services == {}
+        assert reused_scope_state.disposables == []
+
+    def test_not_keep_more_states_than_max_size(self) -> None:
+        scope_state_pool = ScopeStatePool(max_size=1)
+        first_scope_state = scope_state_pool.rent()
+        second_scope_state = scope_state_pool.rent()
+
+        scope_state_pool.give_back(first_scope_state)
+        scope_state_pool.give_back(second_scope_state)
+
+        assert scope_state_pool.size == 1
+
+    async def test_not_reuse_state_when_lock_is_held(self) -> None:
+        scope_state_pool = ScopeStatePool(max_size=1)
+        scope_state = scope_state_pool.rent()
+        scope_state.resolved_services[CACHE_KEY] = ServiceWithNoDependencies()
+
+        async with scope_state.resolved_services_lock:
+            scope_state_pool.give_back(scope_state)
+
+        assert scope_state_pool.size == 0
+        assert CACHE_KEY in scope_state.resolved_services
+
+    def test_fail_when_storing_service_in_detached_resolved_services(self) -> None:
+        with pytest.raises(ObjectDisposedError):
+            DETACHED_RESOLVED_SERVICES[CACHE_KEY] = ServiceWithNoDependencies()
+
+        with pytest.raises(ObjectDisposedError):
+            DETACHED_SCOPED_SERVICES.extend([ServiceWithNoDependencies()])
+
+        assert DETACHED_RESOLVED_SERVICES == {}
+        assert DETACHED_SCOPED_SERVICES == []
@@ -99,3 +99,13 @@ class TestServiceIdentifier:
         )
 
         assert str(service_identifier) == f"({service_key}, {service_type!r})"
+
+    def test_return_same_instance_for_same_service(self) -> None:
+        service_type = TypedType.from_type(int)
+
+        assert ServiceIdentifier.from_service_type(
+            service_type
+        ) is ServiceIdentifier.from_service_type(TypedType.from_type(int))
+        assert ServiceIdentifier.from_service_type(
+            service_type, "key"
+        ) is ServiceIdentifier.from_service_type(service_type, "key")
@@ -15,6 +15,8 @@ class TestSyncFactoryCallSite:
             cache=cache,
             service_type=service_type,
             implementation_factory=implementation_factory,
+            parameters=[],
+            parameter_call_sites=[],
         )
 
         assert call_site.service_type is service_type
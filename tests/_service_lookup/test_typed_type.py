@@ -1,5 +1,5 @@
 import sys
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from types import UnionType
 from typing import Any, cast
 
@@ -365,3 +365,24 @@ class TestTypedType:
         typed_type = TypedType.from_type(annotation)
 
         assert typed_type.annotation == annotation
+
+    @pytest.mark.parametrize(
+        argnames=("annotation"),
+        argvalues=[
+            (int),
+            (list[int]),
+            (CustomClassWithGenerics1[int, str]),
+        ],
+    )
+    def test_return_same_instance_for_same_type(
+        self,
+        annotation: Any,  # noqa: ANN401
+    ) -> None:
+        assert TypedType.from_type(annotation) is TypedType.from_type(annotation)
+
+    def test_create_type_with_unhashable_arguments(self) -> None:
+        annotation = Callable[[int], str]
+
+        typed_type = TypedType.from_type(annotation)  # ty: ignore[invalid-argument-type] # pyright: ignore[reportArgumentType]
+
+        assert typed_type.annotation == annotation
@@ -0,0 +1,253 @@
+import time
+from collections.abc import Generator
+from typing import override
+
+import pytest
+
+from tests.utils.services import ServiceWithDependencies, ServiceWithNoDependencies
+from wirio._service_lookup._typed_type import TypedType
+from wirio.diagnostics import (
+    CallSiteBuiltEvent,
+    DiagnosticListener,
+    ScopeCreatedEvent,
+    ScopeDisposedEvent,
+    ServiceProviderBuiltEvent,
+    ServiceRealizedEvent,
+    SingletonActivatedEvent,
+    SlowDisposalEvent,
+)
+from wirio.service_collection import ServiceCollection
+from wirio.service_lifetime import ServiceLifetime
+from wirio.service_provider_mode import ServiceProviderMode
+
+
+class RecordingDiagnosticListener(DiagnosticListener):
+    def __init__(self) -> None:
+        self.call_sites_built: list[CallSiteBuiltEvent] = []
+        self.services_realized: list[ServiceRealizedEvent] = []
+        self.singletons_activated: list[SingletonActivatedEvent] = []
+        self.scopes_created: list[ScopeCreatedEvent] = []
+        self.scopes_disposed: list[ScopeDisposedEvent] = []
+        self.service_providers_built: list[ServiceProviderBuiltEvent] = []
+        self.slow_disposals: list[SlowDisposalEvent] = []
+
+    @override
+    def on_call_site_built(self, event: CallSiteBuiltEvent) -> None:
+        self.call_sites_built.append(event)
+
+    @override
+    def on_service_realized(self, event: ServiceRealizedEvent) -> None:
+        self.services_realized.append(event)
+
+    @override
+    def on_singleton_activated(self, event: SingletonActivatedEvent) -> None:
+        self.singletons_activated.append(event)
+
+    @override
+    def on_scope_created(self, event: ScopeCreatedEvent) -> None:
+        self.scopes_created.append(event)
+
+    @override
+    def on_scope_disposed(self, event: ScopeDisposedEvent) -> None:
+        self.scopes_disposed.append(event)
+
+    @override
+    def on_slow_disposal(self, event: SlowDisposalEvent) -> None:
+        self.slow_disposals.append(event)
+
+    @override
+    def on_service_provider_built(self, event: ServiceProviderBuiltEvent) -> None:
+        self.service_providers_built.append(event)
+
+
+class TestDiagnosticListener:
+    @pytest.mark.parametrize(
+        argnames="mode",
+        argvalues=list(ServiceProviderMode),
+    )
+    async def test_emit_service_realized_events(
+        self, mode: ServiceProviderMode
+    ) -> None:
+        diagnostic_listener = RecordingDiagnosticListener()
+        services = ServiceCollection()
+        services.add_singleton(ServiceWithNoDependencies)
+        services.add_scoped(ServiceWithDependencies)
+
+        async with (
+            services.build_service_provider(
+                mode=mode, diagnostic_listener=diagnostic_listener
+            ) as service_provider,
+            service_provider.create_scope() as service_scope,
+        ):
+            for _ in range(3):
+                await service_scope.get_required_service(ServiceWithDependencies)
+
+        assert [
+            (event.service_type, event.lifetime)
+            for event in diagnostic_listener.services_realized
+        ] == [
+            (TypedType.from_type(ServiceWithNoDependencies), ServiceLifetime.SINGLETON),
+            (TypedType.from_type(ServiceWithDependencies), ServiceLifetime.SCOPED),
+        ]
+        assert all(
+            event.duration >= 0 for event in diagnostic_listener.services_realized
+        )
+
+    async def test_emit_service_realized_events_when_resolving_synchronously(
+        self,
+    ) -> None:
+        diagnostic_listener = RecordingDiagnosticListener()
+        services = ServiceCollection()
+        services.add_transient(ServiceWithDependencies)
+        services.add_singleton(ServiceWithNoDependencies, ServiceWithNoDependencies())
+
+        async with services.build_service_provider(
+            diagnostic_listener=diagnostic_listener
+        ) as service_provider:
+            service_provider.get_required_service_sync(ServiceWithDependencies)
+
+        assert [
+            (event.service_type, event.lifetime)
+            for event in diagnostic_listener.services_realized
+        ] == [
+            (TypedType.from_type(ServiceWithNoDependencies), None),
+            (TypedType.from_type(ServiceWithDependencies), ServiceLifetime.TRANSIENT),
+        ]
+
+    async def test_emit_call_site_built_events(self) -> None:
+        diagnostic_listener = RecordingDiagnosticListener()
+        services = ServiceCollection()
+        services.add_keyed_transient("key", ServiceWithDependencies)
+        services.add_transient(ServiceWithNoDependencies)
+
+        async with services.build_service_provider(
+            validate_on_build=False, diagnostic_listener=diagnostic_listener
+        ) as service_provider:
+            await service_provider.get_required_keyed_service(
+                "key", ServiceWithDependencies
+            )
+            await service_provider.get_required_keyed_service(
+                "key", ServiceWithDependencies
+            )
+
+        assert [
+            (event.service_type, event.service_key, event.lifetime)
+            for event in diagnostic_listener.call_sites_built
+        ] == [
+            (
+                TypedType.from_type(ServiceWithNoDependencies),
+                None,
+                ServiceLifetime.TRANSIENT,
+            ),
+            (
+                TypedType.from_type(ServiceWithDependencies),
+                "key",
+                ServiceLifetime.TRANSIENT,
+            ),
+        ]
+
+    async def test_emit_scope_events(self) -> None:
+        diagnostic_listener = RecordingDiagnosticListener()
+        services = ServiceCollection()
+        services.add_transient(ServiceWithNoDependencies)
+
+        async with services.build_service_provider(
+            diagnostic_listener=diagnostic_listener
+        ) as service_provider:
+            async with service_provider.create_scope() as service_scope:
+                await service_scope.get_required_service(ServiceWithNoDependencies)
+                await service_scope.get_required_service(ServiceWithNoDependencies)
+
+            assert [event.scope for event in diagnostic_listener.scopes_created] == [
+                service_scope
+            ]
+            assert [
+                (event.scope, event.disposables_count)
+                for event in diagnostic_listener.scopes_disposed
+            ] == [(service_scope, 2)]
+
+        assert len(diagnostic_listener.scopes_disposed) == 2  # noqa: PLR2004
+        assert diagnostic_listener.scopes_disposed[1].scope is service_provider.root
+
+    async def test_emit_service_provider_built_event(self) -> None:
+        diagnostic_listener = RecordingDiagnosticListener()
+        services = ServiceCollection()
+        services.add_transient(ServiceWithNoDependencies)
+        services.add_transient(ServiceWithDependencies)
+
+        async with services.build_service_provider(
+            diagnostic_listener=diagnostic_listener
+        ):
+            pass
+
+        assert [
+            event.descriptors_count
+            for event in diagnostic_listener.service_providers_built
+        ] == [len(list(services))]
+
+    @pytest.mark.parametrize(
+        argnames="mode",
+        argvalues=list(ServiceProviderMode),
+    )
+    async def test_emit_runtime_mode_in_service_provider_built_event(
+        self, mode: ServiceProviderMode
+    ) -> None:
+        diagnostic_listener = RecordingDiagnosticListener()
+        services = ServiceCollection()
+
+        async with services.build_service_provider(
+            mode=mode, diagnostic_listener=diagnostic_listener
+        ) as service_provider:
+            assert service_provider.mode is mode
+
+        assert [
+            event.mode for event in diagnostic_listener.service_providers_built
+        ] == [ServiceProviderMode.RUNTIME]
+
+    async def test_emit_singleton_activated_events(self) -> None:
+        diagnostic_listener = RecordingDiagnosticListener()
+        services = ServiceCollection()
+        services.add_auto_activated_singleton(ServiceWithDependencies)
+        services.add_auto_activated_keyed_singleton("key", ServiceWithNoDependencies)
+        services.add_singleton(ServiceWithNoDependencies)
+
+        async with services.build_service_provider(
+            diagnostic_listener=diagnostic_listener
+        ):
+            pass
+
+        assert [
+            (event.service_type, event.service_key)
+            for event in diagnostic_listener.singletons_activated
+        ] == [
+            (TypedType.from_type(ServiceWithDependencies), None),
+            (TypedType.from_type(ServiceWithNoDependencies), "key"),
+        ]
+
+    async def test_emit_slow_disposal_events(self) -> None:
+        diagnostic_listener = RecordingDiagnosticListener()
+
+        def create_service() -> Generator[ServiceWithNoDependencies]:
+            yield ServiceWithNoDependencies()
+            # Sync disposals can't be cancelled, so they're only reported
+            time.sleep(0.02)
+
+        services = ServiceCollection()
+        services.add_scoped(ServiceWithNoDependencies, create_service)
+
+        async with (
+            services.build_service_provider(
+                diagnostic_listener=diagnostic_listener, dispose_timeout=0.01
+            ) as service_provider,
+            service_provider.create_scope() as service_scope,
+        ):
+            await service_scope.get_required_service(ServiceWithNoDependencies)
+
+        assert [
+            (event.scope, event.service_type)
+            for event in diagnostic_listener.slow_disposals
+        ] == [(service_scope, TypedType.from_type(ServiceWithNoDependencies))]
+        assert all(
+            event.duration > 0.01  # noqa: PLR2004
+            for event in diagnostic_listener.slow_disposals
+        )
@@ -0,0 +1,105 @@
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from tests.utils.services import ServiceWithDependencies, ServiceWithNoDependencies
+from wirio.diagnostics import StartupProfiler, StartupProfileSpan
+from wirio.service_collection import ServiceCollection
+
+
+class ApplicationSettings(BaseModel):
+    name: str = "application"
+
+
+async def _start_application() -> None:
+    services = ServiceCollection()
+    services.add_auto_activated_singleton(ServiceWithDependencies)
+    services.add_singleton(ServiceWithNoDependencies)
+    services.settings.get_model(ApplicationSettings)
+
+    async with services.build_service_provider():
+        pass
+
+
+class TestStartupProfiler:
+    async def test_record_startup_steps(self) -> None:
+        with StartupProfiler() as startup_profiler:
+            await _start_application()
+
+        assert {span.category for span in startup_profiler.spans} == {
+            "content-root",
+            "settings-load",
+            "settings-binding",
+            "type-hints",
+            "call-site",
+            "validation",
+            "auto-activation",
+            "service-provider-build",
+        }
+        assert all(
+            span.duration >= 0 and span.started_at >= 0
+            for span in startup_profiler.spans
+        )
+
+    async def test_not_record_startup_steps_after_exiting(self) -> None:
+        with StartupProfiler() as startup_profiler:
+            await _start_application()
+
+        spans_count = len(startup_profiler.spans)
+        await _start_application()
+
+        assert len(startup_profiler.spans) == spans_count
+        assert StartupProfiler.get_current() is None
+
+    def test_format_table_from_slowest_step(self) -> None:
+        startup_profiler = StartupProfiler()
+        startup_profiler.spans.extend(
+            [
+                StartupProfileSpan("type-hints", "Fast", 0.0, 0.001, "main"),
+                StartupProfileSpan("call-site", "Slow", 0.001, 0.002, "main"),
+            ]
+        )
+
+        table = startup_profiler.format_table()
+
+        assert table.splitlines() == [
+            "Duration (ms)  Category    Name",
+            "        2.000  call-site   Slow",
+            "        1.000  type-hints  Fast",
+        ]
+
+    async def test_write_trace(self, tmp_path: Path) -> None:
+        trace_path = tmp_path / "startup-trace.json"
+
+        with StartupProfiler() as startup_profiler:
+            await _start_application()
+
+        startup_profiler.write_trace(trace_path)
+
+        trace = json.loads(trace_path.read_text(encoding="utf-8"))
+        complete_events = [
+            event for event in trace["traceEvents"] if event["ph"] == "X"
+        ]
+        assert len(complete_events) == len(startup_profiler.spans)
+        assert {event["cat"] for event in complete_events} == {
+            span.category for span in startup_profiler.spans
+        }
+
+    async def test_profile_startup_from_environment_variable(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        trace_path = tmp_path / "startup-trace.json"
+        monkeypatch.setenv(StartupProfiler.ENVIRONMENT_VARIABLE, str(trace_path))
+
+        await _start_application()
+
+        startup_profiler = StartupProfiler.get_current()
+        assert startup_profiler is not None
+        assert not startup_profiler.is_running
+        assert capsys.readouterr().err.startswith("Duration (ms)")
+        assert trace_path.exists()
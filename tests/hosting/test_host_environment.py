@@ -345,3 +345,15 @@ class TestHostEnvironment:
         resolver = ContentRootPathResolver(package_root=package_root)
 
         assert resolver.resolve_path() == expected_content_root_path
+
+    def test_return_content_root_path_from_environment_variable_when_no_content_root_path_is_provided(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        mocker.patch.dict(
+            os.environ,
+            {EnvironmentVariable.WIRIO_CONTENT_ROOT_PATH.value: str(tmp_path)},
+        )
+
+        environment = HostEnvironment()
+
+        assert environment.content_root_path == str(tmp_path.resolve())
@@ -207,6 +207,36 @@ class TestFastapiDependencyInjection:
             with pytest.raises(CannotResolveServiceFromEndpointError):
                 test_client.get("/non-optional-dependency")
 
+    def test_fail_without_creating_other_dependencies_when_non_optional_dependency_is_missing(
+        self,
+    ) -> None:
+        created_services: list[object] = []
+
+        class RegisteredService:
+            def __init__(self) -> None:
+                created_services.append(self)
+
+        app = FastAPI()
+
+        @app.get("/non-optional-dependency")
+        async def non_optional_dependency_endpoint(  # pyright: ignore[reportUnusedFunction]
+            registered_service: Annotated[RegisteredService, FromServices()],
+            service_with_no_dependencies: Annotated[
+                ServiceWithNoDependencies, FromServices()
+            ],
+        ) -> None:
+            pass
+
+        services = ServiceCollection()
+        services.add_transient(RegisteredService)
+        services.configure_fastapi(app)
+
+        with TestClient(app) as test_client:  # noqa: SIM117
+            with pytest.raises(CannotResolveServiceFromEndpointError):
+                test_client.get("/non-optional-dependency")
+
+        assert created_services == []
+
     def test_combine_request_types_fastapi_depends_and_wirio_injection(
         self,
     ) -> None:
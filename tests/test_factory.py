@@ -0,0 +1,234 @@
+from typing import Annotated
+
+import pytest
+from pytest_mock import MockerFixture
+
+from tests.utils.services import ServiceWithAsyncContextManagerAndNoDependencies
+from wirio.annotations import FromKeyedServices
+from wirio.exceptions import (
+    CannotResolveServiceError,
+    ObjectDisposedError,
+    ScopedInSingletonError,
+)
+from wirio.factory import Factory
+from wirio.lazy import Lazy
+from wirio.service_collection import ServiceCollection
+from wirio.service_container import ServiceContainer
+from wirio.service_provider import ServiceProvider
+from wirio.service_provider_mode import ServiceProviderMode
+
+
+class MessageHandler:
+    pass
+
+
+class OtherMessageHandler(MessageHandler):
+    pass
+
+
+class MessageConsumer:
+    def __init__(self, message_handler_factory: Factory[MessageHandler]) -> None:
+        self.message_handler_factory = message_handler_factory
+
+
+class MessageConsumerWithLazyHandler:
+    def __init__(
+        self,
+        message_handler_factory: Factory[MessageHandler],
+        message_handler: Lazy[MessageHandler],
+    ) -> None:
+        self.message_handler_factory = message_handler_factory
+        self.message_handler = message_handler
+
+
+class DisposableMessageConsumer:
+    def __init__(
+        self,
+        disposable_service_factory: Factory[
+            ServiceWithAsyncContextManagerAndNoDependencies
+        ],
+    ) -> None:
+        self.disposable_service_factory = disposable_service_factory
+
+
+class KeyedMessageConsumer:
+    def __init__(
+        self,
+        message_handler_factory: Annotated[
+            Factory[MessageHandler], FromKeyedServices("key")
+        ],
+    ) -> None:
+        self.message_handler_factory = message_handler_factory
+
+
+class TestFactory:
+    @pytest.mark.parametrize(argnames="mode", argvalues=list(ServiceProviderMode))
+    async def test_create_transient_service_on_each_call(
+        self, mode: ServiceProviderMode
+    ) -> None:
+        services = ServiceCollection()
+        services.add_transient(MessageHandler)
+        services.add_transient(MessageConsumer)
+
+        async with services.build_service_provider(mode=mode) as service_provider:
+            message_consumer = await service_provider.get_required_service(
+                MessageConsumer
+            )
+            message_handler = await message_consumer.message_handler_factory()
+            other_message_handler = await message_consumer.message_handler_factory()
+
+            assert isinstance(message_handler, MessageHandler)
+            assert isinstance(other_message_handler, MessageHandler)
+            assert message_handler is not other_message_handler
+
+    async def test_resolve_scoped_service_from_owning_scope(self) -> None:
+        services = ServiceCollection()
+        services.add_scoped(MessageHandler)
+        services.add_transient(MessageConsumer)
+
+        async with (
+            services.build_service_provider() as service_provider,
+            service_provider.create_scope() as service_scope,
+        ):
+            message_consumer = await service_scope.get_required_service(MessageConsumer)
+
+            assert await message_consumer.message_handler_factory() is (
+                await service_scope.get_required_service(MessageHandler)
+            )
+
+    async def test_resolve_keyed_service(self) -> None:
+        services = ServiceCollection()
+        services.add_keyed_singleton("key", MessageHandler)
+        services.add_transient(KeyedMessageConsumer)
+
+        async with services.build_service_provider() as service_provider:
+            message_consumer = await service_provider.get_required_service(
+                KeyedMessageConsumer
+            )
+
+            assert await message_consumer.message_handler_factory() is (
+                await service_provider.get_required_keyed_service("key", MessageHandler)
+            )
+
+    async def test_resolve_overridden_service(self) -> None:
+        services = ServiceCollection()
+        services.add_transient(MessageHandler)
+        services.add_transient(MessageConsumer)
+        message_handler_override = MessageHandler()
+
+        async with services.build_service_provider() as service_provider:
+            message_consumer = await service_provider.get_required_service(
+                MessageConsumer
+            )
+
+            with service_provider.override_service(
+                MessageHandler, message_handler_override
+            ):
+                assert (
+                    await message_consumer.message_handler_factory()
+                    is message_handler_override
+                )
+
+    async def test_resolve_service_registered_again_after_initialization(
+        self,
+    ) -> None:
+        services = ServiceContainer()
+        services.add_transient(MessageHandler)
+        services.add_transient(MessageConsumerWithLazyHandler)
+
+        async with services:
+            message_consumer = await services.get(MessageConsumerWithLazyHandler)
+            assert type(await message_consumer.message_handler_factory()) is (
+                MessageHandler
+            )
+
+            services.add_transient(MessageHandler, OtherMessageHandler)
+            other_message_consumer = await services.get(MessageConsumerWithLazyHandler)
+
+            assert isinstance(
+                await message_consumer.message_handler_factory(), OtherMessageHandler
+            )
+            assert isinstance(
+                await message_consumer.message_handler.get(), OtherMessageHandler
+            )
+            assert isinstance(
+                await other_message_consumer.message_handler_factory(),
+                OtherMessageHandler,
+            )
+
+    async def test_share_refreshed_service_with_delegates_created_afterwards(
+        self, mocker: MockerFixture
+    ) -> None:
+        services = ServiceCollection()
+        services.add_transient(MessageHandler)
+        services.add_transient(MessageConsumer)
+        message_handler_override = MessageHandler()
+
+        async with services.build_service_provider() as service_provider:
+            await service_provider.get_required_service(MessageConsumer)
+            get_realized_service_spy = mocker.spy(
+                ServiceProvider, "get_realized_service"
+            )
+
+            with service_provider.override_service(
+                MessageHandler, message_handler_override
+            ):
+                message_consumer = await service_provider.get_required_service(
+                    MessageConsumer
+                )
+                assert (
+                    await message_consumer.message_handler_factory()
+                    is message_handler_override
+                )
+
+                other_message_consumer = await service_provider.get_required_service(
+                    MessageConsumer
+                )
+                assert (
+                    await other_message_consumer.message_handler_factory()
+                    is message_handler_override
+                )
+
+        get_realized_service_spy.assert_called_once()
+
+    async def test_dispose_created_services_with_their_scope(self) -> None:
+        services = ServiceCollection()
+        services.add_transient(ServiceWithAsyncContextManagerAndNoDependencies)
+        services.add_scoped(DisposableMessageConsumer)
+
+        async with services.build_service_provider() as service_provider:
+            async with service_provider.create_scope() as service_scope:
+                message_consumer = await service_scope.get_required_service(
+                    DisposableMessageConsumer
+                )
+                disposable_service = await message_consumer.disposable_service_factory()
+
+            assert disposable_service.is_disposed
+
+            with pytest.raises(ObjectDisposedError):
+                await message_consumer.disposable_service_factory()
+
+    async def test_fail_to_inject_scoped_service_in_singleton(self) -> None:
+        services = ServiceCollection()
+        services.add_scoped(MessageHandler)
+        services.add_singleton(MessageConsumer)
+
+        with pytest.raises(ExceptionGroup) as exception_group:
+            async with services.build_service_provider(validate_scopes=True):
+                pass
+
+        assert isinstance(
+            exception_group.value.exceptions[0].__cause__, ScopedInSingletonError
+        )
+
+    async def test_fail_to_inject_service_not_registered(self) -> None:
+        services = ServiceCollection()
+        services.add_transient(MessageConsumer)
+
+        with pytest.raises(ExceptionGroup) as exception_group:
+            async with services.build_service_provider():
+                pass
+
+        assert isinstance(
+            exception_group.value.exceptions[0].__cause__, CannotResolveServiceError
+        )
@@ -0,0 +1,40 @@
+import subprocess
+import sys
+
+
+def _run_python(code: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+class TestImportTime:
+    def test_import_package_without_loading_submodules(self) -> None:
+        completed_process = _run_python(
+            "import sys\n"
+            "import wirio\n"
+            "print(sorted(module for module in sys.modules if module.startswith('wirio') or module == 'pydantic'))"
+        )
+
+        assert completed_process.stdout.strip() == "['wirio']"
+
+    def test_import_service_collection_without_loading_settings(self) -> None:
+        completed_process = _run_python(
+            "import sys\n"
+            "from wirio import ServiceCollection\n"
+            "print(sorted(module for module in ('pydantic', 'wirio.settings.settings_manager') if module in sys.modules))"
+        )
+
+        assert completed_process.stdout.strip() == "[]"
+
+    def test_load_exported_attributes_on_first_access(self) -> None:
+        completed_process = _run_python(
+            "import wirio, wirio.settings\n"
+            "print(all(getattr(wirio, name) is not None for name in wirio.__all__))\n"
+            "print(all(getattr(wirio.settings, name) is not None for name in wirio.settings.__all__))"
+        )
+
+        assert completed_process.stdout.split() == ["True", "True"]
@@ -0,0 +1,137 @@
+from typing import Annotated
+
+import pytest
+
+from tests.utils.services import (
+    ServiceWithAsyncContextManagerAndNoDependencies,
+    ServiceWithNoDependencies,
+)
+from wirio.annotations import FromKeyedServices
+from wirio.exceptions import CannotResolveServiceError, ScopedInSingletonError
+from wirio.lazy import Lazy
+from wirio.service_collection import ServiceCollection
+from wirio.service_provider_mode import ServiceProviderMode
+
+
+class ExpensiveService:
+    created_count = 0
+
+    def __init__(self) -> None:
+        ExpensiveService.created_count += 1
+
+
+class ServiceWithLazyDependency:
+    def __init__(self, expensive_service: Lazy[ExpensiveService]) -> None:
+        self.expensive_service = expensive_service
+
+
+class ServiceWithLazyDisposableDependency:
+    def __init__(
+        self, disposable_service: Lazy[ServiceWithAsyncContextManagerAndNoDependencies]
+    ) -> None:
+        self.disposable_service = disposable_service
+
+
+class ServiceWithLazyKeyedDependency:
+    def __init__(
+        self,
+        service: Annotated[Lazy[ServiceWithNoDependencies], FromKeyedServices("key")],
+    ) -> None:
+        self.service = service
+
+
+class TestLazy:
+    @pytest.mark.parametrize(argnames="mode", argvalues=list(ServiceProviderMode))
+    async def test_create_service_on_first_get(self, mode: ServiceProviderMode) -> None:
+        ExpensiveService.created_count = 0
+        services = ServiceCollection()
+        services.add_transient(ExpensiveService)
+        services.add_transient(ServiceWithLazyDependency)
+
+        async with services.build_service_provider(mode=mode) as service_provider:
+            service = await service_provider.get_required_service(
+                ServiceWithLazyDependency
+            )
+
+            assert ExpensiveService.created_count == 0
+            assert not service.expensive_service.is_value_created
+
+            expensive_service = await service.expensive_service.get()
+
+            assert await service.expensive_service.get() is expensive_service
+            assert service.expensive_service.is_value_created
+            assert ExpensiveService.created_count == 1
+
+    async def test_resolve_scoped_service_from_owning_scope(self) -> None:
+        services = ServiceCollection()
+        services.add_scoped(ExpensiveService)
+        services.add_transient(ServiceWithLazyDependency)
+
+        async with (
+            services.build_service_provider() as service_provider,
+            service_provider.create_scope() as service_scope,
+        ):
+            service = await service_scope.get_required_service(
+                ServiceWithLazyDependency
+            )
+
+            assert await service.expensive_service.get() is (
+                await service_scope.get_required_service(ExpensiveService)
+            )
+
+    async def test_dispose_lazily_created_service_with_its_scope(self) -> None:
+        services = ServiceCollection()
+        services.add_scoped(ServiceWithAsyncContextManagerAndNoDependencies)
+        services.add_scoped(ServiceWithLazyDisposableDependency)
+
+        async with services.build_service_provider() as service_provider:
+            async with service_provider.create_scope() as service_scope:
+                service = await service_scope.get_required_service(
+                    ServiceWithLazyDisposableDependency
+                )
+                disposable_service = await service.disposable_service.get()
+
+                assert not disposable_service.is_disposed
+
+            assert disposable_service.is_disposed
+
+    async def test_resolve_keyed_service(self) -> None:
+        services = ServiceCollection()
+        services.add_keyed_singleton("key", ServiceWithNoDependencies)
+        services.add_transient(ServiceWithLazyKeyedDependency)
+
+        async with services.build_service_provider() as service_provider:
+            service = await service_provider.get_required_service(
+                ServiceWithLazyKeyedDependency
+            )
+
+            assert await service.service.get() is (
+                await service_provider.get_required_keyed_service(
+                    "key", ServiceWithNoDependencies
+                )
+            )
+
+    async def test_fail_to_inject_scoped_service_in_singleton(self) -> None:
+        services = ServiceCollection()
+        services.add_scoped(ExpensiveService)
+        services.add_singleton(ServiceWithLazyDependency)
+
+        with pytest.raises(ExceptionGroup) as exception_group:
+            async with services.build_service_provider(validate_scopes=True):
+                pass
+
+        assert isinstance(
+            exception_group.value.exceptions[0].__cause__, ScopedInSingletonError
+        )
+
+    async def test_fail_to_inject_service_not_registered(self) -> None:
+        services = ServiceCollection()
+        services.add_transient(ServiceWithLazyDependency)
+
+        with pytest.raises(ExceptionGroup) as exception_group:
+            async with services.build_service_provider():
+                pass
+
+        assert isinstance(
+            exception_group.value.exceptions[0].__cause__, CannotResolveServiceError
+        )
@@ -2598,6 +2598,54 @@ class TestServiceCollection:
 
         assert services.environment.content_root_path == expected_content_root_path
 
+    def test_get_provided_content_root_path(self, tmp_path: Path) -> None:
+        services = ServiceCollection(content_root_path=str(tmp_path))
+
+        assert services.environment.content_root_path == str(tmp_path)
+
+    def test_get_content_root_path_from_environment_variable(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        expected_content_root_path = str(tmp_path.resolve())
+        mocker.patch.dict(
+            os.environ,
+            {EnvironmentVariable.WIRIO_CONTENT_ROOT_PATH.value: str(tmp_path)},
+        )
+        resolve_path_spy = mocker.spy(ContentRootPathResolver, "resolve_path")
+
+        services = ServiceCollection()
+
+        resolve_path_spy.assert_not_called()
+        assert services.environment.content_root_path == expected_content_root_path
+
+    def test_classify_stack_frame_files_once(self, mocker: MockerFixture) -> None:
+        expected_content_root_path = str((Path.cwd() / "tests").resolve())
+        ContentRootPathResolver.clear_cache()
+        ServiceCollection()
+        is_python_runtime_path_spy = mocker.spy(
+            PythonRuntimePath, PythonRuntimePath.is_python_runtime_path.__name__
+        )
+
+        services = ServiceCollection()
+
+        is_python_runtime_path_spy.assert_not_called()
+        assert services.environment.content_root_path == expected_content_root_path
+
+    def test_resolve_content_root_path_once_per_caller_module(
+        self, mocker: MockerFixture
+    ) -> None:
+        expected_content_root_path = str((Path.cwd() / "tests").resolve())
+        ContentRootPathResolver.clear_cache()
+        ServiceCollection()
+        resolve_path_from_stack_spy = mocker.spy(
+            ContentRootPathResolver, "_resolve_path_from_stack"
+        )
+
+        services = ServiceCollection()
+
+        resolve_path_from_stack_spy.assert_not_called()
+        assert services.environment.content_root_path == expected_content_root_path
+
     async def test_auto_register_host_environment(self) -> None:
         services = ServiceCollection()
 
@@ -4,7 +4,10 @@ import pytest
 from pytest_mock import MockerFixture
 
 from tests.utils.services import ServiceWithDependencies, ServiceWithNoDependencies
-from wirio.exceptions import ServiceContainerNotBuiltError
+from wirio.exceptions import (
+    ServiceContainerNotBuiltError,
+    ServiceProviderFrozenError,
+)
 from wirio.service_container import ServiceContainer
 
 
@@ -527,6 +530,79 @@ class TestServiceContainer:
             resolved_service_2 = await services.get(ServiceWithNoDependencies)
             assert resolved_service_2 is service_instance_2
 
+    async def test_resolve_implementation_factory_dependency_added_after_build(
+        self,
+    ) -> None:
+        def create_service_with_dependencies(
+            service_with_no_dependencies: ServiceWithNoDependencies,
+        ) -> ServiceWithDependencies:
+            return ServiceWithDependencies(service_with_no_dependencies)
+
+        services = ServiceContainer()
+        services.add_transient(create_service_with_dependencies)
+
+        async with services:
+            services.add_transient(ServiceWithNoDependencies)
+            service = await services.get(ServiceWithDependencies)
+
+        assert isinstance(
+            service.service_with_no_dependencies, ServiceWithNoDependencies
+        )
+
+    async def test_resolve_implementation_factory_dependency_registered_again_after_resolution(
+        self,
+    ) -> None:
+        def create_service_with_dependencies(
+            service_with_no_dependencies: ServiceWithNoDependencies,
+        ) -> ServiceWithDependencies:
+            return ServiceWithDependencies(service_with_no_dependencies)
+
+        service_with_no_dependencies = ServiceWithNoDependencies()
+        other_service_with_no_dependencies = ServiceWithNoDependencies()
+        services = ServiceContainer()
+        services.add_singleton(ServiceWithNoDependencies, service_with_no_dependencies)
+        services.add_transient(create_service_with_dependencies)
+
+        async with services:
+            service = await services.get(ServiceWithDependencies)
+            assert service.service_with_no_dependencies is service_with_no_dependencies
+
+            services.add_singleton(
+                ServiceWithNoDependencies, other_service_with_no_dependencies
+            )
+            service = await services.get(ServiceWithDependencies)
+
+        assert (
+            service.service_with_no_dependencies is other_service_with_no_dependencies
+        )
+
+    async def test_resolve_scoped_service_added_after_scope_creation(self) -> None:
+        services = ServiceContainer()
+        services.add_scoped(ServiceWithNoDependencies)
+
+        async with services:
+            service_provider = services.service_provider
+            assert service_provider is not None
+
+            async with service_provider.create_scope() as service_scope:
+                service_with_no_dependencies = await service_scope.get_required_service(
+                    ServiceWithNoDependencies
+                )
+                services.add_scoped(ServiceWithDependencies)
+                service_with_dependencies = await service_scope.get_required_service(
+                    ServiceWithDependencies
+                )
+
+                assert (
+                    await service_scope.get_required_service(ServiceWithDependencies)
+                    is service_with_dependencies
+                )
+
+        assert (
+            service_with_dependencies.service_with_no_dependencies
+            is service_with_no_dependencies
+        )
+
     async def test_replace_singleton_registration_with_different_implementation_type_after_initialization(
         self,
     ) -> None:
@@ -558,6 +634,46 @@ class TestServiceContainer:
         finally:
             await services.aclose()
 
+    async def test_resolve_registration_replaced_before_freezing(self) -> None:
+        services = ServiceContainer()
+
+        class BaseService:
+            pass
+
+        class InitialService(BaseService):
+            pass
+
+        class ReplacementService(BaseService):
+            pass
+
+        services.add_transient(BaseService, InitialService)
+
+        try:
+            assert isinstance(await services.get(BaseService), InitialService)
+
+            services.add_transient(BaseService, ReplacementService)
+            await services.freeze()
+
+            assert isinstance(await services.get(BaseService), ReplacementService)
+        finally:
+            await services.aclose()
+
+    async def test_fail_to_add_service_after_freezing(self) -> None:
+        services = ServiceContainer()
+        services.add_transient(ServiceWithNoDependencies)
+
+        try:
+            await services.freeze()
+            descriptors_count = len(list(services))
+
+            with pytest.raises(ServiceProviderFrozenError):
+                services.add_transient(ServiceWithDependencies)
+
+            assert len(list(services)) == descriptors_count
+            assert await services.try_get(ServiceWithDependencies) is None
+        finally:
+            await services.aclose()
+
     async def test_replace_keyed_singleton_registration_after_initialization(
         self,
     ) -> None:
@@ -1,9 +1,17 @@
+import asyncio
+from collections.abc import AsyncGenerator, Callable, Generator
+from inspect import Parameter, Signature
 from typing import Annotated
 
 import pytest
 from pytest_mock import MockerFixture
 
 from tests.utils.services import ServiceWithDependencies, ServiceWithNoDependencies
+from wirio._service_lookup._async_concurrent_dictionary import (
+    AsyncConcurrentDictionary,
+)
+from wirio._service_lookup._asyncio_reentrant_lock import AsyncioReentrantLock
+from wirio._service_lookup._call_site_factory import CallSiteFactory
 from wirio.abstractions.keyed_service import KeyedService
 from wirio.annotations import FromKeyedServices, ServiceKey
 from wirio.exceptions import (
@@ -12,8 +20,38 @@ from wirio.exceptions import (
     ObjectDisposedError,
     ScopedInSingletonError,
     ScopedResolvedFromRootError,
+    ServiceProviderFrozenError,
 )
 from wirio.service_collection import ServiceCollection
+from wirio.service_descriptor import ServiceDescriptor
+from wirio.service_lifetime import ServiceLifetime
+from wirio.service_provider_mode import ServiceProviderMode
+
+LONG_CHAIN_LENGTH = 1000
+
+
+def create_service_with_dependencies(
+    service_with_no_dependencies: ServiceWithNoDependencies,
+) -> ServiceWithDependencies:
+    return ServiceWithDependencies(service_with_no_dependencies)
+
+
+async def create_service_with_dependencies_async(
+    service_with_no_dependencies: ServiceWithNoDependencies,
+) -> ServiceWithDependencies:
+    return ServiceWithDependencies(service_with_no_dependencies)
+
+
+def generate_service_with_dependencies(
+    service_with_no_dependencies: ServiceWithNoDependencies,
+) -> Generator[ServiceWithDependencies]:
+    yield ServiceWithDependencies(service_with_no_dependencies)
+
+
+async def generate_service_with_dependencies_async(
+    service_with_no_dependencies: ServiceWithNoDependencies,
+) -> AsyncGenerator[ServiceWithDependencies]:
+    yield ServiceWithDependencies(service_with_no_dependencies)
 
 
 class TestServiceProvider:
@@ -335,6 +373,138 @@ class TestServiceProvider:
             assert isinstance(resolved_service, AutoActivatedKeyedService)
             assert captured_keys == [service_key]
 
+    async def test_activate_independent_auto_activated_singletons_concurrently(
+        self,
+    ) -> None:
+        concurrency = 2
+        running_activations_count = 0
+        max_running_activations_count = 0
+
+        async def activate() -> None:
+            nonlocal running_activations_count, max_running_activations_count
+            running_activations_count += 1
+            max_running_activations_count = max(
+                max_running_activations_count, running_activations_count
+            )
+            await asyncio.sleep(0.01)
+            running_activations_count -= 1
+
+        class FirstPool:
+            pass
+
+        class SecondPool:
+            pass
+
+        class ThirdPool:
+            pass
+
+        async def create_first_pool() -> FirstPool:
+            await activate()
+            return FirstPool()
+
+        async def create_second_pool() -> SecondPool:
+            await activate()
+            return SecondPool()
+
+        async def create_third_pool() -> ThirdPool:
+            await activate()
+            return ThirdPool()
+
+        services = ServiceCollection()
+        services.add_auto_activated_singleton(FirstPool, create_first_pool)
+        services.add_auto_activated_singleton(SecondPool, create_second_pool)
+        services.add_auto_activated_singleton(ThirdPool, create_third_pool)
+
+        async with services.build_service_provider(
+            auto_activation_concurrency=concurrency
+        ):
+            assert max_running_activations_count == concurrency
+
+    async def test_activate_auto_activated_singletons_after_their_dependencies(
+        self,
+    ) -> None:
+        activated_service_names: list[str] = []
+
+        class Settings:
+            pass
+
+        class Client:
+            def __init__(self, settings: Settings) -> None:
+                self.settings = settings
+
+        class Repository:
+            def __init__(self, client: Client) -> None:
+                self.client = client
+
+        async def create_settings() -> Settings:
+            await asyncio.sleep(0.01)
+            activated_service_names.append("settings")
+            return Settings()
+
+        def create_client(settings: Settings) -> Client:
+            activated_service_names.append("client")
+            return Client(settings)
+
+        def create_repository(client: Client) -> Repository:
+            activated_service_names.append("repository")
+            return Repository(client)
+
+        services = ServiceCollection()
+        services.add_auto_activated_singleton(Repository, create_repository)
+        services.add_singleton(Client, create_client)
+        services.add_auto_activated_singleton(Settings, create_settings)
+
+        async with services.build_service_provider(
+            auto_activation_concurrency=2
+        ) as service_provider:
+            repository = await service_provider.get_required_service(Repository)
+            settings = await service_provider.get_required_service(Settings)
+
+        assert activated_service_names == ["settings", "client", "repository"]
+        assert repository.client.settings is settings
+
+    async def test_report_all_failed_auto_activated_singletons(self) -> None:
+        is_third_pool_activated = False
+
+        class FirstPool:
+            pass
+
+        class SecondPool:
+            pass
+
+        class ThirdPool:
+            pass
+
+        async def create_first_pool() -> FirstPool:
+            await asyncio.sleep(0)
+            error_message = "first"
+            raise ValueError(error_message)
+
+        async def create_second_pool() -> SecondPool:
+            await asyncio.sleep(0)
+            error_message = "second"
+            raise ValueError(error_message)
+
+        async def create_third_pool() -> ThirdPool:
+            nonlocal is_third_pool_activated
+            await asyncio.sleep(0.01)
+            is_third_pool_activated = True
+            return ThirdPool()
+
+        services = ServiceCollection()
+        services.add_auto_activated_singleton(FirstPool, create_first_pool)
+        services.add_auto_activated_singleton(SecondPool, create_second_pool)
+        services.add_auto_activated_singleton(ThirdPool, create_third_pool)
+
+        with pytest.raises(ExceptionGroup) as exception_info:
+            async with services.build_service_provider(auto_activation_concurrency=3):
+                pass
+
+        assert sorted(
+            str(exception) for exception in exception_info.value.exceptions
+        ) == ["first", "second"]
+        assert is_third_pool_activated
+
     async def test_not_activate_eagerly_non_auto_activated_services(
         self,
     ) -> None:
@@ -422,6 +592,41 @@ class TestServiceProvider:
             exception_group.value.exceptions[0].__cause__, CannotResolveServiceError
         )
 
+    async def test_validate_long_chain_of_services_registered_before_their_dependencies(
+        self,
+    ) -> None:
+        services = ServiceCollection()
+        service_types: list[type] = []
+
+        for index in range(LONG_CHAIN_LENGTH):
+            parameters = [
+                Parameter(
+                    "dependency",
+                    Parameter.POSITIONAL_OR_KEYWORD,
+                    annotation=service_type,
+                )
+                for service_type in service_types[-1:]
+            ]
+
+            def init(self: object, *dependencies: object) -> None:
+                del self, dependencies
+
+            init.__dict__["__signature__"] = Signature(
+                [Parameter("self", Parameter.POSITIONAL_OR_KEYWORD), *parameters]
+            )
+            init.__annotations__ = {
+                parameter.name: parameter.annotation for parameter in parameters
+            }
+            service_types.append(type(f"Service{index}", (), {"__init__": init}))
+
+        for service_type in reversed(service_types):
+            services.add_singleton(service_type)
+
+        async with services.build_service_provider(
+            validate_scopes=True, validate_on_build=True
+        ) as service_provider:
+            assert service_provider.is_fully_initialized
+
     async def test_validate_on_build_can_be_disabled(self) -> None:
         services = ServiceCollection()
         services.add_transient(ServiceWithDependencies)
@@ -467,6 +672,64 @@ class TestServiceProvider:
             exception_group.value.exceptions[0].__cause__, ScopedInSingletonError
         )
 
+    @pytest.mark.parametrize(
+        argnames="implementation_factory",
+        argvalues=[
+            create_service_with_dependencies,
+            create_service_with_dependencies_async,
+            generate_service_with_dependencies,
+            generate_service_with_dependencies_async,
+        ],
+    )
+    async def test_fail_scope_validation_when_singleton_factory_depends_on_scoped_service(
+        self, implementation_factory: Callable[..., object]
+    ) -> None:
+        services = ServiceCollection()
+        services.add_scoped(ServiceWithNoDependencies)
+        services.add_singleton(implementation_factory)
+
+        with pytest.raises(ExceptionGroup) as exception_group:
+            async with services.build_service_provider(
+                validate_scopes=True, validate_on_build=True
+            ):
+                pass
+
+        assert len(exception_group.value.exceptions) == 1
+        assert isinstance(
+            exception_group.value.exceptions[0].__cause__, ScopedInSingletonError
+        )
+
+    async def test_pass_scope_validation_when_scoped_services_depend_on_singleton(
+        self,
+    ) -> None:
+        class SingletonService:
+            pass
+
+        class FirstScopedService:
+            def __init__(self, dependency: SingletonService) -> None:
+                self.dependency = dependency
+
+        class SecondScopedService:
+            def __init__(self, dependency: SingletonService) -> None:
+                self.dependency = dependency
+
+        services = ServiceCollection()
+        services.add_singleton(SingletonService)
+        services.add_scoped(FirstScopedService)
+        services.add_scoped(SecondScopedService)
+
+        async with (
+            services.build_service_provider(
+                validate_scopes=True, validate_on_build=True
+            ) as service_provider,
+            service_provider.create_scope() as service_scope,
+        ):
+            second_scoped_service = await service_scope.get_required_service(
+                SecondScopedService
+            )
+
+        assert isinstance(second_scoped_service.dependency, SingletonService)
+
     async def test_allow_singleton_with_scoped_dependency_when_scoped_validation_disabled(
         self,
     ) -> None:
@@ -565,3 +828,150 @@ class TestServiceProvider:
 
         with pytest.raises(ObjectDisposedError):
             service_provider.create_scope()
+
+    @pytest.mark.parametrize(argnames="mode", argvalues=list(ServiceProviderMode))
+    async def test_resolve_created_scoped_service_without_taking_lock(
+        self, mode: ServiceProviderMode, mocker: MockerFixture
+    ) -> None:
+        services = ServiceCollection()
+        services.add_scoped(ServiceWithNoDependencies)
+
+        async with (
+            services.build_service_provider(mode=mode) as service_provider,
+            service_provider.create_scope() as service_scope,
+        ):
+            service = await service_scope.get_required_service(
+                ServiceWithNoDependencies
+            )
+            acquire_spy = mocker.spy(AsyncioReentrantLock, "acquire")
+            resolved_service = await service_scope.get_required_service(
+                ServiceWithNoDependencies
+            )
+
+            acquire_spy.assert_not_called()
+
+        assert resolved_service is service
+
+    async def test_resolve_ready_service_without_creating_accessor(
+        self, mocker: MockerFixture
+    ) -> None:
+        services = ServiceCollection()
+        services.add_transient(ServiceWithNoDependencies)
+
+        async with services.build_service_provider() as service_provider:
+            await service_provider.get_required_service(ServiceWithNoDependencies)
+            get_or_add_spy = mocker.spy(AsyncConcurrentDictionary, "get_or_add")
+
+            await service_provider.get_required_service(ServiceWithNoDependencies)
+
+            get_or_add_spy.assert_not_called()
+
+            overridden_instance = ServiceWithNoDependencies()
+
+            with service_provider.override_service(
+                ServiceWithNoDependencies, overridden_instance
+            ):
+                overridden_service = await service_provider.get_required_service(
+                    ServiceWithNoDependencies
+                )
+
+            resolved_service = await service_provider.get_required_service(
+                ServiceWithNoDependencies
+            )
+
+        assert overridden_service is overridden_instance
+        assert resolved_service is not overridden_instance
+
+    @pytest.mark.parametrize(
+        argnames="mode",
+        argvalues=list(ServiceProviderMode),
+    )
+    async def test_resolve_without_invalidation_checks_when_frozen(
+        self, mode: ServiceProviderMode, mocker: MockerFixture
+    ) -> None:
+        services = ServiceCollection()
+        services.add_transient(ServiceWithNoDependencies)
+        services.add_scoped(ServiceWithDependencies)
+        invalidate_call_site_spy = mocker.spy(
+            CallSiteFactory, "_invalidate_service_type_if_needed"
+        )
+
+        async with (
+            services.build_service_provider(mode=mode, frozen=True) as service_provider,
+            service_provider.create_scope() as service_scope,
+        ):
+            invalidate_service_accessor_spy = mocker.spy(
+                service_provider, "_invalidate_service_accessors_if_needed"
+            )
+
+            service = await service_scope.get_required_service(ServiceWithDependencies)
+
+            for _ in range(2):
+                assert (
+                    await service_scope.get_required_service(ServiceWithDependencies)
+                    is service
+                )
+
+            invalidate_service_accessor_spy.assert_not_called()
+
+        invalidate_call_site_spy.assert_not_called()
+        assert service_provider.is_frozen
+        assert isinstance(
+            service.service_with_no_dependencies, ServiceWithNoDependencies
+        )
+
+    async def test_fail_to_add_descriptor_when_frozen(self) -> None:
+        services = ServiceCollection()
+        services.add_transient(ServiceWithNoDependencies)
+
+        async with services.build_service_provider() as service_provider:
+            await service_provider.get_required_service(ServiceWithNoDependencies)
+            await service_provider.freeze()
+
+            with pytest.raises(ServiceProviderFrozenError):
+                service_provider.add_descriptor(
+                    ServiceDescriptor.from_implementation_type(
+                        service_type=ServiceWithDependencies,
+                        implementation_type=ServiceWithDependencies,
+                        service_key=None,
+                        lifetime=ServiceLifetime.TRANSIENT,
+                        auto_activate=False,
+                    )
+                )
+
+            assert await service_provider.get_service(ServiceWithDependencies) is None
+
+    @pytest.mark.parametrize(argnames="mode", argvalues=list(ServiceProviderMode))
+    async def test_get_services_batch(self, mode: ServiceProviderMode) -> None:
+        services = ServiceCollection()
+        services.add_singleton(ServiceWithNoDependencies)
+        services.add_transient(ServiceWithDependencies)
+
+        async with services.build_service_provider(mode=mode) as service_provider:
+            for _ in range(3):
+                (
+                    service_with_no_dependencies,
+                    service_with_dependencies,
+                ) = await service_provider.get_services_batch(
+                    [ServiceWithNoDependencies, ServiceWithDependencies]
+                )
+
+                assert isinstance(service_with_dependencies, ServiceWithDependencies)
+                assert (
+                    service_with_dependencies.service_with_no_dependencies
+                    is service_with_no_dependencies
+                )
+
+    async def test_get_overridden_services_batch(self) -> None:
+        services = ServiceCollection()
+        services.add_transient(ServiceWithNoDependencies)
+
+        async with services.build_service_provider() as service_provider:
+            overridden_instance = ServiceWithNoDependencies()
+
+            with service_provider.override_service(
+                ServiceWithNoDependencies, overridden_instance
+            ):
+                assert await service_provider.get_services_batch(
+                    [ServiceWithNoDependencies]
+                ) == (overridden_instance,)
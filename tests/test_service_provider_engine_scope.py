@@ -1,16 +1,44 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import cast
+
 import pytest
 
 from tests.utils.services import (
     ServiceWithAsyncContextManagerAndNoDependencies,
     ServiceWithSyncContextManagerAndNoDependencies,
 )
-from wirio.exceptions import ObjectDisposedError
+from wirio.abstractions.base_service_provider import BaseServiceProvider
+from wirio.abstractions.keyed_service import KeyedService
+from wirio.exceptions import (
+    DisposeTimeoutError,
+    KeyedServiceAnyKeyUsedToResolveServiceError,
+    ObjectDisposedError,
+)
 from wirio.service_collection import ServiceCollection
 from wirio.service_provider_engine_scope import (
     ServiceProviderEngineScope,
 )
 
 
+class Engine:
+    pass
+
+
+class Session:
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+
+
+class HttpClient:
+    pass
+
+
+class Database:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+
 class TestServiceProviderEngineScope:
     async def test_resolve_scoped_sync_context_manager_service(
         self,
@@ -118,3 +146,283 @@ class TestServiceProviderEngineScope:
                 await engine_scope.capture_disposable(service)
 
             assert service.is_disposed
+
+    async def test_dispose_independent_services_concurrently(self) -> None:
+        barrier = asyncio.Barrier(2)
+
+        async def create_engine() -> AsyncGenerator[Engine]:
+            yield Engine()
+            await barrier.wait()
+
+        async def create_http_client() -> AsyncGenerator[HttpClient]:
+            yield HttpClient()
+            await barrier.wait()
+
+        services = ServiceCollection()
+        services.add_scoped(Engine, create_engine)
+        services.add_scoped(HttpClient, create_http_client)
+
+        # Each service waits for the other one to be disposed, so it only finishes if they're disposed concurrently
+        async with (
+            services.build_service_provider(
+                disposes_concurrently=True
+            ) as service_provider,
+            asyncio.timeout(1),
+            service_provider.create_scope() as service_scope,
+        ):
+            await service_scope.get_required_service(Engine)
+            await service_scope.get_required_service(HttpClient)
+
+    async def test_dispose_dependents_before_their_dependencies_when_disposing_concurrently(
+        self,
+    ) -> None:
+        disposed_types: list[type] = []
+
+        async def create_engine() -> AsyncGenerator[Engine]:
+            yield Engine()
+            disposed_types.append(Engine)
+
+        async def create_session(engine: Engine) -> AsyncGenerator[Session]:
+            yield Session(engine)
+            # The engine would be disposed first if it didn't wait for the session
+            await asyncio.sleep(0.01)
+            disposed_types.append(Session)
+
+        async def create_http_client() -> AsyncGenerator[HttpClient]:
+            yield HttpClient()
+            await asyncio.sleep(0)
+            disposed_types.append(HttpClient)
+
+        services = ServiceCollection()
+        services.add_scoped(Engine, create_engine)
+        services.add_transient(Session, create_session)
+        services.add_scoped(HttpClient, create_http_client)
+
+        async with (
+            services.build_service_provider(
+                disposes_concurrently=True
+            ) as service_provider,
+            service_provider.create_scope() as service_scope,
+        ):
+            await service_scope.get_required_service(Session)
+            await service_scope.get_required_service(HttpClient)
+
+        assert disposed_types.index(Session) < disposed_types.index(Engine)
+        assert set(disposed_types) == {Engine, Session, HttpClient}
+
+    @pytest.mark.parametrize(
+        argnames="disposes_concurrently",
+        argvalues=[False, True],
+    )
+    async def test_fail_when_disposing_service_takes_longer_than_dispose_timeout(
+        self, disposes_concurrently: bool
+    ) -> None:
+        async def create_engine() -> AsyncGenerator[Engine]:
+            yield Engine()
+            await asyncio.sleep(10)
+
+        services = ServiceCollection()
+        services.add_scoped(Engine, create_engine)
+        services.add_scoped(ServiceWithAsyncContextManagerAndNoDependencies)
+
+        async with services.build_service_provider(
+            disposes_concurrently=disposes_concurrently, dispose_timeout=0.01
+        ) as service_provider:
+            service_scope = service_provider.create_scope()
+            await service_scope.get_required_service(Engine)
+            disposable = await service_scope.get_required_service(
+                ServiceWithAsyncContextManagerAndNoDependencies
+            )
+
+            with pytest.raises(DisposeTimeoutError):
+                await service_scope.__aexit__(None, None, None)
+
+            assert disposable.is_disposed
+
+    async def test_reuse_state_of_disposed_scope_when_scope_pooling_is_enabled(
+        self,
+    ) -> None:
+        services = ServiceCollection()
+        services.add_scoped(ServiceWithAsyncContextManagerAndNoDependencies)
+
+        async with services.build_service_provider(
+            scope_pool_size=1
+        ) as service_provider:
+            async with service_provider.create_scope() as first_service_scope:
+                assert isinstance(first_service_scope, ServiceProviderEngineScope)
+                first_service = await first_service_scope.get_required_service(
+                    ServiceWithAsyncContextManagerAndNoDependencies
+                )
+                first_scoped_services = first_service_scope.scoped_services
+
+            async with service_provider.create_scope() as second_service_scope:
+                assert isinstance(second_service_scope, ServiceProviderEngineScope)
+                second_service = await second_service_scope.get_required_service(
+                    ServiceWithAsyncContextManagerAndNoDependencies
+                )
+
+                assert second_service_scope is not first_service_scope
+                assert second_service_scope.scoped_services is first_scoped_services
+                # The disposed scope can't reach the services of the scope reusing its state
+                assert first_service_scope.scoped_services == []
+
+        assert first_service is not second_service
+        assert first_service.is_disposed
+        assert second_service.is_disposed
+
+    async def test_fail_when_getting_service_from_disposed_pooled_scope(
+        self,
+    ) -> None:
+        services = ServiceCollection()
+        services.add_scoped(ServiceWithAsyncContextManagerAndNoDependencies)
+
+        async with services.build_service_provider(
+            scope_pool_size=1
+        ) as service_provider:
+            async with service_provider.create_scope() as service_scope:
+                pass
+
+            async with service_provider.create_scope():
+                with pytest.raises(ObjectDisposedError):
+                    await service_scope.get_required_service(
+                        ServiceWithAsyncContextManagerAndNoDependencies
+                    )
+
+    async def test_store_scoped_services_in_their_scope_slots(self) -> None:
+        services = ServiceCollection()
+        services.add_scoped(ServiceWithAsyncContextManagerAndNoDependencies)
+        services.add_scoped(ServiceWithSyncContextManagerAndNoDependencies)
+
+        async with (
+            services.build_service_provider() as service_provider,
+            service_provider.create_scope() as service_scope,
+        ):
+            assert isinstance(service_scope, ServiceProviderEngineScope)
+            assert len(service_scope.scoped_services) == 2  # noqa: PLR2004
+
+            sync_service = await service_scope.get_required_service(
+                ServiceWithSyncContextManagerAndNoDependencies
+            )
+
+            assert sync_service in service_scope.scoped_services
+            assert service_scope.resolved_services == {}
+
+    async def test_get_services_batch(self) -> None:
+        services = ServiceCollection()
+        services.add_singleton(Engine)
+        services.add_scoped(Session)
+        services.add_keyed_transient("key", HttpClient)
+
+        async with (
+            services.build_service_provider() as service_provider,
+            service_provider.create_scope() as service_scope,
+        ):
+            session, http_client, database = await service_scope.get_services_batch(
+                [Session, ("key", HttpClient), Database]
+            )
+
+            assert session is await service_scope.get_required_service(Session)
+            assert isinstance(http_client, HttpClient)
+            assert database is None
+
+    async def test_get_services_batch_concurrently(self) -> None:
+        barrier = asyncio.Barrier(2)
+        created_sessions_count = 0
+
+        async def create_session(engine: Engine) -> Session:
+            nonlocal created_sessions_count
+            created_sessions_count += 1
+            await asyncio.sleep(0)
+            return Session(engine)
+
+        async def create_http_client() -> HttpClient:
+            await barrier.wait()
+            return HttpClient()
+
+        async def create_database(session: Session) -> Database:
+            await barrier.wait()
+            return Database(session)
+
+        services = ServiceCollection()
+        services.add_singleton(Engine)
+        services.add_scoped(Session, create_session)
+        services.add_scoped(HttpClient, create_http_client)
+        services.add_scoped(Database, create_database)
+
+        async with (
+            services.build_service_provider(
+                resolves_concurrently=True
+            ) as service_provider,
+            service_provider.create_scope() as service_scope,
+            asyncio.timeout(1),
+        ):
+            # Each factory waits for the other, so it only finishes if they run concurrently
+            session, http_client, database = await service_scope.get_services_batch(
+                [Session, HttpClient, Database]
+            )
+
+        assert isinstance(http_client, HttpClient)
+        assert isinstance(database, Database)
+        assert database.session is session
+        assert created_sessions_count == 1
+
+    async def test_get_services_batch_concurrently_with_factory_resolving_services(
+        self,
+    ) -> None:
+        barrier = asyncio.Barrier(2)
+
+        async def create_http_client() -> HttpClient:
+            await barrier.wait()
+            return HttpClient()
+
+        async def create_database(service_provider: BaseServiceProvider) -> Database:
+            session, _ = await service_provider.get_services_batch([Session, Engine])
+            await barrier.wait()
+            return Database(cast("Session", session))
+
+        services = ServiceCollection()
+        services.add_singleton(Engine)
+        services.add_scoped(Session)
+        services.add_scoped(HttpClient, create_http_client)
+        services.add_scoped(Database, create_database)
+
+        async with (
+            services.build_service_provider(
+                resolves_concurrently=True
+            ) as service_provider,
+            service_provider.create_scope() as service_scope,
+            asyncio.timeout(1),
+        ):
+            # The factory of the database resolves the session while the batch holds the lock of the scope
+            http_client, database = await service_scope.get_services_batch(
+                [HttpClient, Database]
+            )
+            session = await service_scope.get_required_service(Session)
+
+        assert isinstance(http_client, HttpClient)
+        assert isinstance(database, Database)
+        assert database.session is session
+
+    async def test_fail_when_getting_services_batch_from_disposed_scope(self) -> None:
+        services = ServiceCollection()
+        services.add_scoped(Engine)
+
+        async with services.build_service_provider() as service_provider:
+            service_scope = service_provider.create_scope()
+
+            async with service_scope:
+                pass
+
+            with pytest.raises(ObjectDisposedError):
+                await service_scope.get_services_batch([Engine])
+
+    async def test_fail_when_getting_services_batch_with_any_key(self) -> None:
+        services = ServiceCollection()
+        services.add_keyed_scoped(KeyedService.ANY_KEY, Engine)
+
+        async with (
+            services.build_service_provider() as service_provider,
+            service_provider.create_scope() as service_scope,
+        ):
+            with pytest.raises(KeyedServiceAnyKeyUsedToResolveServiceError):
+                await service_scope.get_services_batch([(KeyedService.ANY_KEY, Engine)])